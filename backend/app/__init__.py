@@ -16,20 +16,37 @@ CORS(app)
 # app.register_blueprint(index.index_bp)
 
 # Importar rutas
-from app.routes import nacionalidades, index, provincias, doctipos, especialidades, intervenciones, stafftipos, staffrolescirugia, tiposanestesia, diagnosticos, localidades, staffs, pacientes
+from app.routes import nacionalidades, index, provincias, doctipos, especialidades, intervenciones, stafftipos, staffrolescirugia, tiposanestesia, diagnosticos, localidades, staffs, pacientes, unidades, metricas
 
 #######################
 def init_app():
-    # configuracion de la app
-    app.debug = True
-
-    # Configuración SQLALchemy desde config.py
+    # Configuración de la app y de SQLALchemy desde config.py (el modo debug sale de REQUIEM_DEBUG)
     app.config.from_object('app.configs.config.Config')
-    
+
+    # Serialización JSON de las respuestas: orjson si está instalado, si no el json estándar
+    from app.utils.json_rapido import ProveedorJSON
+    app.json = ProveedorJSON(app)
+
+    # Compresión gzip/brotli de las respuestas grandes (ver COMPRESS_* en config.py)
+    from app.utils.compresion import registrar_compresion
+    registrar_compresion(app)
+
     # Inicializar la base de datos
     from app.configs.database import init_db
     init_db(app)
 
+    # Cantidad de consultas y tiempo en la base de datos por solicitud (y detector de N+1)
+    from app.utils.consultas import registrar_instrumentacion
+    registrar_instrumentacion(app)
+
+    # Perfilado por solicitud (header o muestreo, ver PROFILE_* en config.py)
+    from app.utils.perfilado import registrar_perfilado
+    registrar_perfilado(app)
+
+    # Registrar comandos de mantenimiento de la CLI de Flask
+    from app.cli import registrar_comandos
+    registrar_comandos(app)
+
     # Registrar rutas Blueprint
     app.register_blueprint(pacientes.pacientes_bp)
     app.register_blueprint(staffs.staffs_bp)
@@ -43,6 +60,8 @@ def init_app():
     app.register_blueprint(doctipos.doctipos_bp)
     app.register_blueprint(provincias.provincias_bp)
     app.register_blueprint(nacionalidades.nacionalidades_bp)
+    app.register_blueprint(unidades.unidades_bp)
+    app.register_blueprint(metricas.metricas_bp)
     app.register_blueprint(index.index_bp)
     
     return app
\ No newline at end of file
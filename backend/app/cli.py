@@ -0,0 +1,148 @@
+import os
+import re
+import time
+import click
+from urllib.parse import quote
+from app.configs.database import SessionLocal, engine
+
+def registrar_comandos(app):
+    """
+    Registra los comandos de mantenimiento en la CLI de Flask
+    (`flask --app run <comando>`).
+    """
+
+    @app.cli.command('reindexar-busqueda')
+    def reindexar_busqueda():
+        """Reconstruye el índice de búsqueda de pacientes y staff."""
+        from app.models.paciente import Paciente
+        from app.models.staff import Staff
+        from app.utils.busqueda import reindexar
+        session = SessionLocal()
+        try:
+            # Reindexar cada entidad con sus campos de búsqueda
+            total = reindexar(session, Paciente, 'apellidos', 'nombre')
+            click.echo('Pacientes indexados: {}'.format(total))
+            total = reindexar(session, Staff, 'apellidos', 'nombres')
+            click.echo('Staff indexado: {}'.format(total))
+        finally:
+            session.close()
+
+    @app.cli.command('migrar')
+    @click.option('--hasta', type=int, default=None, help='Última versión a aplicar.')
+    @click.option('--estado', is_flag=True, help='Mostrar la versión actual y las pendientes sin migrar.')
+    def migrar(hasta, estado):
+        """Aplica las migraciones pendientes del esquema."""
+        from app.utils.migraciones import listar_migraciones, version_actual, migrar as aplicar_migraciones
+        if estado:
+            actual = version_actual(engine)
+            click.echo('Versión del esquema: {}'.format(actual))
+            for migracion in listar_migraciones():
+                if migracion.version > actual:
+                    click.echo('  pendiente {}: {}'.format(migracion.version, migracion.descripcion))
+            return
+        inicio = time.monotonic()
+        aplicadas = aplicar_migraciones(engine, hasta=hasta, informar=click.echo)
+        click.echo('Migraciones aplicadas: {} ({:.1f} s)'.format(len(aplicadas), time.monotonic() - inicio))
+
+    @app.cli.command('explicar-rutas')
+    @click.option('--id', 'identificador', type=int, default=1, help='Valor de los parámetros enteros de las rutas.')
+    @click.option('--texto', default='ga', help='Valor de los parámetros de texto (búsquedas por nombre).')
+    @click.option('--filtro', default=None, help='Solo las rutas que contengan este texto.')
+    @click.option('--escrituras', is_flag=True,
+                  help='Incluir las rutas POST, PUT y DELETE, ejecutadas en una transacción que se descarta.')
+    def explicar_rutas(identificador, texto, filtro, escrituras):
+        """
+        Muestra el plan de ejecución de las consultas de cada ruta GET y marca las lecturas completas.
+
+        Con --escrituras también se ejecutan las rutas POST, PUT y DELETE (altas,
+        modificaciones, bajas, importación y consultas por lote) con datos de
+        muestra tomados del registro --id, dentro de una transacción que se
+        descarta: la base no cambia. Sus sentencias se explican antes de descartarla.
+        """
+        from app.configs.database import Base
+        from app.utils.planes import (capturar_sentencias, explicar, es_explicable, filtra,
+                                      transaccion_descartada, solicitud_de_muestra)
+        cliente = app.test_client()
+        marcadas = 0
+
+        def informar(conexion, sentencias):
+            # Plan de cada sentencia; devuelve los pasos marcados
+            problemas = 0
+            for sentencia, parametros in sentencias:
+                if not es_explicable(sentencia):
+                    continue
+                click.echo('    ' + ' '.join(sentencia.split())[:160])
+                for paso in explicar(conexion, sentencia, parametros):
+                    # Lectura completa en una sentencia que filtra: falta un índice
+                    problema = paso['recorrido'] and filtra(sentencia)
+                    problemas += problema
+                    click.echo('      {} {}'.format('!! LECTURA COMPLETA' if problema else '  ', paso['detalle']))
+            return problemas
+
+        reglas = [regla for regla in sorted(app.url_map.iter_rules(), key=lambda regla: regla.rule)
+                  if regla.endpoint != 'static' and not (filtro and filtro not in regla.rule)]
+        # Primero las lecturas: las escrituras descartadas pueden dejar cachés en memoria con datos que no existen
+        metodos = ['GET'] + (['POST', 'PUT', 'DELETE'] if escrituras else [])
+        for metodo in metodos:
+            for regla in reglas:
+                if metodo not in regla.methods:
+                    continue
+                # Reemplazar los parámetros de la ruta: <int:x> por el id y el resto por el texto
+                ruta = re.sub(r'<(?:(\w+):)?\w+>', lambda m: str(identificador) if m.group(1) == 'int' else quote(texto), regla.rule)
+                if metodo == 'GET':
+                    with capturar_sentencias() as sentencias:
+                        respuesta = cliente.get(ruta)
+                    click.echo('GET {} -> {} ({}, {} consultas)'.format(ruta, respuesta.status_code, regla.endpoint, len(sentencias)))
+                    with engine.connect() as conexion:
+                        marcadas += informar(conexion, sentencias)
+                    continue
+                with transaccion_descartada(engine, SessionLocal) as conexion:
+                    argumentos = solicitud_de_muestra(conexion, Base.metadata.tables, regla, ruta, identificador)
+                    with capturar_sentencias() as sentencias:
+                        respuesta = cliente.open(ruta, method=metodo, **argumentos)
+                    click.echo('{} {} -> {} ({}, {} consultas, descartada)'.format(
+                        metodo, ruta, respuesta.status_code, regla.endpoint, len(sentencias)))
+                    marcadas += informar(conexion, sentencias)
+        if marcadas:
+            raise click.ClickException('{} pasos leen una tabla completa para filtrar filas'.format(marcadas))
+        click.echo('Sin lecturas completas en consultas con filtro')
+
+    @app.cli.command('generar-datos')
+    @click.option('--pacientes', type=int, default=100000, help='Cantidad de pacientes.')
+    @click.option('--staff', type=int, default=2000, help='Cantidad de integrantes del staff.')
+    @click.option('--localidades', type=int, default=2000, help='Cantidad de localidades.')
+    @click.option('--diagnosticos', type=int, default=500, help='Cantidad de diagnósticos.')
+    @click.option('--semilla', type=int, default=1, help='Semilla: los mismos valores generan los mismos datos.')
+    @click.option('--lote', type=int, default=5000, help='Filas por INSERT multi-fila.')
+    @click.option('--archivos', type=click.Path(file_okay=False), default=None,
+                  help='Escribir TSV y cargar.sql (LOAD DATA) en este directorio en lugar de insertar.')
+    def generar_datos(pacientes, staff, localidades, diagnosticos, semilla, lote, archivos):
+        """Genera un conjunto de datos sintético y determinístico a escala de producción."""
+        from app.utils.generador import generar, tablas_vacias, DestinoBase, DestinoArchivos
+        if archivos:
+            destino = DestinoArchivos(archivos)
+        else:
+            # Los IDs se generan desde 1: la base debe estar vacía
+            session = SessionLocal()
+            try:
+                if not tablas_vacias(session):
+                    raise click.ClickException('Las tablas no están vacías; usar una base nueva o --archivos')
+            finally:
+                session.close()
+            destino = DestinoBase(engine)
+
+        def progreso(tabla, filas):
+            if filas % 100000 == 0:
+                click.echo('  {}: {} filas'.format(tabla, filas))
+
+        inicio = time.monotonic()
+        volumenes = {'pacientes': pacientes, 'staff': staff, 'localidades': localidades, 'diagnosticos': diagnosticos}
+        resumen = generar(destino, volumenes, semilla, lote, progreso)
+        for tabla, filas in resumen['filas'].items():
+            click.echo('{}: {}'.format(tabla, filas))
+        for tabla, colisiones in resumen['colisiones'].items():
+            click.echo('Nombres repetidos resueltos en {}: {}'.format(tabla, colisiones))
+        click.echo('Tiempo: {:.1f} s'.format(time.monotonic() - inicio))
+        if archivos:
+            click.echo('Cargar en MySQL con: mysql --local-infile=1 -u <usuario> -p <base> < {}'.format(
+                os.path.join(os.path.abspath(archivos), 'cargar.sql')))
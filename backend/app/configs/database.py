@@ -2,15 +2,38 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from app.configs.config import Config
+from app.utils.pool import opciones_pool
+from app.utils.replicas import SesionEnrutada
 
-# Crear motor de base de datos
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
+# Crear motor de base de datos con el pool configurado (ver Config.DB_POOL_*)
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **opciones_pool(Config, Config.SQLALCHEMY_DATABASE_URI))
+
+# Crear motores de las réplicas de lectura (opcional, ver app.utils.replicas)
+replicas = [create_engine(uri, **opciones_pool(Config, uri)) for uri in Config.SQLALCHEMY_REPLICA_URIS]
 
 # Crear una base declarativa
 Base = declarative_base()
 
-# Crear una sesión configurada
-SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+# Crear una sesión configurada; las lecturas de las vistas get_* van a las réplicas
+SessionLocal = scoped_session(sessionmaker(class_=SesionEnrutada, autocommit=False, autoflush=False, bind=engine, replicas=replicas))
+
+def reiniciar_pools(cerrar=False):
+    """
+    Descarta las conexiones del pool del motor y de las réplicas.
+
+    El motor se crea al importar este módulo: con un servidor pre-fork que
+    precarga la app (gunicorn con preload_app) los workers heredan del proceso
+    maestro el pool y sus sockets abiertos, y dos procesos usando el mismo
+    socket de MySQL mezclan sus respuestas. Después del fork cada worker llama
+    a esta función con cerrar=False: arma un pool vacío sin cerrar los sockets,
+    que siguen perteneciendo al maestro, y abre sus propias conexiones a demanda.
+
+    Args:
+        cerrar (bool): Cerrar además las conexiones libres (en el proceso dueño del pool).
+    """
+    SessionLocal.remove()
+    for motor in [engine] + replicas:
+        motor.dispose(close=cerrar)
 
 def init_db(app):
     # Importar modelos aquí para asegurarse de que estén registrados en la base de datos
@@ -27,4 +50,12 @@ def init_db(app):
     from app.models.staff import Staff
     from app.models.staffrolcirugia import StaffRolCirugia
     from app.models.paciente import Paciente
-    Base.metadata.create_all(bind=engine)
+    from app.models.tokenbusqueda import TokenBusqueda
+
+    # Verificar la versión del esquema (una consulta) y aplicar las migraciones pendientes
+    from app.utils.migraciones import preparar_esquema
+    preparar_esquema(app, engine)
+
+    # Enrutar las lecturas a las réplicas y liberar la sesión al final de cada solicitud
+    from app.utils.replicas import registrar_replicas
+    registrar_replicas(app, SessionLocal, replicas)
@@ -0,0 +1,55 @@
+"""Esquema inicial: tablas de catálogos, staff y pacientes.
+
+Las tablas se definen acá tal como estaban antes de las migraciones, sin
+usar los modelos: los cambios posteriores de los modelos (índices,
+restricciones, columnas) van en su propia migración y no se filtran en esta.
+En una base creada antes de las migraciones (con create_all) las tablas ya
+existen y no se modifican: checkfirst solo crea las que faltan.
+"""
+from sqlalchemy import MetaData, Table, Column, Integer, String, ForeignKey
+
+metadata = MetaData()
+
+def _catalogo(nombre, columna_id, columna_nombre, largo=50):
+    # Tabla de catálogo: clave primaria y nombre único
+    return Table(nombre, metadata,
+                 Column(columna_id, Integer, primary_key=True, autoincrement=True),
+                 Column(columna_nombre, String(largo), unique=True, nullable=False))
+
+_catalogo('nacionalidades', 'id_nacionalidad', 'nacionalidad')
+_catalogo('provincias', 'id_provincia', 'provincia')
+_catalogo('doc_tipos', 'id_doc_tipo', 'doc_tipo')
+_catalogo('unidades', 'id_unidad', 'unidad')
+_catalogo('staff_tipos', 'id_staff_tipo', 'staff_tipo')
+_catalogo('especialidades', 'id_especialidad', 'especialidad')
+_catalogo('intervenciones', 'id_intervencion', 'intervencion', largo=60)
+_catalogo('tipos_anestesia', 'id_tipo_anestesia', 'tipo_anestesia')
+_catalogo('staff_roles_cirugia', 'id_staff_rol_cirugia', 'rol_cirugia')
+
+Table('localidades', metadata,
+      Column('id_localidad', Integer, primary_key=True, autoincrement=True),
+      Column('localidad', String(60), unique=True, nullable=False),
+      Column('id_provincia', Integer, ForeignKey('provincias.id_provincia', ondelete='CASCADE'), nullable=False))
+
+Table('diagnosticos', metadata,
+      Column('id_diagnostico', Integer, primary_key=True, autoincrement=True),
+      Column('diagnostico', String(60), unique=True, nullable=False),
+      Column('id_especialidad', Integer, ForeignKey('especialidades.id_especialidad', ondelete='CASCADE'), nullable=False))
+
+Table('staff', metadata,
+      Column('id_staff', Integer, primary_key=True, autoincrement=True),
+      Column('apellidos', String(60), unique=True, nullable=False),
+      Column('nombres', String(60), unique=True, nullable=False),
+      Column('id_staff_tipo', Integer, ForeignKey('staff_tipos.id_staff_tipo', ondelete='CASCADE'), nullable=False))
+
+Table('pacientes', metadata,
+      Column('id_paciente', Integer, primary_key=True, autoincrement=True),
+      Column('id_doc_tipo', Integer, ForeignKey('doc_tipos.id_doc_tipo', ondelete='CASCADE'), nullable=False),
+      Column('doc_numero', Integer, nullable=False),
+      Column('apellidos', String(50), unique=True, nullable=False),
+      Column('nombre', String(50), unique=True, nullable=False),
+      Column('id_localidad', Integer, ForeignKey('localidades.id_localidad', ondelete='CASCADE'), nullable=False),
+      Column('id_nacionalidad', Integer, ForeignKey('nacionalidades.id_nacionalidad', ondelete='CASCADE'), nullable=False))
+
+def aplicar(conexion):
+    metadata.create_all(bind=conexion, checkfirst=True)
@@ -0,0 +1,60 @@
+"""Índice de búsqueda por nombre (tokens_busqueda) de pacientes y staff.
+
+Crea la tabla y sus índices si faltan y, si el índice está vacío y ya hay
+pacientes o staff cargados, lo construye a partir de los datos existentes.
+Las tablas se definen acá tal como estaban en esta versión (no con los
+modelos), con solo las columnas que usa la migración.
+"""
+from sqlalchemy import MetaData, Table, Column, Integer, String, Index, select, func
+from app.utils.busqueda import tokenizar
+from app.utils.migraciones import existe_tabla, crear_indice
+
+metadata = MetaData()
+tabla = Table('tokens_busqueda', metadata,
+              Column('id_token', Integer, primary_key=True, autoincrement=True),
+              Column('entidad', String(30), nullable=False),
+              Column('id_entidad', Integer, nullable=False),
+              Column('token', String(60), nullable=False),
+              Index('ix_tokens_busqueda_entidad_token', 'entidad', 'token'),
+              Index('ix_tokens_busqueda_entidad_id', 'entidad', 'id_entidad'))
+pacientes = Table('pacientes', metadata,
+                  Column('id_paciente', Integer, primary_key=True),
+                  Column('apellidos', String(50)),
+                  Column('nombre', String(50)))
+staff = Table('staff', metadata,
+              Column('id_staff', Integer, primary_key=True),
+              Column('apellidos', String(60)),
+              Column('nombres', String(60)))
+
+# Filas leídas e insertadas por lote al construir el índice
+TAMANO_LOTE = 1000
+
+def _indexar(conexion, entidad, columna_pk, *columnas):
+    # Recorre la tabla por keyset e inserta los tokens de cada registro
+    ultimo = None
+    while True:
+        query = select(columna_pk, *columnas).order_by(columna_pk).limit(TAMANO_LOTE)
+        if ultimo is not None:
+            query = query.where(columna_pk > ultimo)
+        registros = conexion.execute(query).all()
+        if not registros:
+            break
+        filas = []
+        for registro in registros:
+            filas.extend({'entidad': entidad, 'id_entidad': registro[0], 'token': token}
+                         for token in tokenizar(*registro[1:]))
+        if filas:
+            conexion.execute(tabla.insert(), filas)
+        ultimo = registros[-1][0]
+
+def aplicar(conexion):
+    if not existe_tabla(conexion, tabla.name):
+        tabla.create(bind=conexion)
+    else:
+        # Tabla de una versión anterior: agregar los índices que falten sin bloquearla
+        for indice in tabla.indexes:
+            crear_indice(conexion, tabla.name, indice.name, [columna.name for columna in indice.columns], indice.unique)
+    if conexion.execute(select(func.count()).select_from(tabla)).scalar():
+        return
+    _indexar(conexion, 'pacientes', pacientes.c.id_paciente, pacientes.c.apellidos, pacientes.c.nombre)
+    _indexar(conexion, 'staff', staff.c.id_staff, staff.c.apellidos, staff.c.nombres)
@@ -0,0 +1,27 @@
+"""Documento único de pacientes: índice UNIQUE uq_pacientes_doc (id_doc_tipo, doc_numero).
+
+Las bases creadas antes de la restricción no la tienen. El índice se crea en
+línea (ver app.utils.migraciones.crear_indice); si hay documentos repetidos
+la migración se detiene antes de tocar la tabla. La tabla se define acá
+tal como estaba en esta versión (no con el modelo).
+"""
+from sqlalchemy import MetaData, Table, Column, Integer, select, func
+from app.utils.migraciones import existe_indice, crear_indice
+
+pacientes = Table('pacientes', MetaData(),
+                  Column('id_paciente', Integer, primary_key=True),
+                  Column('id_doc_tipo', Integer),
+                  Column('doc_numero', Integer))
+
+def aplicar(conexion):
+    if existe_indice(conexion, 'pacientes', 'uq_pacientes_doc'):
+        return
+    # Documentos que aparecen más de una vez
+    documento = (pacientes.c.id_doc_tipo, pacientes.c.doc_numero)
+    repetidos = (select(*documento)
+                 .group_by(*documento)
+                 .having(func.count() > 1).subquery())
+    cantidad = conexion.execute(select(func.count()).select_from(repetidos)).scalar()
+    if cantidad:
+        raise RuntimeError('Hay {} documentos repetidos en pacientes: corregirlos antes de migrar'.format(cantidad))
+    crear_indice(conexion, 'pacientes', 'uq_pacientes_doc', ['id_doc_tipo', 'doc_numero'], unico=True)
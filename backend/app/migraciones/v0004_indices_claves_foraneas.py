@@ -0,0 +1,19 @@
+"""Índices de las claves foráneas más consultadas (localidades, diagnósticos, staff y pacientes).
+
+InnoDB ya indexa cada clave foránea con un índice implícito; con nombres
+declarados en los modelos el esquema es el mismo en MySQL y en otras bases
+y MySQL descarta el índice implícito al crear el nuestro. Se crean en línea.
+"""
+from app.utils.migraciones import crear_indice
+
+INDICES = [
+    ('localidades', 'ix_localidades_id_provincia', ['id_provincia']),
+    ('diagnosticos', 'ix_diagnosticos_id_especialidad', ['id_especialidad']),
+    ('staff', 'ix_staff_id_staff_tipo', ['id_staff_tipo']),
+    ('pacientes', 'ix_pacientes_id_localidad', ['id_localidad']),
+    ('pacientes', 'ix_pacientes_id_nacionalidad', ['id_nacionalidad']),
+]
+
+def aplicar(conexion):
+    for tabla, nombre, columnas in INDICES:
+        crear_indice(conexion, tabla, nombre, columnas)
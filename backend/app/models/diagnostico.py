@@ -1,5 +1,5 @@
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from app.configs.database import Base
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,11 @@ class Diagnostico(Base):
     diagnostico = Column(String(60),unique=True, nullable=False)
     id_especialidad = Column(Integer, ForeignKey('especialidades.id_especialidad', ondelete='CASCADE'), nullable=False)
     
+    __table_args__ = (
+        # Diagnósticos de una especialidad (y borrado en cascada al eliminarla)
+        Index('ix_diagnosticos_id_especialidad', 'id_especialidad'),
+    )
+
     especialidad = relationship('Especialidad', backref='diagnosticos')
     
     def __init__(self, diagnostico, id_especialidad):
@@ -17,12 +22,6 @@ class Diagnostico(Base):
     
     def __repr__(self):
         return '<diagnostico {}>'.format(self.diagnostico)
-    
-    def serializable (self):
-        return{
-            'id_diagnostico' : self.id_diagnostico,
-            'diagnostico' : self.diagnostico
-        }
 
 # Esquema de validación para Diagnostico utilizando Marshmallow
 class DiagnosticoSchema(Schema):
@@ -12,12 +12,6 @@ class DocTipo(Base):
     
     def __repr__(self):
         return '<doc_tipo {}>'.format(self.doc_tipo)
-    
-    def serializable(self):
-        return{
-            'id_doc_tipo': self.id_doc_tipo,
-            'doc_tipo' : self.doc_tipo
-        }
 
 # Esquema de validación para DocTipo utilizando Marshmallow
 class DocTipoSchema(Schema):
@@ -12,12 +12,6 @@ class Especialidad(Base):
     
     def __repr__(self):
         return '<especialidad {}>'.format(self.especialidad)
-    
-    def serializable(self):
-        return{
-            'id_especialidad' : self.id_especialidad,
-            'especialidad' : self.especialidad
-        }
 
 # Esquema de validación para Especialidad utilizando Marshmallow
 class EspecialidadSchema(Schema):
@@ -12,12 +12,6 @@ class Intervencion(Base):
     
     def __repr__(self):
         return '<intervencion {}>'.format(self.intervencion)
-    
-    def serializable(self):
-        return{
-            'id_intervencion' : self.id_intervencion,
-            'intervencion' : self.intervencion
-        }
 
 # Esquema de validación para Intervencion utilizando Marshmallow
 class IntervencionSchema(Schema):
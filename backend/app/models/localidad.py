@@ -1,5 +1,5 @@
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from app.configs.database import Base
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,11 @@ class Localidad(Base):
     localidad = Column(String(60),unique=True, nullable=False)
     id_provincia = Column(Integer, ForeignKey('provincias.id_provincia',ondelete='CASCADE'), nullable=False)
     
+    __table_args__ = (
+        # Localidades de una provincia (y borrado en cascada al eliminarla)
+        Index('ix_localidades_id_provincia', 'id_provincia'),
+    )
+
     provincia = relationship('Provincia', backref='localidades')
     
     def __init__(self, localidad, id_provincia):
@@ -17,12 +22,6 @@ class Localidad(Base):
         
     def __repr__(self):
         return '<localidad {}>'.format(self.localidad)
-    
-    def serializable(self):
-        return{
-            'id_localidad' : self.id_localidad,
-            'localidad' : self.localidad
-        }
 
 # Esquema de validación para Localidad utilizando Marshmallow
 class LocalidadSchema(Schema):
@@ -14,15 +14,6 @@ class Nacionalidad(Base):
     def __repr__(self):
         return '<Nacionalidad {}>'.format(self.nacionalidad)
 
-    def serialize(self):
-        """
-        Método para serializar los atributos de la instancia.
-        """
-        return {
-            'id_nacionalidad': self.id_nacionalidad,
-            'nacionalidad': self.nacionalidad
-        }
-    
 # Esquema de validación para Nacionalidad utilizando Marshmallow
 class NacionalidadSchema(Schema):
     """
@@ -1,7 +1,8 @@
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Index
 from app.configs.database import Base
 from sqlalchemy.orm import relationship
+from app.utils.busqueda import indexar_busqueda
 
 class Paciente(Base):
     __tablename__ = 'pacientes'
@@ -13,6 +14,16 @@ class Paciente(Base):
     id_localidad = Column(Integer, ForeignKey('localidades.id_localidad', ondelete='CASCADE'), nullable=False)
     id_nacionalidad = Column(Integer, ForeignKey('nacionalidades.id_nacionalidad', ondelete='CASCADE'), nullable=False)
     
+    __table_args__ = (
+        # Un mismo documento (tipo + número) no puede repetirse. Es también el índice de
+        # búsqueda por documento (id_doc_tipo = ? AND doc_numero = ?) y, por su primera
+        # columna, el de los pacientes de un tipo de documento
+        UniqueConstraint('id_doc_tipo', 'doc_numero', name='uq_pacientes_doc'),
+        # Pacientes de una localidad o nacionalidad (y borrado en cascada al eliminarlas)
+        Index('ix_pacientes_id_localidad', 'id_localidad'),
+        Index('ix_pacientes_id_nacionalidad', 'id_nacionalidad'),
+    )
+
     doc_tipo = relationship('DocTipo', backref='pacientes')
     localidad = relationship('Localidad', backref='pacientes')
     nacionalidad = relationship('Nacionalidad', backref='pacientes')
@@ -27,14 +38,9 @@ class Paciente(Base):
 
     def __repr__(self):
         return'<doc_numero {}>'.format(self.doc_numero), '<apellidos {}>'.format(self.apellidos), '<nombre {}>'.format(self.nombre)
-    
-    def serializable(self):
-        return{
-            'id_paciente' : self.id_paciente,
-            'doc_numero' : self.doc_numero,
-            'apellidos' : self.apellidos,
-            'nombre' : self.nombre
-        }
+
+# Mantener el índice de búsqueda por apellidos y nombre
+indexar_busqueda(Paciente, 'apellidos', 'nombre')
 
 # Esquema de validación para Paciente utilizando Marshmallow
 class PacienteSchema(Schema):
@@ -43,7 +49,7 @@ class PacienteSchema(Schema):
     """
     id_paciente = fields.Int(dump_only=True)
     id_doc_tipo = fields.Int(required= True)
-    doc_numero = fields.Int(dump_only=True)
+    doc_numero = fields.Int(required=True)
     apellidos = fields.Str(required=True, validate=validate.Length(min=1, max=50))
     nombre = fields.Str(required=True, validate=validate.Length(min=1, max=50))
     id_localidad = fields.Int(required= True)
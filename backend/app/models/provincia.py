@@ -12,12 +12,6 @@ class Provincia(Base):
     
     def __repr__(self):
         return '<provincia {}>'.format(self.provincia)
-    
-    def serializable(self):
-        return{
-            'id_provincia': self.id_provincia,
-            'provincia': self.provincia
-        }
 
 # Esquema de validación para Provincia utilizando Marshmallow
 class ProvinciaSchema(Schema):
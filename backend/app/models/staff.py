@@ -1,7 +1,8 @@
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from app.configs.database import Base
 from sqlalchemy.orm import relationship
+from app.utils.busqueda import indexar_busqueda
 
 class Staff(Base):
     __tablename__ = 'staff'
@@ -10,6 +11,11 @@ class Staff(Base):
     nombres = Column(String(60), unique= True, nullable=False)
     id_staff_tipo = Column(Integer, ForeignKey('staff_tipos.id_staff_tipo', ondelete='CASCADE'), nullable=False)
     
+    __table_args__ = (
+        # Staff de un tipo (y borrado en cascada al eliminarlo)
+        Index('ix_staff_id_staff_tipo', 'id_staff_tipo'),
+    )
+
     staff_tipo = relationship('StaffTipo', backref='staff')
     
     def __init__(self, apellidos, nombres, id_staff_tipo):
@@ -19,13 +25,9 @@ class Staff(Base):
     
     def __repr__(self):
         return '<apellidos {}>'.format(self.apellidos), '<nombres {}>'.format(self.apellidos)
-    
-    def serializable(self):
-        return{
-            'id_staff' : self.id_staff,
-            'apellidos' : self.apellidos,
-            'nombres' : self.nombres
-        }
+
+# Mantener el índice de búsqueda por apellidos y nombres
+indexar_busqueda(Staff, 'apellidos', 'nombres')
 
 # Esquema de validación para Staff utilizando Marshmallow
 class StaffSchema(Schema):
@@ -12,14 +12,7 @@ class StaffRolCirugia(Base):
     
     def __repr__(self):
         return'<rol_cirugia {}>'.format(self.rol_cirugia)
-    
-    def serializable(self):
-        return{
-            'id_staff_rol_cirugia' : self.id_staff_rol_cirugia,
-            'rol_cirugia' : self.rol_cirugia
-            
-        }
-    
+
 # Esquema de validación para StaffRolCirugia utilizando Marshmallow
 class StaffRolCirugiaSchema(Schema):
     """
@@ -12,12 +12,6 @@ class StaffTipo(Base):
     
     def __repr__(self):
         return '<staff_tipo {}>'.format(self.staff_tipo)
-    
-    def serializable(self):
-        return{
-            'id_staff_tipo': self.id_staff_tipo,
-            'staff_tipo' : self.staff_tipo
-        }
 
 # Esquema de validación para StaffTipo utilizando Marshmallow
 class StaffTipoSchema(Schema):
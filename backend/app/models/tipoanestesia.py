@@ -12,12 +12,6 @@ class TipoAnestesia(Base):
         
     def __repr__(self):
         return '<tipo_anestesia {}>'.format(self.tipo_anestesia)
-    
-    def serializable(self):
-        return{
-            'id_tipo_anestesia' : self.id_tipo_anestesia,
-            'tipo_anestesia' : self.tipo_anestesia
-        }
 
 # Esquema de validación para TipoAnestesia utilizando Marshmallow
 class TipoAnestesiaSchema(Schema):
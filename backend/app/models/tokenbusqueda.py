@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Index
+from app.configs.database import Base
+
+class TokenBusqueda(Base):
+    """
+    Índice de búsqueda por nombre: una fila por cada palabra normalizada
+    (minúsculas y sin acentos) de los nombres de una entidad.
+    """
+    __tablename__ = 'tokens_busqueda'
+    id_token = Column(Integer, primary_key=True, autoincrement=True)
+    entidad = Column(String(30), nullable=False)
+    id_entidad = Column(Integer, nullable=False)
+    token = Column(String(60), nullable=False)
+
+    __table_args__ = (
+        # Búsqueda por prefijo: WHERE entidad = ? AND token LIKE 'xx%'
+        Index('ix_tokens_busqueda_entidad_token', 'entidad', 'token'),
+        # Mantenimiento: borrar los tokens de una entidad al actualizarla
+        Index('ix_tokens_busqueda_entidad_id', 'entidad', 'id_entidad'),
+    )
+
+    def __init__(self, entidad, id_entidad, token):
+        self.entidad = entidad
+        self.id_entidad = id_entidad
+        self.token = token
+
+    def __repr__(self):
+        return '<token {}>'.format(self.token)
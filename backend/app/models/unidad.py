@@ -12,12 +12,6 @@ class Unidad(Base):
     
     def __repr__(self):
         return '<unidad {}>'.format(self.unidad)
-    
-    def serializable(self):
-        return{
-            'id_unidad' : self.id_unidad,
-            'unidad' : self.unidad
-        }
 
 # Esquema de validación para Unidad utilizando Marshmallow
 class UnidadSchema(Schema):
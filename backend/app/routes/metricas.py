@@ -0,0 +1,24 @@
+from flask import Blueprint, request, jsonify
+from app.configs.database import engine, replicas
+
+metricas_bp = Blueprint('metricas', __name__)
+
+# Ruta para obtener el estado del pool de conexiones del proceso
+@metricas_bp.route('/metricas/pool', methods=['GET'])
+def get_metricas_pool():
+    """
+    Devuelve las conexiones en uso, libres y de overflow del pool, junto con
+    la cantidad de entregas y el tiempo de espera por una conexión.
+    Si hay réplicas de lectura se informa también el pool de cada una.
+    Con ?reset=1 los contadores vuelven a cero después de leerlos.
+    """
+    reiniciar = request.args.get('reset', '').lower() in ('1', 'true', 'si')
+    pool = engine.pool
+    if not hasattr(pool, 'estadisticas'):
+        # Pool sin métricas (ej. configurado externamente)
+        return jsonify({'status': 'error', 'message': 'El pool no registra métricas'}), 501
+    data = pool.estadisticas(reiniciar)
+    if replicas:
+        data['replicas'] = [replica.pool.estadisticas(reiniciar) for replica in replicas
+                            if hasattr(replica.pool, 'estadisticas')]
+    return jsonify({'status': 'success', 'data': data}), 200
@@ -0,0 +1,11 @@
+from app.models.unidad import Unidad, UnidadSchema
+from app.utils.recurso import Recurso
+
+# Recurso CRUD de unidades: listado, por ID, por nombre, alta, modificación y baja
+unidades = Recurso('unidades', Unidad, UnidadSchema,
+                   singular='unidad',
+                   etiqueta='unidad',
+                   femenino=True)
+
+# Blueprint con las rutas del recurso
+unidades_bp = unidades.blueprint
@@ -0,0 +1,183 @@
+import re
+import unicodedata
+from functools import reduce
+from flask import current_app
+from operator import add
+from sqlalchemy import event, inspect, select, delete, func, case, or_, and_
+from app.models.tokenbusqueda import TokenBusqueda
+from app.utils.paginacion import leer_entero
+
+# Tabla del índice de búsqueda
+tokens = TokenBusqueda.__table__
+# Largo máximo de un token (largo de la columna)
+LARGO_TOKEN = TokenBusqueda.token.type.length
+
+def normalizar(texto):
+    """
+    Pasa un texto a minúsculas y le quita los acentos ("Muñoz" -> "munoz").
+
+    Args:
+        texto (str): Texto original.
+
+    Returns:
+        str: Texto normalizado.
+    """
+    descompuesto = unicodedata.normalize('NFKD', texto or '')
+    # Se descartan los signos diacríticos que quedaron separados
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+
+def tokenizar(*textos):
+    """
+    Separa uno o más textos en palabras normalizadas, sin repetir.
+
+    Args:
+        textos (str): Textos a tokenizar.
+
+    Returns:
+        list: Tokens en orden de aparición.
+    """
+    resultado = []
+    for texto in textos:
+        for token in re.findall(r'[a-z0-9]+', normalizar(texto)):
+            token = token[:LARGO_TOKEN]
+            if token not in resultado:
+                resultado.append(token)
+    return resultado
+
+def _filas_tokens(entidad, campos, objeto, id_entidad):
+    # Filas del índice para los campos de texto de un objeto
+    valores = [getattr(objeto, campo) for campo in campos]
+    return [{'entidad': entidad, 'id_entidad': id_entidad, 'token': token} for token in tokenizar(*valores)]
+
+def indexar_busqueda(modelo, *campos):
+    """
+    Mantiene el índice de búsqueda de un modelo en cada INSERT, UPDATE y
+    DELETE hecho a través del ORM.
+
+    Args:
+        modelo (Base): Modelo a indexar.
+        campos (str): Campos de texto que participan de la búsqueda.
+    """
+    entidad = modelo.__tablename__
+    columna_pk = inspect(modelo).primary_key[0].key
+
+    @event.listens_for(modelo, 'after_insert')
+    def al_insertar(mapper, connection, objeto):
+        filas = _filas_tokens(entidad, campos, objeto, getattr(objeto, columna_pk))
+        if filas:
+            connection.execute(tokens.insert(), filas)
+
+    @event.listens_for(modelo, 'after_update')
+    def al_actualizar(mapper, connection, objeto):
+        estado = inspect(objeto)
+        # Solo se reindexa si cambió alguno de los campos de texto
+        if not any(estado.attrs[campo].history.has_changes() for campo in campos):
+            return
+        id_entidad = getattr(objeto, columna_pk)
+        connection.execute(delete(tokens).where(tokens.c.entidad == entidad, tokens.c.id_entidad == id_entidad))
+        filas = _filas_tokens(entidad, campos, objeto, id_entidad)
+        if filas:
+            connection.execute(tokens.insert(), filas)
+
+    @event.listens_for(modelo, 'after_delete')
+    def al_eliminar(mapper, connection, objeto):
+        connection.execute(delete(tokens).where(tokens.c.entidad == entidad,
+                                                tokens.c.id_entidad == getattr(objeto, columna_pk)))
+
+def reindexar(session, modelo, *campos, tamano_lote=1000):
+    """
+    Reconstruye el índice de búsqueda de un modelo a partir de sus datos.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        modelo (Base): Modelo a reindexar.
+        campos (str): Campos de texto que participan de la búsqueda.
+        tamano_lote (int): Filas leídas e insertadas por lote.
+
+    Returns:
+        int: Cantidad de registros indexados.
+    """
+    entidad = modelo.__tablename__
+    columna_pk = inspect(modelo).primary_key[0]
+    columnas = [columna_pk] + [getattr(modelo, campo) for campo in campos]
+    # Descartar el índice anterior de la entidad
+    session.execute(delete(tokens).where(tokens.c.entidad == entidad))
+    total = 0
+    ultimo = None
+    while True:
+        # Recorrer la tabla por keyset para no cargarla entera
+        query = select(*columnas).order_by(columna_pk).limit(tamano_lote)
+        if ultimo is not None:
+            query = query.where(columna_pk > ultimo)
+        registros = session.execute(query).all()
+        if not registros:
+            break
+        filas = []
+        for registro in registros:
+            filas.extend({'entidad': entidad, 'id_entidad': registro[0], 'token': token}
+                         for token in tokenizar(*registro[1:]))
+        if filas:
+            session.execute(tokens.insert(), filas)
+        total += len(registros)
+        ultimo = registros[-1][0]
+    session.commit()
+    return total
+
+def buscar(session, modelo, texto, limite, opciones=()):
+    """
+    Busca registros cuyos nombres contengan palabras que empiecen con cada
+    una de las palabras del texto buscado ("jua per" encuentra "Pérez, Juan").
+
+    La consulta usa el índice (entidad, token) con LIKE por prefijo y ordena
+    los resultados poniendo primero las coincidencias exactas de palabra.
+    Los tokens se cruzan con la tabla de la entidad antes del LIMIT: los que
+    quedaron huérfanos (registros borrados sin pasar por el ORM, ej. ON DELETE
+    CASCADE en la base) no ocupan lugares de la página.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        modelo (Base): Modelo indexado con indexar_busqueda.
+        texto (str): Texto buscado.
+        limite (int): Cantidad máxima de resultados.
+        opciones (list): Opciones para la carga de los registros (ej. load_only).
+
+    Returns:
+        list: Registros encontrados, ordenados por relevancia.
+    """
+    terminos = tokenizar(texto)
+    if not terminos:
+        return []
+    columna_pk = inspect(modelo).primary_key[0]
+    # Por cada término: 2 si alguna palabra coincide exacta, 1 si por prefijo
+    puntajes = [func.max(case((tokens.c.token == termino, 2),
+                              (tokens.c.token.like(termino + '%'), 1),
+                              else_=0))
+                for termino in terminos]
+    puntaje = reduce(add, puntajes).label('puntaje')
+    query = (select(tokens.c.id_entidad, puntaje)
+             .join(modelo.__table__, columna_pk == tokens.c.id_entidad)
+             .where(tokens.c.entidad == modelo.__tablename__,
+                    or_(*[tokens.c.token.like(termino + '%') for termino in terminos]))
+             .group_by(tokens.c.id_entidad)
+             # Todos los términos deben coincidir con alguna palabra
+             .having(and_(*[p > 0 for p in puntajes]))
+             .order_by(puntaje.desc(), tokens.c.id_entidad)
+             .limit(limite))
+    ids = [fila.id_entidad for fila in session.execute(query)]
+    if not ids:
+        return []
+    # Cargar los registros y devolverlos en el orden de relevancia
+    registros = {getattr(r, columna_pk.key): r for r in session.query(modelo).options(*opciones).filter(columna_pk.in_(ids))}
+    return [registros[id] for id in ids if id in registros]
+
+def leer_limite_busqueda():
+    """
+    Lee el parámetro `limit` de una búsqueda, acotado por SEARCH_MAX_LIMIT.
+
+    Returns:
+        int: Cantidad máxima de resultados a devolver.
+    """
+    limit = leer_entero('limit', minimo=1)
+    if limit is None:
+        limit = current_app.config.get('SEARCH_DEFAULT_LIMIT', 20)
+    return min(limit, current_app.config.get('SEARCH_MAX_LIMIT', 100))
@@ -0,0 +1,308 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect, String
+from sqlalchemy.orm import Session
+from app.configs.database import SessionLocal
+from app.utils.versiones import version_tabla
+
+class _CopiaCatalogo:
+    """
+    Una carga de la tabla: registros, índices y ETag. No se modifica después
+    de armarla; una recarga crea otra copia y reemplaza la anterior de una vez.
+    """
+
+    def __init__(self, tabla, filas, por_id, por_nombre, version):
+        self.filas = filas
+        self.por_id = por_id
+        self.por_nombre = por_nombre
+        self.version = version
+        self.cargada = time.monotonic()
+        # El ETag es un resumen del contenido: dos procesos con los mismos datos
+        # dan el mismo ETag y datos distintos nunca comparten uno, sin importar
+        # los contadores de versión de cada proceso
+        contenido = json.dumps(filas, sort_keys=True, separators=(',', ':'), default=str)
+        self.etag = '{}-{}'.format(tabla, hashlib.sha1(contenido.encode('utf-8')).hexdigest()[:20])
+
+class CacheCatalogo:
+    """
+    Copia en memoria de una tabla de referencia pequeña.
+
+    Se carga completa la primera vez que se usa y queda indexada por ID y por
+    nombre. Se vuelve a cargar cuando:
+        - cambia la versión de la tabla (escrituras hechas por las vistas de
+          este proceso, ver app.utils.versiones), o
+        - vence CATALOG_CACHE_TTL, para recoger escrituras de otros procesos.
+
+    Cada lectura toma la copia vigente una sola vez: aunque otro hilo la
+    recargue en el medio, los registros e índices que usa son de la misma carga.
+    """
+
+    def __init__(self, modelo):
+        self.modelo = modelo
+        self.tabla = modelo.__tablename__
+        columnas = inspect(modelo).columns
+        # Clave primaria y columna única de texto (el "nombre" del catálogo)
+        self.columna_pk = inspect(modelo).primary_key[0]
+        self.columna_nombre = next(c for c in columnas if c.unique and isinstance(c.type, String))
+        self.campos = [c.key for c in columnas]
+        self._copia = None
+        self._lock = threading.Lock()
+
+    def _vigente(self, copia):
+        # La copia sirve si existe, la versión no cambió y no venció el TTL
+        ttl = current_app.config.get('CATALOG_CACHE_TTL', 300)
+        return (copia is not None
+                and copia.version == version_tabla(self.tabla)
+                and time.monotonic() - copia.cargada < ttl)
+
+    def _cargar(self):
+        with self._lock:
+            # Otro hilo pudo haberla cargado mientras se esperaba el lock
+            if self._vigente(self._copia):
+                return self._copia
+            # La versión se lee antes de consultar: si hay una escritura
+            # concurrente la copia queda marcada como vieja
+            version = version_tabla(self.tabla)
+            # Sesión propia contra el primario: la carga suele seguir a una
+            # escritura y una réplica atrasada dejaría la copia vieja hasta el TTL
+            session = SessionLocal.session_factory(info={'replica': False})
+            try:
+                objetos = session.query(self.modelo).order_by(self.columna_pk).all()
+                filas = [{campo: getattr(obj, campo) for campo in self.campos} for obj in objetos]
+            finally:
+                session.close()
+            # Índices por ID y por nombre (sin distinguir mayúsculas, como MySQL)
+            por_id = {fila[self.columna_pk.key]: fila for fila in filas}
+            por_nombre = {fila[self.columna_nombre.key].lower(): fila for fila in filas}
+            self._copia = _CopiaCatalogo(self.tabla, filas, por_id, por_nombre, version)
+            return self._copia
+
+    def _actual(self):
+        # Copia vigente (cargándola si hace falta), leída una sola vez
+        copia = self._copia
+        if not self._vigente(copia):
+            copia = self._cargar()
+        return copia
+
+    def filas(self):
+        """
+        Returns:
+            list: Registros de la tabla como diccionarios, ordenados por ID.
+        """
+        return self._actual().filas
+
+    def etag(self):
+        """
+        Returns:
+            str: ETag de la copia vigente (resumen de sus registros, sin comillas).
+        """
+        return self._actual().etag
+
+    def por_id(self, id):
+        """
+        Args:
+            id (int): Clave primaria buscada.
+
+        Returns:
+            dict: Registro encontrado o None.
+        """
+        return self._actual().por_id.get(id)
+
+    def por_nombre(self, nombre):
+        """
+        Args:
+            nombre (str): Valor de la columna única de texto.
+
+        Returns:
+            dict: Registro encontrado o None.
+        """
+        return self._actual().por_nombre.get(nombre.lower())
+
+    def existe(self, id):
+        """
+        Args:
+            id (int): Clave primaria buscada.
+
+        Returns:
+            bool: True si existe un registro con ese ID.
+        """
+        return self.por_id(id) is not None
+
+# Una caché por modelo, creadas a demanda
+_caches = {}
+_caches_lock = threading.Lock()
+
+# Modelos declarados como catálogo (tablas chicas y fijas, ver Recurso(catalogo=True))
+_catalogos = set()
+
+def registrar_catalogo(modelo):
+    """
+    Declara un modelo como catálogo: tabla chica y casi fija que se puede
+    tener entera en memoria. Solo estos modelos se leen desde CacheCatalogo;
+    las tablas de datos (ej. localidades) se consultan en la base.
+
+    Args:
+        modelo (Base): Modelo del catálogo.
+    """
+    _catalogos.add(modelo)
+
+def es_catalogo(modelo):
+    """
+    Args:
+        modelo (Base): Modelo de SQLAlchemy.
+
+    Returns:
+        bool: True si el modelo se declaró como catálogo.
+    """
+    return modelo in _catalogos
+
+def obtener_cache(modelo):
+    """
+    Devuelve la caché de un modelo de referencia, creándola si no existe.
+
+    Args:
+        modelo (Base): Modelo de una tabla de referencia pequeña.
+
+    Returns:
+        CacheCatalogo: Caché del modelo.
+    """
+    cache = _caches.get(modelo)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(modelo, CacheCatalogo(modelo))
+    return cache
+
+class CacheRegistros:
+    """
+    Caché LRU en memoria de registros buscados por una clave única de varias
+    columnas (ej. el documento de un paciente), para las búsquedas repetidas.
+
+    Guarda el registro ya serializado. Una entrada se descarta cuando:
+        - el registro se modifica o elimina a través del ORM en este proceso
+          (al hacer flush y otra vez al confirmar la transacción),
+        - vence el TTL, para recoger escrituras de otros procesos y los
+          borrados en cascada hechos por la base, o
+        - es la menos usada y se supera el tamaño máximo.
+
+    Una clave descartada no se vuelve a guardar durante la ventana de
+    consistencia de las réplicas (REPLICA_STALENESS_WINDOW): una lectura de
+    una réplica atrasada no la vuelve a llenar con el valor anterior.
+
+    Los límites se leen de la configuración de la app en cada uso; con
+    tamaño 0 la caché no guarda nada.
+    """
+
+    def __init__(self, modelo, columnas, clave_tamano, clave_ttl):
+        self.modelo = modelo
+        self.columnas = columnas
+        self.clave_tamano = clave_tamano
+        self.clave_ttl = clave_ttl
+        # clave -> (momento en que vence, registro o None si está descartada)
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self._registrar_invalidacion()
+
+    def _registrar_invalidacion(self):
+        columnas = self.columnas
+
+        def claves(objeto):
+            # Clave actual y, si cambió alguna columna, la anterior
+            estado = inspect(objeto)
+            actual, anterior = [], []
+            for columna in columnas:
+                historia = estado.attrs[columna].history
+                valor = getattr(objeto, columna)
+                actual.append(valor)
+                anterior.append(historia.deleted[0] if historia.deleted else valor)
+            return {tuple(actual), tuple(anterior)}
+
+        def al_escribir(mapper, connection, objeto):
+            modificadas = claves(objeto)
+            self.descartar(*modificadas)
+            # Se vuelven a descartar al confirmar: otra solicitud pudo leer el valor anterior en el medio
+            session = inspect(objeto).session
+            if session is not None:
+                session.info.setdefault('claves_cache', {}).setdefault(self, set()).update(modificadas)
+
+        event.listen(self.modelo, 'after_update', al_escribir)
+        event.listen(self.modelo, 'after_delete', al_escribir)
+
+    def _limites(self):
+        # Tamaño máximo, TTL y ventana de las réplicas (valores por defecto fuera de la app, ej. en la CLI)
+        config = current_app.config if has_app_context() else {}
+        return (config.get(self.clave_tamano, 10000), config.get(self.clave_ttl, 30),
+                config.get('REPLICA_STALENESS_WINDOW', 5))
+
+    def _recortar(self, maximo):
+        while len(self._entradas) > maximo:
+            self._entradas.popitem(last=False)
+
+    def obtener(self, clave):
+        """
+        Args:
+            clave (tuple): Valores de las columnas de la clave.
+
+        Returns:
+            dict: Registro serializado, o None si no está (o venció).
+        """
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None or entrada[1] is None:
+                return None
+            if entrada[0] < time.monotonic():
+                del self._entradas[clave]
+                return None
+            self._entradas.move_to_end(clave)
+            return entrada[1]
+
+    def guardar(self, clave, registro):
+        """
+        Guarda un registro serializado, salvo que la clave se haya descartado hace poco.
+
+        Args:
+            clave (tuple): Valores de las columnas de la clave.
+            registro (dict): Registro serializado.
+        """
+        maximo, ttl, _ = self._limites()
+        if maximo <= 0:
+            return
+        ahora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[1] is None and entrada[0] > ahora:
+                return
+            self._entradas[clave] = (ahora + ttl, registro)
+            self._entradas.move_to_end(clave)
+            self._recortar(maximo)
+
+    def descartar(self, *claves):
+        """
+        Descarta registros y bloquea su clave durante la ventana de las réplicas.
+
+        Args:
+            claves (tuple): Claves a descartar.
+        """
+        maximo, _, ventana = self._limites()
+        if maximo <= 0:
+            return
+        vence = time.monotonic() + ventana
+        with self._lock:
+            for clave in claves:
+                self._entradas[clave] = (vence, None)
+                self._entradas.move_to_end(clave)
+            self._recortar(maximo)
+
+@event.listens_for(Session, 'after_commit')
+def _descartar_confirmadas(session):
+    # Claves de CacheRegistros modificadas en la transacción que se acaba de confirmar
+    for cache, claves in session.info.pop('claves_cache', {}).items():
+        cache.descartar(*claves)
+
+@event.listens_for(Session, 'after_rollback')
+def _olvidar_descartadas(session):
+    session.info.pop('claves_cache', None)
+
@@ -0,0 +1,122 @@
+import gzip
+import threading
+from collections import OrderedDict
+from flask import request
+
+# brotli es opcional: sin él solo se ofrece gzip
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Tipos de contenido que vale la pena comprimir
+TIPOS_COMPRIMIBLES = ('application/json', 'text/')
+
+class CacheComprimidos:
+    """
+    Cuerpos ya comprimidos de las respuestas con ETag (los catálogos).
+
+    El ETag es un resumen de los datos (ver app.utils.versiones.con_etag), así
+    que la misma ruta con el mismo ETag y la misma codificación siempre da los
+    mismos bytes: se comprimen una vez, con el nivel máximo, y se reutilizan
+    hasta que una escritura cambia la versión. Se descartan los menos usados
+    al superar el tamaño máximo.
+    """
+
+    def __init__(self, maximo):
+        self.maximo = maximo
+        self._cuerpos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave):
+        with self._lock:
+            cuerpo = self._cuerpos.get(clave)
+            if cuerpo is not None:
+                self._cuerpos.move_to_end(clave)
+            return cuerpo
+
+    def guardar(self, clave, cuerpo):
+        with self._lock:
+            self._cuerpos[clave] = cuerpo
+            self._cuerpos.move_to_end(clave)
+            while len(self._cuerpos) > self.maximo:
+                self._cuerpos.popitem(last=False)
+
+def codificaciones_disponibles():
+    """
+    Returns:
+        list: Codificaciones soportadas, en orden de preferencia ('br' solo si brotli está instalado).
+    """
+    return (['br'] if brotli is not None else []) + ['gzip']
+
+def comprimir(datos, codificacion, maximo=False, config=None):
+    """
+    Comprime un cuerpo con la codificación indicada.
+
+    Args:
+        datos (bytes): Cuerpo sin comprimir.
+        codificacion (str): 'br' o 'gzip'.
+        maximo (bool): Usar el nivel máximo (para cuerpos que se guardan en la caché).
+        config (dict): Configuración de la app (COMPRESS_GZIP_LEVEL, COMPRESS_BROTLI_QUALITY).
+
+    Returns:
+        bytes: Cuerpo comprimido.
+    """
+    config = config or {}
+    if codificacion == 'br':
+        calidad = 11 if maximo else config.get('COMPRESS_BROTLI_QUALITY', 4)
+        return brotli.compress(datos, quality=calidad, mode=brotli.MODE_TEXT)
+    nivel = 9 if maximo else config.get('COMPRESS_GZIP_LEVEL', 6)
+    # mtime fijo: los mismos datos dan los mismos bytes
+    return gzip.compress(datos, compresslevel=nivel, mtime=0)
+
+def registrar_compresion(app):
+    """
+    Comprime las respuestas grandes según el Accept-Encoding del cliente.
+
+    Se comprimen las respuestas exitosas de tipo JSON o texto de al menos
+    COMPRESS_MIN_SIZE bytes, con brotli si el cliente lo acepta y está
+    instalado, o con gzip. Las respuestas transmitidas por partes (?stream=1)
+    se envían sin comprimir. El ETag de una respuesta comprimida pasa a ser
+    débil (W/"..."), como hacen los proxies, y los 304 de los catálogos lo
+    siguen reconociendo (ver app.utils.versiones.con_etag).
+
+    Args:
+        app (Flask): Aplicación.
+    """
+    cache = CacheComprimidos(app.config.get('COMPRESS_CACHE_SIZE', 256))
+
+    @app.after_request
+    def comprimir_respuesta(respuesta):
+        config = app.config
+        if not config.get('COMPRESS_ENABLED', True):
+            return respuesta
+        # Solo cuerpos completos, sin codificar y de un tipo comprimible
+        if (respuesta.status_code != 200 or respuesta.direct_passthrough or respuesta.is_streamed
+                or 'Content-Encoding' in respuesta.headers
+                or not respuesta.mimetype.startswith(TIPOS_COMPRIMIBLES)):
+            return respuesta
+        datos = respuesta.get_data()
+        if len(datos) < config.get('COMPRESS_MIN_SIZE', 1024):
+            return respuesta
+        # La respuesta depende del Accept-Encoding aunque este cliente no comprima
+        respuesta.vary.add('Accept-Encoding')
+        codificacion = request.accept_encodings.best_match(codificaciones_disponibles())
+        if codificacion is None:
+            return respuesta
+        etag, debil = respuesta.get_etag()
+        if etag and not debil:
+            # Versión conocida de los datos: se comprime una sola vez
+            clave = (request.full_path, etag, codificacion)
+            comprimido = cache.obtener(clave)
+            if comprimido is None:
+                comprimido = comprimir(datos, codificacion, maximo=True)
+                cache.guardar(clave, comprimido)
+        else:
+            comprimido = comprimir(datos, codificacion, config=config)
+        respuesta.set_data(comprimido)
+        respuesta.headers['Content-Encoding'] = codificacion
+        # Otra representación de los mismos datos: el ETag deja de ser fuerte
+        if etag:
+            respuesta.set_etag(etag, weak=True)
+        return respuesta
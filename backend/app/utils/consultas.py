@@ -0,0 +1,88 @@
+import logging
+import time
+import warnings
+from collections import Counter
+from flask import request, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+class ConsultasRepetidas(RuntimeError):
+    """
+    Una solicitud repitió la misma sentencia SQL más veces que el umbral
+    configurado (típico de un N+1 por una relación lazy recorrida fila por fila).
+    """
+
+class AdvertenciaConsultasRepetidas(UserWarning):
+    """
+    Advertencia equivalente a ConsultasRepetidas en el modo 'warn'.
+    """
+
+def _estadisticas():
+    # Contadores de la solicitud actual (None fuera de una solicitud, ej. CLI o streaming)
+    if not has_request_context():
+        return None
+    if 'consultas' not in g:
+        g.consultas = {'cantidad': 0, 'tiempo': 0.0, 'formas': Counter()}
+    return g.consultas
+
+def registrar_instrumentacion(app):
+    """
+    Cuenta las sentencias SQL y el tiempo en la base de datos de cada solicitud.
+
+    Los totales se devuelven en los headers X-DB-Queries y X-DB-Time-ms y se
+    registran en el logger "<app>.consultas" con nivel INFO. Ese logger tiene
+    su propio nivel (QUERY_LOG_LEVEL): por defecto WARNING, que deja solo las
+    advertencias de N+1; con INFO se registra cada solicitud, también sin el
+    modo debug. Con QUERY_REPEAT_MODE en 'warn' o 'raise', una misma
+    sentencia (misma forma, con parámetros) ejecutada más de
+    QUERY_REPEAT_THRESHOLD veces en una solicitud emite una advertencia o lanza
+    ConsultasRepetidas en el punto donde se ejecuta, para encontrar el N+1.
+
+    Args:
+        app (Flask): Aplicación.
+    """
+    modo = app.config.get('QUERY_REPEAT_MODE', 'off')
+    umbral = app.config.get('QUERY_REPEAT_THRESHOLD', 10)
+    # Hijo del logger de la app: usa sus handlers pero no hereda su nivel
+    # (con QUERY_LOG_LEVEL=INFO el resumen aparece aunque la app esté en WARNING)
+    logger = app.logger.getChild('consultas')
+    logger.setLevel(app.config.get('QUERY_LOG_LEVEL', 'WARNING'))
+
+    # Eventos a nivel de la clase Engine: cubren el primario y las réplicas
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def antes_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+        stats = _estadisticas()
+        if stats is None:
+            return
+        stats['cantidad'] += 1
+        context._inicio_consulta = time.perf_counter()
+        if modo == 'off':
+            return
+        # La sentencia ya viene parametrizada: el texto es su "forma"
+        stats['formas'][statement] += 1
+        if stats['formas'][statement] == umbral + 1:
+            mensaje = 'La sentencia se ejecutó más de {} veces en {} (posible N+1): {}'.format(
+                umbral, request.endpoint, ' '.join(statement.split())[:300])
+            if modo == 'raise':
+                raise ConsultasRepetidas(mensaje)
+            logger.warning(mensaje)
+            warnings.warn(mensaje, AdvertenciaConsultasRepetidas, stacklevel=2)
+
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def despues_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+        stats = _estadisticas()
+        inicio = getattr(context, '_inicio_consulta', None)
+        if stats is None or inicio is None:
+            return
+        stats['tiempo'] += time.perf_counter() - inicio
+
+    @app.after_request
+    def informar_consultas(response):
+        stats = g.get('consultas')
+        cantidad = stats['cantidad'] if stats else 0
+        tiempo = round(stats['tiempo'] * 1000, 2) if stats else 0.0
+        response.headers['X-DB-Queries'] = str(cantidad)
+        response.headers['X-DB-Time-ms'] = str(tiempo)
+        logger.info('%s %s -> %s: %d consultas, %.2f ms en la base de datos',
+                    request.method, request.path, response.status_code, cantidad, tiempo)
+        return response
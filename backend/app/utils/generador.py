@@ -0,0 +1,295 @@
+import csv
+import os
+import random
+from itertools import accumulate
+from sqlalchemy import insert, select, func, text
+from app.models.provincia import Provincia
+from app.models.localidad import Localidad
+from app.models.nacionalidad import Nacionalidad
+from app.models.doctipo import DocTipo
+from app.models.especialidad import Especialidad
+from app.models.diagnostico import Diagnostico
+from app.models.stafftipo import StaffTipo
+from app.models.staff import Staff
+from app.models.paciente import Paciente
+from app.models.tokenbusqueda import TokenBusqueda
+from app.utils.busqueda import tokenizar
+
+# Apellidos y nombres con su frecuencia relativa aproximada (por cada mil personas)
+APELLIDOS = {
+    'González': 32, 'Rodríguez': 30, 'Gómez': 24, 'Fernández': 24, 'López': 22, 'Martínez': 22, 'Díaz': 18,
+    'Pérez': 18, 'Sánchez': 16, 'Romero': 14, 'García': 14, 'Sosa': 12, 'Benítez': 11, 'Ramírez': 11,
+    'Torres': 10, 'Ruiz': 10, 'Flores': 10, 'Álvarez': 10, 'Acosta': 9, 'Rojas': 9, 'Medina': 9,
+    'Herrera': 8, 'Aguirre': 8, 'Pereyra': 8, 'Gutiérrez': 8, 'Giménez': 8, 'Molina': 7, 'Silva': 7,
+    'Castro': 7, 'Suárez': 7, 'Ortiz': 6, 'Núñez': 6, 'Luna': 6, 'Juárez': 6, 'Cabrera': 6, 'Ríos': 5,
+    'Ferreyra': 5, 'Godoy': 5, 'Morales': 5, 'Domínguez': 5, 'Moreno': 5, 'Peralta': 4, 'Vega': 4,
+    'Carrizo': 4, 'Quiroga': 4, 'Castillo': 4, 'Ledesma': 4, 'Muñoz': 4, 'Ojeda': 4, 'Ponce': 3,
+    'Vera': 3, 'Cardozo': 3, 'Figueroa': 3, 'Navarro': 3, 'Correa': 3, 'Ibáñez': 3, 'Villalba': 3,
+    'Cáceres': 3, 'Arias': 3, 'Coronel': 2, 'Maldonado': 2, 'Mendoza': 2, 'Paz': 2, 'Vázquez': 2,
+}
+NOMBRES_FEMENINOS = {
+    'María': 40, 'Ana': 18, 'Laura': 13, 'Marta': 12, 'Silvia': 11, 'Claudia': 10, 'Graciela': 9, 'Patricia': 9,
+    'Susana': 8, 'Norma': 8, 'Mónica': 7, 'Gabriela': 7, 'Sofía': 7, 'Valentina': 6, 'Lucía': 6, 'Camila': 6,
+    'Florencia': 5, 'Micaela': 5, 'Agustina': 5, 'Julieta': 4, 'Paula': 4, 'Romina': 4, 'Carolina': 4,
+    'Rosa': 3, 'Beatriz': 3, 'Elena': 3, 'Alicia': 3, 'Teresa': 2,
+}
+NOMBRES_MASCULINOS = {
+    'Juan': 30, 'José': 26, 'Carlos': 18, 'Luis': 15, 'Jorge': 14, 'Miguel': 12, 'Daniel': 11, 'Roberto': 10,
+    'Ricardo': 9, 'Oscar': 8, 'Sergio': 8, 'Pablo': 8, 'Alejandro': 7, 'Diego': 7, 'Martín': 7, 'Santiago': 6,
+    'Mateo': 6, 'Facundo': 5, 'Nicolás': 5, 'Matías': 5, 'Lucas': 5, 'Tomás': 4, 'Gonzalo': 4, 'Federico': 4,
+    'Hugo': 3, 'Ramón': 3, 'Héctor': 3, 'Raúl': 3, 'Eduardo': 3, 'Benjamín': 2,
+}
+NOMBRES = dict(NOMBRES_FEMENINOS, **NOMBRES_MASCULINOS)
+PROVINCIAS = ['Buenos Aires', 'Ciudad Autónoma de Buenos Aires', 'Catamarca', 'Chaco', 'Chubut', 'Córdoba',
+              'Corrientes', 'Entre Ríos', 'Formosa', 'Jujuy', 'La Pampa', 'La Rioja', 'Mendoza', 'Misiones',
+              'Neuquén', 'Río Negro', 'Salta', 'San Juan', 'San Luis', 'Santa Cruz', 'Santa Fe',
+              'Santiago del Estero', 'Tierra del Fuego', 'Tucumán']
+# Población relativa de cada provincia (mismo orden)
+PESOS_PROVINCIAS = [385, 68, 9, 26, 13, 82, 25, 30, 13, 17, 8, 8, 44, 28, 15, 16, 31, 17, 11, 7, 78, 21, 4, 37]
+NACIONALIDADES = ['Argentina', 'Paraguaya', 'Boliviana', 'Chilena', 'Peruana', 'Uruguaya', 'Venezolana',
+                  'Brasileña', 'Colombiana', 'Española', 'Italiana', 'China', 'Estadounidense', 'Ecuatoriana',
+                  'Mexicana', 'Cubana', 'Francesa', 'Alemana', 'Dominicana', 'Rusa', 'Ucraniana', 'Coreana',
+                  'Japonesa', 'Polaca', 'Portuguesa']
+PESOS_NACIONALIDADES = [9000, 250, 200, 100, 80, 60, 60, 40, 30, 30, 30, 20, 10, 10, 10, 10, 5, 5, 5, 3, 3, 3, 2, 2, 2]
+DOC_TIPOS = ['DNI', 'LC', 'LE', 'CI', 'Pasaporte']
+PESOS_DOC_TIPOS = [950, 20, 15, 5, 10]
+ESPECIALIDADES = ['Cirugía General', 'Traumatología', 'Cardiología', 'Neurocirugía', 'Urología', 'Ginecología',
+                  'Oftalmología', 'Otorrinolaringología', 'Cirugía Plástica', 'Cirugía Vascular', 'Cirugía Torácica',
+                  'Cirugía Pediátrica', 'Proctología', 'Cirugía de Cabeza y Cuello', 'Mastología',
+                  'Cirugía Cardiovascular', 'Flebología', 'Cirugía Bariátrica', 'Endoscopía', 'Anestesiología']
+STAFF_TIPOS = ['Cirujano', 'Anestesista', 'Instrumentador', 'Enfermero', 'Residente', 'Técnico']
+PESOS_STAFF_TIPOS = [30, 15, 20, 25, 8, 2]
+PREFIJOS_LOCALIDAD = ['Villa', 'San', 'Santa', 'General', 'Colonia', 'Puerto', 'Coronel', 'Presidente', 'Pueblo']
+
+# Volúmenes por defecto del comando generar-datos
+VOLUMENES = {'pacientes': 100000, 'staff': 2000, 'localidades': 2000, 'diagnosticos': 500}
+
+# Orden de carga de las tablas (respeta las claves foráneas)
+TABLAS = [Provincia, Localidad, Nacionalidad, DocTipo, Especialidad, Diagnostico, StaffTipo, Staff, Paciente, TokenBusqueda]
+
+class Distribucion:
+    """
+    Elige valores al azar según sus pesos, por lotes (random.choices con
+    pesos acumulados precalculados).
+    """
+
+    def __init__(self, rnd, valores, pesos):
+        self.rnd = rnd
+        self.valores = list(valores)
+        self.acumulados = list(accumulate(pesos))
+
+    def elegir(self, k=1):
+        return self.rnd.choices(self.valores, cum_weights=self.acumulados, k=k)
+
+class Unicos:
+    """
+    Hace únicos los valores de una columna UNIQUE.
+
+    Los nombres reales se repiten: si el valor ya salió se prueba otra
+    combinación realista y, si también está usada, se agrega el número de
+    fila (único por construcción, los nombres base no tienen dígitos).
+    Cuenta las colisiones, que son las que encontraría la restricción.
+    """
+
+    def __init__(self, intentos=2):
+        self.usados = set()
+        self.intentos = intentos
+        self.colisiones = 0
+
+    def valor(self, candidato, alternativa, indice):
+        if candidato in self.usados:
+            self.colisiones += 1
+            for _ in range(self.intentos):
+                candidato = alternativa()
+                if candidato not in self.usados:
+                    break
+            else:
+                candidato = '{} {}'.format(candidato, indice)
+        self.usados.add(candidato)
+        return candidato
+
+class DestinoBase:
+    """
+    Inserta las filas en la base con INSERT multi-fila (executemany), una
+    transacción por lote y siempre sobre la misma conexión. En MySQL desactiva
+    en esa conexión los controles de claves foráneas y únicas durante la carga:
+    los datos generados ya son consistentes.
+    """
+
+    def __init__(self, engine):
+        self.conexion = engine.connect()
+        self.mysql = engine.dialect.name == 'mysql'
+        if self.mysql:
+            self.conexion.execute(text('SET foreign_key_checks = 0, unique_checks = 0'))
+            self.conexion.commit()
+
+    def escribir(self, modelo, filas):
+        if filas:
+            self.conexion.execute(insert(modelo.__table__), filas)
+            self.conexion.commit()
+
+    def cerrar(self):
+        try:
+            if self.mysql:
+                self.conexion.execute(text('SET foreign_key_checks = 1, unique_checks = 1'))
+                self.conexion.commit()
+        finally:
+            self.conexion.close()
+
+class DestinoArchivos:
+    """
+    Escribe un archivo TSV por tabla y un script cargar.sql con las sentencias
+    LOAD DATA LOCAL INFILE para MySQL:
+
+        mysql --local-infile=1 -u usuario -p base < directorio/cargar.sql
+    """
+
+    def __init__(self, directorio):
+        self.directorio = os.path.abspath(directorio)
+        os.makedirs(self.directorio, exist_ok=True)
+        self.archivos = {}
+
+    def escribir(self, modelo, filas):
+        if not filas:
+            return
+        tabla = modelo.__tablename__
+        if tabla not in self.archivos:
+            ruta = os.path.join(self.directorio, tabla + '.tsv')
+            archivo = open(ruta, 'w', newline='', encoding='utf-8')
+            columnas = list(filas[0])
+            self.archivos[tabla] = (archivo, csv.writer(archivo, delimiter='\t', lineterminator='\n'), columnas, ruta)
+        archivo, escritor, columnas, ruta = self.archivos[tabla]
+        escritor.writerows([fila[c] for c in columnas] for fila in filas)
+
+    def cerrar(self):
+        sentencias = ['SET foreign_key_checks = 0;', 'SET unique_checks = 0;']
+        for modelo in TABLAS:
+            if modelo.__tablename__ not in self.archivos:
+                continue
+            archivo, _, columnas, ruta = self.archivos[modelo.__tablename__]
+            archivo.close()
+            sentencias.append(
+                "LOAD DATA LOCAL INFILE '{}' INTO TABLE {} CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({});".format(
+                    ruta, modelo.__tablename__, ', '.join(columnas)))
+        sentencias += ['SET unique_checks = 1;', 'SET foreign_key_checks = 1;']
+        with open(os.path.join(self.directorio, 'cargar.sql'), 'w', encoding='utf-8') as archivo:
+            archivo.write('\n'.join(sentencias) + '\n')
+
+def tablas_vacias(session):
+    """
+    Indica si las tablas a generar están vacías (los IDs se asignan desde 1).
+    """
+    return all(not session.execute(select(func.count()).select_from(modelo)).scalar() for modelo in TABLAS)
+
+def generar(destino, volumenes=None, semilla=1, tamano_lote=5000, progreso=None):
+    """
+    Genera un conjunto de datos completo y determinístico: la misma semilla y
+    los mismos volúmenes producen exactamente las mismas filas.
+
+    Las filas se generan y se escriben por lotes, con IDs explícitos desde 1,
+    de modo que los millones de pacientes nunca están todos en memoria (solo
+    los nombres ya usados, para las columnas UNIQUE). El índice de búsqueda se
+    escribe junto con cada lote de pacientes y de staff.
+
+    Args:
+        destino (DestinoBase|DestinoArchivos): Donde se escriben las filas.
+        volumenes (dict): Cantidad de pacientes, staff, localidades y diagnosticos.
+        semilla (int): Semilla del generador aleatorio.
+        tamano_lote (int): Filas por INSERT multi-fila / transacción.
+        progreso (callable): Función opcional llamada con (tabla, filas escritas).
+
+    Returns:
+        dict: Filas escritas por tabla y colisiones de nombres resueltas por columna.
+    """
+    volumenes = dict(VOLUMENES, **(volumenes or {}))
+    rnd = random.Random(semilla)
+    resumen = {'filas': {}, 'colisiones': {}}
+
+    def escribir(modelo, filas):
+        destino.escribir(modelo, filas)
+        tabla = modelo.__tablename__
+        resumen['filas'][tabla] = resumen['filas'].get(tabla, 0) + len(filas)
+        if progreso:
+            progreso(tabla, resumen['filas'][tabla])
+
+    # Catálogos fijos
+    escribir(Provincia, [{'id_provincia': i, 'provincia': p} for i, p in enumerate(PROVINCIAS, 1)])
+    escribir(Nacionalidad, [{'id_nacionalidad': i, 'nacionalidad': n} for i, n in enumerate(NACIONALIDADES, 1)])
+    escribir(DocTipo, [{'id_doc_tipo': i, 'doc_tipo': d} for i, d in enumerate(DOC_TIPOS, 1)])
+    escribir(Especialidad, [{'id_especialidad': i, 'especialidad': e} for i, e in enumerate(ESPECIALIDADES, 1)])
+    escribir(StaffTipo, [{'id_staff_tipo': i, 'staff_tipo': s} for i, s in enumerate(STAFF_TIPOS, 1)])
+
+    # Localidades repartidas según la población de cada provincia
+    provincias = Distribucion(rnd, range(1, len(PROVINCIAS) + 1), PESOS_PROVINCIAS)
+    raices = list(APELLIDOS) + list(NOMBRES)
+    localidades = Unicos()
+    nombre_localidad = lambda: '{} {}'.format(rnd.choice(PREFIJOS_LOCALIDAD), rnd.choice(raices))
+    escribir(Localidad, [{'id_localidad': i,
+                          'localidad': localidades.valor(nombre_localidad(), nombre_localidad, i),
+                          'id_provincia': provincias.elegir()[0]}
+                         for i in range(1, volumenes['localidades'] + 1)])
+
+    escribir(Diagnostico, [{'id_diagnostico': i,
+                            'diagnostico': 'Diagnóstico {:05d}'.format(i),
+                            'id_especialidad': rnd.randint(1, len(ESPECIALIDADES))}
+                           for i in range(1, volumenes['diagnosticos'] + 1)])
+
+    apellidos = Distribucion(rnd, APELLIDOS, APELLIDOS.values())
+    nombres = [Distribucion(rnd, NOMBRES_FEMENINOS, NOMBRES_FEMENINOS.values()),
+               Distribucion(rnd, NOMBRES_MASCULINOS, NOMBRES_MASCULINOS.values())]
+
+    def apellido_doble():
+        return ' '.join(apellidos.elegir(2))
+
+    def nombre_simple_o_compuesto():
+        # Aproximadamente un tercio de las personas tiene dos nombres, del mismo género
+        return ' '.join(rnd.choice(nombres).elegir(2 if rnd.random() < 0.35 else 1))
+
+    def nombre_compuesto():
+        return ' '.join(rnd.choice(nombres).elegir(2))
+
+    def personas(modelo, cantidad, crear_fila):
+        # Genera las filas por lotes; al terminar registra las colisiones de nombres
+        unicos_apellidos, unicos_nombres = Unicos(), Unicos()
+        for inicio in range(1, cantidad + 1, tamano_lote):
+            filas = []
+            for i in range(inicio, min(inicio + tamano_lote, cantidad + 1)):
+                apellido = unicos_apellidos.valor(apellido_doble(), apellido_doble, i)
+                nombre = unicos_nombres.valor(nombre_simple_o_compuesto(), nombre_compuesto, i)
+                filas.append(crear_fila(i, apellido, nombre))
+            yield filas
+        resumen['colisiones'][modelo.__tablename__] = {
+            'apellidos': unicos_apellidos.colisiones, 'nombre': unicos_nombres.colisiones}
+
+    def indexar(entidad, filas, campo_pk, campo_nombre):
+        return [{'entidad': entidad, 'id_entidad': fila[campo_pk], 'token': token}
+                for fila in filas for token in tokenizar(fila['apellidos'], fila[campo_nombre])]
+
+    # Staff
+    tipos_staff = Distribucion(rnd, range(1, len(STAFF_TIPOS) + 1), PESOS_STAFF_TIPOS)
+    for filas in personas(Staff, volumenes['staff'], lambda i, a, n: {
+            'id_staff': i, 'apellidos': a, 'nombres': n, 'id_staff_tipo': tipos_staff.elegir()[0]}):
+        escribir(Staff, filas)
+        escribir(TokenBusqueda, indexar(Staff.__tablename__, filas, 'id_staff', 'nombres'))
+
+    # Pacientes: localidades con distribución tipo Zipf (pocas ciudades grandes)
+    doc_tipos = Distribucion(rnd, range(1, len(DOC_TIPOS) + 1), PESOS_DOC_TIPOS)
+    nacionalidades = Distribucion(rnd, range(1, len(NACIONALIDADES) + 1), PESOS_NACIONALIDADES)
+    ciudades = Distribucion(rnd, range(1, volumenes['localidades'] + 1),
+                            [1 / i for i in range(1, volumenes['localidades'] + 1)])
+    # Números de documento crecientes con saltos al azar: únicos sin guardarlos
+    documento = [5000000]
+
+    def paciente(i, apellido, nombre):
+        documento[0] += rnd.randint(1, 40)
+        return {'id_paciente': i, 'id_doc_tipo': doc_tipos.elegir()[0], 'doc_numero': documento[0],
+                'apellidos': apellido, 'nombre': nombre, 'id_localidad': ciudades.elegir()[0],
+                'id_nacionalidad': nacionalidades.elegir()[0]}
+
+    for filas in personas(Paciente, volumenes['pacientes'], paciente):
+        escribir(Paciente, filas)
+        escribir(TokenBusqueda, indexar(Paciente.__tablename__, filas, 'id_paciente', 'nombre'))
+
+    destino.cerrar()
+    return resumen
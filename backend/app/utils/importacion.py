@@ -0,0 +1,225 @@
+import csv
+import io
+import json
+from itertools import islice
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from app.models.paciente import Paciente
+from app.models.doctipo import DocTipo
+from app.models.localidad import Localidad
+from app.models.nacionalidad import Nacionalidad
+from app.models.tokenbusqueda import TokenBusqueda
+from app.utils.busqueda import tokenizar
+from app.utils.validacion import entero
+from app.utils.cache import obtener_cache
+
+# Tipos de contenido aceptados por la importación
+TIPOS_NDJSON = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+TIPOS_CSV = ('text/csv', 'application/csv')
+
+# Campos de un paciente: enteros y textos
+CAMPOS_ENTEROS = ('id_doc_tipo', 'doc_numero', 'id_localidad', 'id_nacionalidad')
+CAMPOS_TEXTO = ('apellidos', 'nombre')
+
+class FormatoNoSoportado(ValueError):
+    """
+    El cuerpo de la importación no es NDJSON ni CSV. Las rutas lo responden con 415.
+    """
+
+def leer_filas(mimetype, stream):
+    """
+    Recorre el cuerpo de la petición fila por fila, sin leerlo entero.
+
+    Args:
+        mimetype (str): Tipo de contenido de la petición.
+        stream: Flujo binario del cuerpo (request.stream).
+
+    Yields:
+        tuple: (número de fila, diccionario con la fila o None si no se pudo leer)
+    """
+    texto = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if mimetype in TIPOS_NDJSON:
+        for numero, linea in enumerate(texto, start=1):
+            # Las líneas vacías se ignoran
+            if not linea.strip():
+                continue
+            try:
+                fila = json.loads(linea)
+            except ValueError:
+                fila = None
+            yield numero, fila if isinstance(fila, dict) else None
+    elif mimetype in TIPOS_CSV:
+        # La primera línea del CSV trae los nombres de los campos
+        for numero, fila in enumerate(csv.DictReader(texto), start=1):
+            yield numero, fila
+    else:
+        raise FormatoNoSoportado('Formato no soportado: enviar NDJSON o CSV')
+
+def _validar_fila(fila, ids_validos):
+    # Devuelve (paciente normalizado, None) o (None, mensaje de error)
+    if fila is None:
+        return None, 'Fila con formato inválido'
+    paciente = {}
+    for campo in CAMPOS_ENTEROS:
+        valor = fila.get(campo)
+        if valor is None or valor == '':
+            return None, 'Falta el campo "{}"'.format(campo)
+        # Sin truncar: 3.7 se rechaza (ver app.utils.validacion.entero)
+        paciente[campo] = entero(valor)
+        if paciente[campo] is None:
+            return None, 'El campo "{}" debe ser un número entero'.format(campo)
+    for campo in CAMPOS_TEXTO:
+        valor = fila.get(campo)
+        if not isinstance(valor, str) or valor == '':
+            return None, 'Falta el campo "{}"'.format(campo)
+        largo = getattr(Paciente, campo).type.length
+        if len(valor) > largo:
+            return None, 'El campo "{}" debe tener entre 1 y {} caracteres'.format(campo, largo)
+        paciente[campo] = valor
+    # Validar las claves foráneas de los catálogos contra los IDs precargados
+    for campo, mensaje in (('id_doc_tipo', 'El tipo de documento no existe'),
+                           ('id_nacionalidad', 'La nacionalidad no existe')):
+        if paciente[campo] not in ids_validos[campo]:
+            return None, mensaje
+    return paciente, None
+
+def _documento(paciente):
+    # Clave única de un paciente: (tipo de documento, número)
+    return paciente['id_doc_tipo'], paciente['doc_numero']
+
+def _insertar_tokens(session, pacientes):
+    # Indexar para la búsqueda por nombre los pacientes recién insertados
+    registros = session.execute(
+        select(Paciente.id_paciente, Paciente.apellidos, Paciente.nombre)
+        .where(tuple_(Paciente.id_doc_tipo, Paciente.doc_numero).in_([_documento(p) for p in pacientes]))
+    ).all()
+    filas = [{'entidad': Paciente.__tablename__, 'id_entidad': r.id_paciente, 'token': token}
+             for r in registros for token in tokenizar(r.apellidos, r.nombre)]
+    if filas:
+        session.execute(insert(TokenBusqueda.__table__), filas)
+
+def _insertar_lote(session, lote):
+    # Inserta un lote y confirma la transacción. Con una lista de parámetros
+    # la sentencia se compila una sola vez y se envía como INSERT multi-fila
+    # (executemany del driver de MySQL / insertmanyvalues de SQLAlchemy)
+    session.execute(insert(Paciente.__table__), lote)
+    _insertar_tokens(session, lote)
+    session.commit()
+
+class ErroresImportacion:
+    """
+    Errores por fila de una importación. Se guardan hasta `maximo` con su
+    detalle; del resto solo se cuentan, así un archivo con millones de filas
+    inválidas no hace crecer la memoria del proceso.
+    """
+
+    def __init__(self, maximo):
+        self.maximo = maximo
+        self.detalle = []
+        self.cantidad = 0
+
+    def agregar(self, numero, mensaje):
+        """
+        Args:
+            numero (int): Número de fila del archivo.
+            mensaje (str): Descripción del error.
+        """
+        self.cantidad += 1
+        if len(self.detalle) < self.maximo:
+            self.detalle.append({'fila': numero, 'message': mensaje})
+
+def _insertar_de_a_uno(session, lote, numeros, errores):
+    # Si el lote viola una restricción se reintenta fila por fila para
+    # informar exactamente cuáles fallan
+    insertados = 0
+    for numero, paciente in zip(numeros, lote):
+        try:
+            with session.begin_nested():
+                session.execute(insert(Paciente.__table__), [paciente])
+                _insertar_tokens(session, [paciente])
+            insertados += 1
+        except IntegrityError:
+            errores.agregar(numero, 'El paciente ya existe o viola una restricción')
+    session.commit()
+    return insertados
+
+def importar_pacientes(session, filas, tamano_lote, maximo_errores):
+    """
+    Importa pacientes en lotes, validando cada fila.
+
+    - Las claves foráneas de los catálogos se validan contra conjuntos de IDs
+      cargados una vez; las localidades (tabla de datos) con una consulta por
+      lote de los IDs que todavía no se confirmaron.
+    - Los documentos (id_doc_tipo, doc_numero) repetidos se buscan con una
+      consulta por lote (y dentro del propio archivo con un conjunto en memoria).
+    - Cada lote se inserta con un INSERT multi-fila en su propia transacción.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        filas (iterable): Pares (número de fila, diccionario) de leer_filas.
+        tamano_lote (int): Filas por lote y por transacción.
+        maximo_errores (int): Errores por fila que se guardan con su detalle.
+
+    Returns:
+        tuple: (cantidad de pacientes insertados, ErroresImportacion)
+    """
+    # Precargar los IDs válidos de los catálogos referenciados
+    ids_validos = {
+        'id_doc_tipo': {f['id_doc_tipo'] for f in obtener_cache(DocTipo).filas()},
+        'id_nacionalidad': {f['id_nacionalidad'] for f in obtener_cache(Nacionalidad).filas()},
+    }
+    # Localidades ya confirmadas en la base
+    localidades = set()
+    vistos = set()
+    errores = ErroresImportacion(maximo_errores)
+    insertados = 0
+    filas = iter(filas)
+    bloque = list(islice(filas, tamano_lote))
+    while bloque:
+        # Validar los campos de cada fila del bloque
+        candidatos = []
+        for numero, fila in bloque:
+            paciente, error = _validar_fila(fila, ids_validos)
+            if error:
+                errores.agregar(numero, error)
+            else:
+                candidatos.append((numero, paciente))
+        # Una sola consulta por bloque para las localidades no confirmadas
+        pendientes = {p['id_localidad'] for _, p in candidatos} - localidades
+        if pendientes:
+            localidades.update(session.execute(
+                select(Localidad.id_localidad).where(Localidad.id_localidad.in_(pendientes))).scalars())
+        validos = []
+        for numero, paciente in candidatos:
+            if paciente['id_localidad'] not in localidades:
+                errores.agregar(numero, 'La localidad no existe')
+            elif _documento(paciente) in vistos:
+                errores.agregar(numero, 'Número de documento repetido en el archivo')
+            else:
+                vistos.add(_documento(paciente))
+                validos.append((numero, paciente))
+        # Una sola consulta por bloque para detectar documentos ya cargados
+        if validos:
+            documento = tuple_(Paciente.id_doc_tipo, Paciente.doc_numero)
+            existentes = set(tuple(fila) for fila in session.execute(
+                select(Paciente.id_doc_tipo, Paciente.doc_numero)
+                .where(documento.in_([_documento(p) for _, p in validos]))
+            ))
+            for numero, paciente in validos:
+                if _documento(paciente) in existentes:
+                    errores.agregar(numero, 'El paciente ya existe')
+            validos = [(n, p) for n, p in validos if _documento(p) not in existentes]
+        # Insertar el lote en su propia transacción
+        if validos:
+            numeros = [n for n, _ in validos]
+            lote = [p for _, p in validos]
+            try:
+                _insertar_lote(session, lote)
+                insertados += len(lote)
+            except IntegrityError:
+                session.rollback()
+                insertados += _insertar_de_a_uno(session, lote, numeros, errores)
+        bloque = list(islice(filas, tamano_lote))
+    # Ordenar los errores guardados por número de fila
+    errores.detalle.sort(key=lambda e: e['fila'])
+    return insertados, errores
@@ -0,0 +1,50 @@
+from flask.json.provider import DefaultJSONProvider
+
+# orjson es opcional: sin él se usa el json de la biblioteca estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ProveedorJSON(DefaultJSONProvider):
+    """
+    Proveedor JSON de la app: usa orjson cuando está instalado y el json de la
+    biblioteca estándar en otro caso.
+
+    La salida es equivalente a la del proveedor por defecto de Flask: claves
+    ordenadas (sort_keys), sangría en modo debug y el mismo tratamiento de
+    fechas, Decimal y UUID (orjson los deriva a `default`). La única diferencia
+    es que orjson escribe los caracteres no ASCII en UTF-8 en lugar de
+    escaparlos como \\uXXXX, lo que no cambia el JSON decodificado.
+    """
+
+    def _opciones(self, sangria=False):
+        opciones = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            opciones |= orjson.OPT_SORT_KEYS
+        if sangria:
+            opciones |= orjson.OPT_INDENT_2
+        return opciones
+
+    def dumps(self, obj, **kwargs):
+        # Con argumentos propios de json.dumps (indent, cls, ...) se usa el estándar
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._opciones()).decode()
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # Mismo criterio que Flask: sangría en debug salvo que se pida compacto
+        sangria = (self.compact is None and self._app.debug) or self.compact is False
+        datos = orjson.dumps(obj, default=self.default, option=self._opciones(sangria))
+        # Se envían los bytes de orjson sin pasar por str
+        return self._app.response_class(datos + b'\n', mimetype=self.mimetype)
+
+def codificador_activo():
+    """
+    Returns:
+        str: Nombre del codificador JSON en uso ('orjson' o 'json').
+    """
+    return 'orjson' if orjson is not None else 'json'
@@ -0,0 +1,84 @@
+from flask import request, jsonify, current_app
+from app.utils.paginacion import ParametroInvalido
+from app.utils.proyeccion import filas_habilitadas
+
+def lote_solicitado():
+    """
+    Returns:
+        bool: True si el listado se pidió por IDs (?ids=1,2,3).
+    """
+    return 'ids' in request.args
+
+def leer_ids():
+    """
+    Lee los IDs pedidos: `?ids=1,2,3` en la query string o `{"ids": [1, 2, 3]}`
+    en el cuerpo de un POST (para listas largas). Se descartan los repetidos
+    conservando el orden del pedido.
+
+    Returns:
+        list: IDs pedidos, en orden y sin repetir.
+    """
+    if request.method == 'POST':
+        data = request.get_json(silent=True)
+        valores = data.get('ids') if isinstance(data, dict) else None
+        if not isinstance(valores, list) or not all(isinstance(v, int) and not isinstance(v, bool) for v in valores):
+            raise ParametroInvalido('El cuerpo debe ser un objeto JSON con "ids": una lista de números enteros')
+    else:
+        try:
+            valores = [int(v) for v in request.args.get('ids', '').split(',') if v.strip()]
+        except ValueError:
+            raise ParametroInvalido('El parámetro "ids" debe ser una lista de números enteros separados por coma')
+    ids = list(dict.fromkeys(valores))
+    if not ids:
+        raise ParametroInvalido('No se enviaron IDs')
+    maximo = current_app.config.get('BATCH_MAX_IDS', 1000)
+    if len(ids) > maximo:
+        raise ParametroInvalido('Se pueden pedir hasta {} IDs por solicitud'.format(maximo))
+    return ids
+
+def lote_serializado(session, modelo, columna_pk, serializador, ids):
+    """
+    Consulta y serializa varios registros por ID con una sola consulta IN.
+
+    Como en los listados, si el esquema es una proyección plana se consultan
+    solo sus columnas y se arma cada registro con la tupla; si no, se cargan
+    los objetos con las opciones del serializador (?fields=, ?expand=).
+
+    Args:
+        session (Session): Sesión de base de datos.
+        modelo (Base): Modelo consultado.
+        columna_pk (Column): Clave primaria.
+        serializador (Serializador): Ver app.utils.serializadores.
+        ids (list): IDs pedidos.
+
+    Returns:
+        dict: Registros serializados por ID (sin los que no existen).
+    """
+    proyeccion = serializador.proyeccion
+    if proyeccion is not None and filas_habilitadas():
+        # La clave primaria va al final (aunque no se haya pedido) para ubicar cada fila
+        filas = session.query(*proyeccion.columnas, columna_pk).filter(columna_pk.in_(ids)).all()
+        registros = proyeccion.a_dicts(filas)
+        return {fila[-1]: registro for fila, registro in zip(filas, registros)}
+    objetos = session.query(modelo).options(*serializador.opciones_carga()).filter(columna_pk.in_(ids)).all()
+    return {getattr(objeto, columna_pk.key): serializador(objeto) for objeto in objetos}
+
+def respuesta_lote(ids, registros):
+    """
+    Arma la respuesta de una consulta por IDs: los registros en el orden
+    pedido y la lista de los IDs que no existen.
+
+    Args:
+        ids (list): IDs pedidos, en orden.
+        registros (dict): Registros serializados por ID.
+
+    Returns:
+        tuple: (respuesta JSON, 200)
+    """
+    data = [registros[id] for id in ids if id in registros]
+    return jsonify({
+        'status': 'success',
+        'count': len(data),
+        'missing': [id for id in ids if id not in registros],
+        'data': data
+    }), 200
@@ -0,0 +1,252 @@
+import importlib
+import os
+import pkgutil
+import time
+from datetime import datetime
+from flask import jsonify
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, select, func, inspect
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+# Directorio de las migraciones: app/migraciones/vNNNN_descripcion.py
+DIRECTORIO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migraciones')
+PAQUETE = 'app.migraciones'
+
+# Una fila por migración aplicada; la versión del esquema es la mayor.
+# Tiene su propio MetaData: create_all/drop_all de los modelos no la tocan
+metadata_version = MetaData()
+tabla_version = Table(
+    'schema_version', metadata_version,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('descripcion', String(200), nullable=False),
+    Column('aplicada', DateTime, nullable=False),
+    Column('duracion_ms', Integer, nullable=False),
+)
+
+# Lock con nombre de MySQL: dos procesos que arrancan a la vez no migran juntos
+NOMBRE_LOCK = 'requiem_migraciones'
+
+class Migracion:
+    """
+    Un paso de migración: un módulo de app/migraciones con una función
+    `aplicar(conexion)`. La versión sale del nombre del archivo (v0003_... -> 3)
+    y la descripción de la primera línea del docstring del módulo.
+
+    Las migraciones tienen que poder ejecutarse de nuevo sin error (verificar
+    antes de crear): en MySQL cada DDL se confirma sola, así que si una falla
+    a la mitad se vuelve a ejecutar completa.
+    """
+
+    def __init__(self, version, nombre):
+        self.version = version
+        self.nombre = nombre
+        self._modulo = None
+
+    @property
+    def modulo(self):
+        if self._modulo is None:
+            self._modulo = importlib.import_module('{}.{}'.format(PAQUETE, self.nombre))
+        return self._modulo
+
+    @property
+    def descripcion(self):
+        return (self.modulo.__doc__ or self.nombre).strip().splitlines()[0]
+
+    def aplicar(self, conexion):
+        self.modulo.aplicar(conexion)
+
+def listar_migraciones():
+    """
+    Lista las migraciones disponibles, sin importarlas ni consultar la base.
+
+    Returns:
+        list: Migraciones ordenadas por versión.
+    """
+    migraciones = []
+    for modulo in pkgutil.iter_modules([DIRECTORIO]):
+        prefijo = modulo.name.split('_', 1)[0]
+        if prefijo[:1] == 'v' and prefijo[1:].isdigit():
+            migraciones.append(Migracion(int(prefijo[1:]), modulo.name))
+    migraciones.sort(key=lambda migracion: migracion.version)
+    versiones = [migracion.version for migracion in migraciones]
+    if len(set(versiones)) != len(versiones):
+        raise RuntimeError('Hay dos migraciones con la misma versión en {}'.format(DIRECTORIO))
+    return migraciones
+
+def ultima_version():
+    """
+    Returns:
+        int: Versión que espera el código (la de la última migración).
+    """
+    migraciones = listar_migraciones()
+    return migraciones[-1].version if migraciones else 0
+
+def version_actual(conectable):
+    """
+    Lee la versión del esquema de la base: una sola consulta.
+
+    Args:
+        conectable (Engine|Connection): Motor o conexión.
+
+    Returns:
+        int: Versión aplicada (0 si la base nunca se migró).
+    """
+    consulta = select(func.max(tabla_version.c.version))
+    try:
+        if hasattr(conectable, 'connect'):
+            with conectable.connect() as conexion:
+                return conexion.execute(consulta).scalar() or 0
+        return conectable.execute(consulta).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        # La tabla schema_version todavía no existe
+        if not hasattr(conectable, 'connect'):
+            conectable.rollback()
+        return 0
+
+def _bloquear(conexion):
+    if conexion.dialect.name == 'mysql':
+        obtenido = conexion.execute(select(func.get_lock(NOMBRE_LOCK, 600))).scalar()
+        if obtenido != 1:
+            raise RuntimeError('Otro proceso está migrando la base (lock {})'.format(NOMBRE_LOCK))
+
+def _liberar(conexion):
+    if conexion.dialect.name == 'mysql':
+        conexion.execute(select(func.release_lock(NOMBRE_LOCK)))
+
+def migrar(engine, hasta=None, informar=print):
+    """
+    Aplica en orden las migraciones pendientes, cada una en su transacción,
+    y registra cada versión aplicada en schema_version.
+
+    Args:
+        engine (Engine): Motor de la base principal.
+        hasta (int): Última versión a aplicar (por defecto todas).
+        informar (callable): Función que recibe los mensajes de avance.
+
+    Returns:
+        list: Migraciones aplicadas.
+    """
+    aplicadas = []
+    with engine.connect() as conexion:
+        _bloquear(conexion)
+        try:
+            tabla_version.create(conexion, checkfirst=True)
+            conexion.commit()
+            # Se vuelve a leer con el lock tomado: otro proceso pudo haber migrado
+            actual = version_actual(conexion)
+            for migracion in listar_migraciones():
+                if migracion.version <= actual or (hasta is not None and migracion.version > hasta):
+                    continue
+                informar('Migración {}: {}'.format(migracion.version, migracion.descripcion))
+                inicio = time.monotonic()
+                migracion.aplicar(conexion)
+                conexion.execute(tabla_version.insert().values(
+                    version=migracion.version, descripcion=migracion.descripcion[:200],
+                    aplicada=datetime.now(), duracion_ms=int((time.monotonic() - inicio) * 1000)))
+                conexion.commit()
+                aplicadas.append(migracion)
+        except Exception:
+            conexion.rollback()
+            raise
+        finally:
+            _liberar(conexion)
+            conexion.commit()
+    return aplicadas
+
+def preparar_esquema(app, engine):
+    """
+    Verifica al arrancar que la base tenga la versión de esquema que espera el
+    código. Si está al día cuesta una sola consulta (sin reflejar tablas).
+
+    Si faltan migraciones se aplican (DB_MIGRATE_ON_START). Si no, la app
+    arranca igual (así "flask migrar" puede usarla) pero responde 503 hasta
+    que alguien migre la base; mientras tanto cada solicitud vuelve a leer
+    la versión.
+
+    Args:
+        app (Flask): Aplicación (configuración y logger).
+        engine (Engine): Motor de la base principal.
+    """
+    esperada = ultima_version()
+    actual = version_actual(engine)
+    if actual == esperada:
+        return
+    if actual > esperada:
+        # Código más viejo que la base (ej. durante un despliegue): las migraciones agregan, no quitan
+        app.logger.warning('El esquema de la base (versión %s) es más nuevo que el código (versión %s)', actual, esperada)
+        return
+    if app.config.get('DB_MIGRATE_ON_START', True):
+        migrar(engine, informar=app.logger.info)
+        return
+    mensaje = 'El esquema de la base está en la versión {} y el código necesita la {}: ejecutar "flask --app wsgi migrar"'
+    app.logger.error(mensaje.format(actual, esperada))
+    pendiente = [True]
+
+    @app.before_request
+    def verificar_esquema():
+        if not pendiente:
+            return None
+        actual = version_actual(engine)
+        if actual < esperada:
+            return jsonify({'status': 'error', 'message': mensaje.format(actual, esperada)}), 503
+        # Ya se migró: no se vuelve a consultar
+        pendiente.clear()
+        return None
+
+# Utilidades para escribir migraciones
+
+def existe_tabla(conexion, tabla):
+    """
+    Args:
+        conexion (Connection): Conexión de la migración.
+        tabla (str): Nombre de la tabla.
+
+    Returns:
+        bool: True si la tabla existe.
+    """
+    return inspect(conexion).has_table(tabla)
+
+def existe_indice(conexion, tabla, nombre):
+    """
+    Args:
+        conexion (Connection): Conexión de la migración.
+        tabla (str): Nombre de la tabla.
+        nombre (str): Nombre del índice o de la restricción UNIQUE.
+
+    Returns:
+        bool: True si la tabla tiene un índice o restricción única con ese nombre.
+    """
+    inspector = inspect(conexion)
+    nombres = [indice['name'] for indice in inspector.get_indexes(tabla)]
+    nombres += [restriccion['name'] for restriccion in inspector.get_unique_constraints(tabla)]
+    return nombre in nombres
+
+def crear_indice(conexion, tabla, nombre, columnas, unico=False):
+    """
+    Crea un índice sin bloquear las escrituras de la tabla, si no existe.
+
+    En MySQL (InnoDB) se usa ALTER TABLE ... ALGORITHM=INPLACE, LOCK=NONE: la
+    tabla sigue aceptando lecturas y escrituras mientras se construye el
+    índice, y si el motor no puede hacerlo en línea la sentencia falla en lugar
+    de bloquear la tabla. En otras bases se usa CREATE INDEX.
+
+    Args:
+        conexion (Connection): Conexión de la migración.
+        tabla (str): Nombre de la tabla.
+        nombre (str): Nombre del índice.
+        columnas (list): Columnas del índice, en orden.
+        unico (bool): Índice UNIQUE.
+
+    Returns:
+        bool: True si se creó, False si ya existía.
+    """
+    if existe_indice(conexion, tabla, nombre):
+        return False
+    q = conexion.dialect.identifier_preparer.quote
+    lista = ', '.join(q(columna) for columna in columnas)
+    tipo = 'UNIQUE INDEX' if unico else 'INDEX'
+    if conexion.dialect.name == 'mysql':
+        sentencia = 'ALTER TABLE {} ADD {} {} ({}), ALGORITHM=INPLACE, LOCK=NONE'.format(q(tabla), tipo, q(nombre), lista)
+    else:
+        sentencia = 'CREATE {} {} ON {} ({})'.format(tipo, q(nombre), q(tabla), lista)
+    conexion.exec_driver_sql(sentencia)
+    return True
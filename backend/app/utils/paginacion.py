@@ -0,0 +1,99 @@
+from flask import request, current_app
+
+class ParametroInvalido(ValueError):
+    """
+    Error en un parámetro de la query string. Las rutas lo responden con 400.
+    """
+
+def leer_entero(nombre, minimo=None):
+    """
+    Lee un parámetro entero opcional de la query string.
+
+    Args:
+        nombre (str): Nombre del parámetro.
+        minimo (int): Valor mínimo aceptado (opcional).
+
+    Returns:
+        int: Valor del parámetro o None si no se envió.
+    """
+    valor = request.args.get(nombre)
+    # Parámetro ausente o vacío
+    if valor is None or valor == '':
+        return None
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ParametroInvalido('El parámetro "{}" debe ser un número entero'.format(nombre))
+    # Validar el mínimo permitido
+    if minimo is not None and numero < minimo:
+        raise ParametroInvalido('El parámetro "{}" debe ser mayor o igual a {}'.format(nombre, minimo))
+    return numero
+
+def leer_parametros_paginacion():
+    """
+    Lee los parámetros `limit` y `after` de la query string.
+
+    El límite por defecto y el máximo se toman de la configuración
+    (PAGINATION_DEFAULT_LIMIT y PAGINATION_MAX_LIMIT).
+
+    Returns:
+        tuple: (limit, after)
+    """
+    limite_defecto = current_app.config.get('PAGINATION_DEFAULT_LIMIT', 100)
+    limite_maximo = current_app.config.get('PAGINATION_MAX_LIMIT', 1000)
+    limit = leer_entero('limit', minimo=1)
+    after = leer_entero('after')
+    # Sin límite explícito se usa el de la configuración
+    if limit is None:
+        limit = limite_defecto
+    # El límite nunca supera el máximo configurado
+    return min(limit, limite_maximo), after
+
+def paginar(query, columna_pk):
+    """
+    Pagina una consulta por keyset sobre la clave primaria.
+
+    En lugar de OFFSET se filtra `pk > after`, de modo que la base de datos
+    recorre el índice de la clave primaria y el costo de cada página no
+    depende de su posición en la tabla.
+
+    Args:
+        query (Query): Consulta base sin ordenar.
+        columna_pk (Column): Columna de clave primaria del modelo.
+
+    Returns:
+        tuple: (items de la página, cursor siguiente o None si es la última)
+    """
+    limit, after = leer_parametros_paginacion()
+    # Continuar desde el cursor recibido
+    if after is not None:
+        query = query.filter(columna_pk > after)
+    # Se pide un registro extra para saber si existe una página siguiente
+    items = query.order_by(columna_pk).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    # El cursor es la clave primaria del último registro devuelto
+    return items, getattr(items[-1], columna_pk.key)
+
+def paginar_lista(filas, campo_pk):
+    """
+    Pagina por keyset una lista en memoria ordenada por clave primaria.
+
+    Args:
+        filas (list): Diccionarios ordenados por `campo_pk`.
+        campo_pk (str): Nombre del campo de clave primaria.
+
+    Returns:
+        tuple: (items de la página, cursor siguiente o None si es la última)
+    """
+    limit, after = leer_parametros_paginacion()
+    # Saltar los registros hasta el cursor recibido
+    inicio = 0
+    if after is not None:
+        inicio = next((i for i, fila in enumerate(filas) if fila[campo_pk] > after), len(filas))
+    items = filas[inicio:inicio + limit]
+    # Hay página siguiente si quedan registros después de esta
+    if inicio + limit >= len(filas):
+        return items, None
+    return items, items[-1][campo_pk]
@@ -0,0 +1,135 @@
+import cProfile
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from flask import request, g
+
+# Desde Python 3.12 solo puede haber un cProfile activo por proceso: con
+# varios hilos atendiendo solicitudes se perfila una a la vez y las que
+# llegan mientras tanto no se perfilan
+_perfil_activo = threading.Lock()
+
+class MuestreadorPila:
+    """
+    Toma muestras periódicas de la pila de un hilo y las acumula en formato
+    "collapsed" (una línea `func;func;func N` por pila), el que leen
+    flamegraph.pl y speedscope.
+    """
+
+    def __init__(self, id_hilo, intervalo):
+        self.id_hilo = id_hilo
+        self.intervalo = intervalo
+        self.pilas = Counter()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+
+    def iniciar(self):
+        self._hilo.start()
+
+    def detener(self):
+        self._detener.set()
+        self._hilo.join()
+
+    def _muestrear(self):
+        while not self._detener.wait(self.intervalo):
+            frame = sys._current_frames().get(self.id_hilo)
+            pila = []
+            while frame is not None:
+                codigo = frame.f_code
+                pila.append('{} ({}:{})'.format(codigo.co_name, os.path.basename(codigo.co_filename), codigo.co_firstlineno))
+                frame = frame.f_back
+            if pila:
+                self.pilas[';'.join(reversed(pila))] += 1
+
+    def colapsado(self):
+        return ''.join('{} {}\n'.format(pila, n) for pila, n in self.pilas.most_common())
+
+def perfilado_solicitado(config):
+    """
+    Indica si la solicitud actual debe perfilarse: por el header configurado
+    (si PROFILE_ENABLED) o por muestreo (PROFILE_SAMPLE_RATE).
+
+    Args:
+        config (Config): Configuración de la app.
+
+    Returns:
+        bool: True si se debe perfilar la solicitud.
+    """
+    if config.get('PROFILE_ENABLED') and request.headers.get(config.get('PROFILE_HEADER', 'X-Requiem-Profile'), '').lower() in ('1', 'true', 'si'):
+        return True
+    tasa = config.get('PROFILE_SAMPLE_RATE', 0.0)
+    return tasa > 0 and random.random() < tasa
+
+def _nombre_archivo(directorio):
+    # blueprint.endpoint-fecha-milisegundos-pid (ej. pacientes.create_paciente-20240501-103000-123-4567)
+    etiqueta = (request.endpoint or 'sin_ruta').replace('/', '_')
+    ahora = time.time()
+    marca = '{}-{:03d}'.format(time.strftime('%Y%m%d-%H%M%S', time.localtime(ahora)), int(ahora * 1000) % 1000)
+    return os.path.join(directorio, '{}-{}-{}'.format(etiqueta, marca, os.getpid()))
+
+def registrar_perfilado(app):
+    """
+    Registra en la app el perfilado por solicitud.
+
+    Cuando una solicitud se perfila, la vista corre bajo cProfile y bajo un
+    muestreador de pila. Al terminar se escriben en PROFILE_DIR:
+        <blueprint>.<endpoint>-<fecha>-<pid>.prof       (pstats / snakeviz)
+        <blueprint>.<endpoint>-<fecha>-<pid>.collapsed  (flamegraph / speedscope)
+    y el nombre del archivo se devuelve en el header X-Requiem-Profile-File.
+
+    Args:
+        app (Flask): Aplicación.
+    """
+    directorio = app.config.get('PROFILE_DIR')
+    intervalo = app.config.get('PROFILE_SAMPLE_INTERVAL', 0.001)
+
+    @app.before_request
+    def iniciar_perfilado():
+        if not perfilado_solicitado(app.config):
+            return
+        if not _perfil_activo.acquire(blocking=False):
+            return
+        try:
+            perfil = cProfile.Profile()
+            perfil.enable()
+        except ValueError:
+            # Otra herramienta de perfilado está activa en el proceso
+            _perfil_activo.release()
+            return
+        g.perfil = perfil
+        g.muestreador = MuestreadorPila(threading.get_ident(), intervalo)
+        g.muestreador.iniciar()
+
+    def detener_perfilado():
+        perfil = g.pop('perfil', None)
+        if perfil is None:
+            return None
+        try:
+            perfil.disable()
+        finally:
+            _perfil_activo.release()
+        muestreador = g.pop('muestreador')
+        muestreador.detener()
+        # Escribir ambos formatos con el mismo nombre base
+        os.makedirs(directorio, exist_ok=True)
+        base = _nombre_archivo(directorio)
+        perfil.dump_stats(base + '.prof')
+        with open(base + '.collapsed', 'w') as archivo:
+            archivo.write(muestreador.colapsado())
+        return os.path.basename(base)
+
+    @app.after_request
+    def guardar_perfilado(response):
+        # Se registra último, por lo que corre primero entre los after_request
+        nombre = detener_perfilado()
+        if nombre:
+            response.headers['X-Requiem-Profile-File'] = nombre
+        return response
+
+    @app.teardown_request
+    def cerrar_perfilado(error=None):
+        # Si la vista lanzó una excepción no pasa por after_request
+        detener_perfilado()
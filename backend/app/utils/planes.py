@@ -0,0 +1,170 @@
+import json
+import re
+from contextlib import contextmanager
+from sqlalchemy import event, select, String
+from sqlalchemy.engine import Engine
+
+# Sentencias con plan de ejecución interesante (los INSERT no recorren tablas)
+SENTENCIAS_EXPLICABLES = ('SELECT', 'UPDATE', 'DELETE')
+
+# SQLite: "SCAN pacientes" o "SCAN pacientes AS p" es un recorrido de la tabla sin índice
+_RECORRIDO_SQLITE = re.compile(r'^SCAN (\S+)(?: AS \S+)?$')
+
+@contextmanager
+def capturar_sentencias():
+    """
+    Registra las sentencias SQL ejecutadas dentro del bloque, con sus
+    parámetros, en el orden en que se ejecutan y sin repetir la misma forma.
+
+    Yields:
+        list: Tuplas (sentencia, parámetros) que se completan durante el bloque.
+    """
+    sentencias = []
+    vistas = set()
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if executemany or statement in vistas:
+            return
+        vistas.add(statement)
+        sentencias.append((statement, parameters))
+
+    event.listen(Engine, 'before_cursor_execute', registrar)
+    try:
+        yield sentencias
+    finally:
+        event.remove(Engine, 'before_cursor_execute', registrar)
+
+def explicar(conexion, sentencia, parametros):
+    """
+    Obtiene el plan de ejecución de una sentencia (EXPLAIN en MySQL,
+    EXPLAIN QUERY PLAN en SQLite) y marca los pasos que recorren una tabla
+    completa sin usar un índice.
+
+    Args:
+        conexion (Connection): Conexión a la base.
+        sentencia (str): Sentencia SQL tal como la envió el ORM.
+        parametros (tuple|dict): Parámetros de la sentencia, en el formato del driver.
+
+    Returns:
+        list: Un dict por paso del plan con 'tabla', 'detalle' y 'recorrido' (True si es una lectura completa).
+    """
+    if conexion.dialect.name == 'sqlite':
+        filas = conexion.exec_driver_sql('EXPLAIN QUERY PLAN ' + sentencia, parametros).all()
+        pasos = []
+        for fila in filas:
+            detalle = fila[-1]
+            recorrido = _RECORRIDO_SQLITE.match(detalle)
+            pasos.append({'tabla': recorrido.group(1) if recorrido else None, 'detalle': detalle,
+                          'recorrido': recorrido is not None})
+        return pasos
+    # MySQL: type ALL es una lectura completa de la tabla
+    filas = conexion.exec_driver_sql('EXPLAIN ' + sentencia, parametros).mappings().all()
+    return [{'tabla': fila['table'],
+             'detalle': 'type={} key={} rows={} {}'.format(fila['type'], fila['key'], fila['rows'], fila['Extra'] or '').strip(),
+             'recorrido': fila['type'] == 'ALL'}
+            for fila in filas]
+
+def es_explicable(sentencia):
+    """
+    Args:
+        sentencia (str): Sentencia SQL.
+
+    Returns:
+        bool: True si vale la pena pedir su plan (SELECT, UPDATE o DELETE).
+    """
+    return sentencia.lstrip().upper().startswith(SENTENCIAS_EXPLICABLES)
+
+def filtra(sentencia):
+    """
+    Una lectura completa solo es un problema si la sentencia filtra filas:
+    los listados y catálogos sin WHERE leen la tabla (o una página) a propósito.
+
+    Args:
+        sentencia (str): Sentencia SQL.
+
+    Returns:
+        bool: True si la sentencia tiene una cláusula WHERE.
+    """
+    return re.search(r'\bWHERE\b', sentencia, re.IGNORECASE) is not None
+
+@contextmanager
+def transaccion_descartada(engine, session_local):
+    """
+    Ejecuta el bloque con las sesiones de la app atadas a una sola conexión
+    cuya transacción se descarta al salir: las escrituras de las vistas
+    (commit incluido) no quedan en la base.
+
+    Las sesiones se unen a la transacción de la conexión sin confirmarla
+    (join_transaction_mode='rollback_only'); un rollback de la vista la
+    descarta antes de tiempo y las sentencias siguientes abren otra, que
+    también se descarta.
+
+    Args:
+        engine (Engine): Motor de la base principal.
+        session_local (scoped_session): Sesión de la app.
+
+    Yields:
+        Connection: Conexión de la transacción (para explicar las sentencias antes de descartarla).
+    """
+    conexion = engine.connect()
+    conexion.begin()
+    session_local.remove()
+    session_local.configure(bind=conexion, join_transaction_mode='rollback_only')
+    try:
+        yield conexion
+    finally:
+        session_local.remove()
+        session_local.configure(bind=engine, join_transaction_mode='conservative_savepoint')
+        conexion.rollback()
+        conexion.close()
+
+def cuerpo_de_muestra(conexion, tabla, id):
+    """
+    Arma el cuerpo JSON de un alta o modificación a partir de un registro
+    existente: sus columnas salvo la clave primaria, con los textos cambiados
+    para no chocar con las restricciones UNIQUE.
+
+    Args:
+        conexion (Connection): Conexión a la base.
+        tabla (Table): Tabla del recurso.
+        id (int): Clave primaria del registro de muestra.
+
+    Returns:
+        dict: Cuerpo para la solicitud (vacío si el registro no existe).
+    """
+    columna_pk = list(tabla.primary_key.columns)[0]
+    fila = conexion.execute(select(tabla).where(columna_pk == id)).mappings().first()
+    if fila is None:
+        return {}
+    cuerpo = {}
+    for columna in tabla.columns:
+        if columna is columna_pk:
+            continue
+        valor = fila[columna.key]
+        if isinstance(valor, str) and isinstance(columna.type, String):
+            valor = (valor[:(columna.type.length or 60) - 2] + ' x')
+        cuerpo[columna.key] = valor
+    return cuerpo
+
+def solicitud_de_muestra(conexion, tablas, regla, ruta, id):
+    """
+    Argumentos del cliente de pruebas para reproducir una ruta de escritura
+    (o de lectura por POST) con datos de muestra.
+
+    Args:
+        conexion (Connection): Conexión a la base.
+        tablas (dict): Tablas del MetaData de los modelos, por nombre.
+        regla (Rule): Regla de la ruta.
+        ruta (str): Ruta con los parámetros reemplazados.
+        id (int): Valor de los parámetros enteros.
+
+    Returns:
+        dict: Argumentos para el método del cliente (json, data, content_type).
+    """
+    if regla.rule.endswith('/lote'):
+        return {'json': {'ids': [id, id + 1]}}
+    tabla = tablas.get(ruta.strip('/').split('/')[0])
+    cuerpo = cuerpo_de_muestra(conexion, tabla, id) if tabla is not None else {}
+    if regla.rule.endswith('/importar'):
+        return {'data': json.dumps(cuerpo), 'content_type': 'application/x-ndjson'}
+    return {'json': cuerpo}
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+class QueuePoolMedido(QueuePool):
+    """
+    QueuePool que además mide cuánto esperan las solicitudes por una conexión.
+
+    Registra la cantidad de entregas (checkouts), el tiempo total y máximo de
+    espera y la cantidad de esperas que terminaron en timeout. Los contadores
+    son por proceso y se leen con `estadisticas()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock_metricas = threading.Lock()
+        self._reiniciar_metricas()
+
+    def _reiniciar_metricas(self):
+        self._checkouts = 0
+        self._timeouts = 0
+        self._espera_total = 0.0
+        self._espera_maxima = 0.0
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conexion = super()._do_get()
+        except PoolTimeout:
+            with self._lock_metricas:
+                self._timeouts += 1
+            raise
+        espera = time.perf_counter() - inicio
+        with self._lock_metricas:
+            self._checkouts += 1
+            self._espera_total += espera
+            if espera > self._espera_maxima:
+                self._espera_maxima = espera
+        return conexion
+
+    def estadisticas(self, reiniciar=False):
+        """
+        Devuelve el estado actual del pool y las métricas de espera.
+
+        Args:
+            reiniciar (bool): Poner en cero los contadores después de leerlos.
+
+        Returns:
+            dict: Tamaño, conexiones en uso, libres y de overflow, y tiempos de espera en ms.
+        """
+        with self._lock_metricas:
+            checkouts = self._checkouts
+            datos = {
+                'size': self.size(),
+                'checked_out': self.checkedout(),
+                'idle': self.checkedin(),
+                'overflow': max(self.overflow(), 0),
+                'max_overflow': self._max_overflow,
+                'timeout': self._timeout,
+                'checkouts': checkouts,
+                'timeouts': self._timeouts,
+                'wait_ms_total': round(self._espera_total * 1000, 3),
+                'wait_ms_avg': round(self._espera_total * 1000 / checkouts, 3) if checkouts else 0.0,
+                'wait_ms_max': round(self._espera_maxima * 1000, 3),
+            }
+            if reiniciar:
+                self._reiniciar_metricas()
+        return datos
+
+def en_memoria(uri):
+    """
+    Args:
+        uri (str): URI de la base de datos.
+
+    Returns:
+        bool: True si es una base SQLite en memoria (sqlite://, :memory: o mode=memory).
+    """
+    url = make_url(uri)
+    if url.get_backend_name() != 'sqlite':
+        return False
+    return url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory'
+
+def opciones_pool(config, uri):
+    """
+    Arma los argumentos de create_engine para el pool a partir de la configuración.
+
+    Una base SQLite en memoria existe solo dentro de su conexión: un pool con
+    varias conexiones vería una base vacía distinta en cada una. Para esas
+    bases no se arma el pool y SQLAlchemy elige el suyo (SingletonThreadPool).
+
+    Args:
+        config (object|dict): Clase Config o app.config.
+        uri (str): URI de la base de datos del motor.
+
+    Returns:
+        dict: Argumentos de create_engine (poolclass, pool_size, max_overflow, ...).
+    """
+    if en_memoria(uri):
+        return {}
+    leer = config.get if isinstance(config, dict) else (lambda clave, defecto=None: getattr(config, clave, defecto))
+    return {
+        'poolclass': QueuePoolMedido,
+        'pool_size': leer('DB_POOL_SIZE', 10),
+        'max_overflow': leer('DB_MAX_OVERFLOW', 20),
+        'pool_timeout': leer('DB_POOL_TIMEOUT', 10),
+        'pool_recycle': leer('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': leer('DB_POOL_PRE_PING', True),
+    }
+
+# SQLAlchemy nombra el logger del pool según su clase ("app.utils.pool.QueuePoolMedido"),
+# que queda debajo del logger de la app: en modo debug cada checkout se registraría
+# en el log de Flask. Se dejan pasar solo las advertencias y errores, como con QueuePool.
+logging.getLogger('{}.{}'.format(__name__, QueuePoolMedido.__name__)).setLevel(logging.WARNING)
@@ -0,0 +1,89 @@
+from flask import current_app
+from marshmallow import fields
+from sqlalchemy import inspect, Integer, String, Boolean
+from app.utils.paginacion import paginar
+
+# Campos de Marshmallow cuyo dump devuelve el mismo valor que trae la base
+# para una columna del tipo indicado
+CAMPOS_DIRECTOS = {fields.Integer: Integer, fields.String: String, fields.Boolean: Boolean}
+
+class Proyeccion:
+    """
+    Columnas de un modelo que corresponden uno a uno con los campos de salida
+    de su esquema. Permite consultar solo esas columnas y armar la respuesta
+    directo de las tuplas de la base, sin instanciar objetos del ORM ni pasar
+    por el dump de Marshmallow.
+    """
+
+    def __init__(self, claves, columnas):
+        self.claves = claves
+        self.columnas = columnas
+
+    def a_dicts(self, filas):
+        """
+        Args:
+            filas (list): Tuplas con los valores de `columnas`, en el mismo orden.
+                Las columnas extra al final (ej. la clave primaria para el cursor) se ignoran.
+
+        Returns:
+            list: Diccionarios con las claves del esquema.
+        """
+        claves = self.claves
+        return [dict(zip(claves, fila)) for fila in filas]
+
+def proyeccion_plana(schema, modelo):
+    """
+    Devuelve la proyección de un esquema si es plana: todos sus campos de salida
+    son columnas del modelo de tipo entero, texto o booleano (con el campo del
+    mismo tipo), sin métodos, anidados ni formatos.
+
+    Args:
+        schema (Schema): Instancia del esquema de Marshmallow.
+        modelo (Base): Modelo de SQLAlchemy.
+
+    Returns:
+        Proyeccion|None: La proyección, o None si el esquema transforma algún valor.
+    """
+    columnas_modelo = inspect(modelo).columns
+    claves, columnas = [], []
+    for nombre, campo in schema.dump_fields.items():
+        atributo = campo.attribute or nombre
+        tipo = CAMPOS_DIRECTOS.get(type(campo))
+        if tipo is None or atributo not in columnas_modelo or not isinstance(columnas_modelo[atributo].type, tipo):
+            return None
+        claves.append(campo.data_key or nombre)
+        columnas.append(getattr(modelo, atributo))
+    return Proyeccion(claves, columnas)
+
+def filas_habilitadas():
+    # Serializar directo de las filas (SERIALIZE_FROM_ROWS); se puede apagar para comparar
+    return current_app.config.get('SERIALIZE_FROM_ROWS', True)
+
+def pagina_serializada(session, modelo, columna_pk, serializador):
+    """
+    Consulta y serializa una página de un listado (ver app.utils.paginacion).
+
+    Si el esquema es una proyección plana se consultan solo sus columnas y la
+    página se arma con las tuplas; si no, se cargan los objetos (solo las
+    columnas del serializador si es parcial) y se usa el serializador compilado
+    del esquema. El resultado es el mismo en ambos casos.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        modelo (Base): Modelo a listar.
+        columna_pk (Column): Clave primaria, usada para ordenar y para `after`.
+        serializador (Serializador): Ver app.utils.serializadores.
+
+    Returns:
+        tuple: (registros serializados, cursor siguiente o None)
+    """
+    proyeccion = serializador.proyeccion
+    if proyeccion is not None and filas_habilitadas():
+        columnas = proyeccion.columnas
+        # El cursor necesita la clave primaria aunque no se haya pedido (?fields=)
+        if columna_pk.key not in [columna.key for columna in columnas]:
+            columnas = columnas + [columna_pk]
+        filas, siguiente = paginar(session.query(*columnas), columna_pk)
+        return proyeccion.a_dicts(filas), siguiente
+    items, siguiente = paginar(session.query(modelo).options(*serializador.opciones_carga()), columna_pk)
+    return serializador.lista(items), siguiente
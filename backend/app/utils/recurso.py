@@ -0,0 +1,380 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy import select, bindparam, inspect, String
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from app.configs.database import SessionLocal
+from app.utils.paginacion import paginar_lista, ParametroInvalido
+from app.utils.proyeccion import pagina_serializada
+from app.utils.serializadores import compilar_serializador, serializador_solicitado
+from app.utils.streaming import streaming_solicitado, respuesta_streaming
+from app.utils.versiones import con_etag, incrementa_version
+from app.utils.cache import obtener_cache, registrar_catalogo
+from app.utils.lotes import lote_solicitado, leer_ids, lote_serializado, respuesta_lote
+from app.utils.validacion import validar_referencias, traducir_integridad
+from app.utils.busqueda import buscar, leer_limite_busqueda
+
+class Recurso:
+    """
+    Genera las rutas CRUD de una entidad a partir de su modelo y su esquema.
+
+    Cada recurso registra en su blueprint las vistas:
+        GET    /<url>                 get_<plural> (con ?ids=1,2,3, varios por ID)
+        POST   /<url>/lote            get_<plural>_by_ids (IDs en el cuerpo)
+        GET    /<url>/<int:id>        get_<singular>
+        GET    /<url>/<string:nombre> get_<singular>_by_<singular>
+        POST   /<url>                 create_<singular>
+        PUT    /<url>/<int:id>        update_<singular>
+        DELETE /<url>/<int:id>        delete_<singular>
+
+    Todas comparten la misma implementación: paginación por keyset, modo
+    streaming, campos a devolver con ?fields= y relaciones anidadas con ?expand=, consultas por ID y por nombre construidas una sola vez,
+    validación de claves foráneas en una pasada y traducción de IntegrityError.
+    Los catálogos (`catalogo=True`) además se leen desde la caché en memoria y
+    responden con ETag. Con `busqueda=True` la vista por nombre busca por
+    palabras en el índice de búsqueda (ver app.utils.busqueda) en lugar de
+    pedir el nombre exacto. Las rutas propias de una entidad se agregan al
+    blueprint con el decorador `ruta`.
+    """
+
+    def __init__(self, nombre, modelo, schema, singular, etiqueta, femenino=False,
+                 url=None, plural=None, catalogo=False, referencias=None,
+                 restricciones=None, requeridos_actualizacion=None, busqueda=False):
+        """
+        Args:
+            nombre (str): Nombre del blueprint.
+            modelo (Base): Modelo de SQLAlchemy.
+            schema (type): Clase del esquema de Marshmallow del modelo.
+            singular (str): Nombre en singular para las vistas (ej. 'doc_tipo').
+            etiqueta (str): Nombre legible en minúsculas (ej. 'tipo de documento').
+            femenino (bool): Si la etiqueta es femenina ('la', 'encontrada', ...).
+            url (str): Ruta base; por defecto '/<nombre>'.
+            plural (str): Nombre en plural para las vistas; por defecto el nombre.
+            catalogo (bool): Lecturas desde la caché de catálogos y con ETag.
+            referencias (list): Claves foráneas (campo, modelo, mensaje de error).
+            restricciones (list): Restricciones propias de la tabla (fragmentos,
+                mensaje); se revisan antes que las generadas.
+            requeridos_actualizacion (list): Campos obligatorios al actualizar;
+                por defecto el nombre.
+            busqueda (bool): La vista por nombre busca por palabras.
+        """
+        self.nombre = nombre
+        self.modelo = modelo
+        self.tabla = modelo.__tablename__
+        self.singular = singular
+        self.plural = plural or nombre
+        self.url = url or '/' + nombre
+        self.catalogo = catalogo
+        self.busqueda = busqueda
+        if catalogo:
+            registrar_catalogo(modelo)
+        self.referencias = referencias or []
+        # Esquemas para serializar y para validar la entrada (ignora campos desconocidos)
+        self.schema = schema()
+        self.schema_carga = schema(unknown=EXCLUDE)
+        # Serializador compilado del esquema (y sus columnas para armar los listados de las filas)
+        self.serializar = compilar_serializador(self.schema, modelo)
+        # Clave primaria y columna única de texto (el "nombre" de la entidad)
+        self.columna_pk = inspect(modelo).primary_key[0]
+        self.columna_nombre = next(c for c in inspect(modelo).columns if c.unique and isinstance(c.type, String))
+        self.campos_requeridos = [n for n, f in self.schema_carga.fields.items() if f.required]
+        self.requeridos_actualizacion = requeridos_actualizacion or [self.columna_nombre.key]
+        # Consultas construidas una sola vez: SQLAlchemy reutiliza su compilación
+        self.consulta_por_id = select(modelo).where(self.columna_pk == bindparam('id'))
+        self.consulta_por_nombre = select(modelo).where(self.columna_nombre == bindparam('nombre'))
+        # Mensajes según el género de la etiqueta
+        articulo, sufijo = ('la', 'a') if femenino else ('el', 'o')
+        titulo = etiqueta[0].upper() + etiqueta[1:]
+        self.mensajes = {
+            'no_encontrado': '{} no encontrad{}'.format(titulo, sufijo),
+            'ya_existe': '{} {} ya existe'.format(articulo.capitalize(), etiqueta),
+            'creado': '{} cread{} correctamente'.format(titulo, sufijo),
+            'actualizado': '{} actualizad{} correctamente'.format(titulo, sufijo),
+            'eliminado': '{} eliminad{} correctamente'.format(titulo, sufijo),
+            'en_uso': '{} {} tiene registros asociados'.format(articulo.capitalize(), etiqueta),
+        }
+        # Restricciones de la tabla y su mensaje (ver traducir_integridad)
+        columna = self.columna_nombre.key
+        self.restricciones = list(restricciones or [])
+        self.restricciones += [(('{}.{}'.format(self.tabla, columna), "'{}'".format(columna)), self.mensajes['ya_existe'])]
+        self.restricciones += [(('(`{}`)'.format(campo),), mensaje) for campo, _, mensaje in self.referencias]
+        # Tablas cuya versión cambia con cada escritura del recurso
+        self.tablas_escritura = (self.tabla,)
+        self.blueprint = self._crear_blueprint()
+
+    def _crear_blueprint(self):
+        bp = Blueprint(self.nombre, __name__)
+        # Catálogos con ETag; en las vistas de un registro el 304 requiere que exista
+        if self.catalogo:
+            lectura = con_etag(self.modelo)
+            lectura_id = con_etag(self.modelo, lambda cache, id: cache.por_id(id))
+            lectura_nombre = con_etag(self.modelo, lambda cache, nombre: cache.por_nombre(nombre))
+        else:
+            lectura = lectura_id = lectura_nombre = (lambda vista: vista)
+        escritura = incrementa_version(*self.tablas_escritura)
+        s, p = self.singular, self.plural
+        bp.add_url_rule(self.url, 'get_' + p, lectura(self.listar), methods=['GET'])
+        bp.add_url_rule(self.url + '/lote', 'get_{}_by_ids'.format(p), self.obtener_lote, methods=['POST'])
+        bp.add_url_rule(self.url + '/<int:id>', 'get_' + s, lectura_id(self.obtener), methods=['GET'])
+        por_nombre = self.buscar_por_palabras if self.busqueda else lectura_nombre(self.obtener_por_nombre)
+        bp.add_url_rule(self.url + '/<string:nombre>', 'get_{}_by_{}'.format(s, s), por_nombre, methods=['GET'])
+        bp.add_url_rule(self.url, 'create_' + s, escritura(self.crear), methods=['POST'])
+        bp.add_url_rule(self.url + '/<int:id>', 'update_' + s, escritura(self.actualizar), methods=['PUT'])
+        bp.add_url_rule(self.url + '/<int:id>', 'delete_' + s, escritura(self.eliminar), methods=['DELETE'])
+        return bp
+
+    def ruta(self, ruta, methods, escritura=False):
+        """
+        Decorador para agregar al blueprint una vista propia de la entidad.
+
+        Args:
+            ruta (str): Ruta relativa a la base del recurso (ej. '/importar').
+            methods (list): Métodos HTTP de la vista.
+            escritura (bool): Si la vista escribe en la tabla (incrementa su versión).
+        """
+        def decorador(vista):
+            registrada = incrementa_version(*self.tablas_escritura)(vista) if escritura else vista
+            self.blueprint.add_url_rule(self.url + ruta, vista.__name__, registrada, methods=methods)
+            return vista
+        return decorador
+
+    def _error(self, mensaje, codigo):
+        return jsonify({'status': 'error', 'message': mensaje}), codigo
+
+    def _validar(self, session, data, requeridos, partial=False):
+        # Devuelve (valores cargados, None) o (None, respuesta de error)
+        if not isinstance(data, dict):
+            return None, self._error('El cuerpo debe ser un objeto JSON', 400)
+        for campo in requeridos:
+            if campo not in data:
+                return None, self._error('Falta el campo "{}"'.format(campo), 400)
+        try:
+            valores = self.schema_carga.load(data, partial=partial)
+        except ValidationError as e:
+            return None, (jsonify({'status': 'error', 'message': 'Datos inválidos', 'errors': e.messages}), 400)
+        # Claves foráneas en una sola pasada (desde la caché de catálogos). Se
+        # validan los valores recibidos, no los cargados: el esquema trunca 3.7 a 3
+        claves = {campo: data[campo] for campo, _, _ in self.referencias if campo in data}
+        error = validar_referencias(session, claves, self.referencias)
+        if error:
+            return None, self._error(error, 400)
+        valores.update(claves)
+        return valores, None
+
+    def listar(self):
+        """
+        Devuelve una página de registros (ver app.utils.paginacion) o el
+        listado completo transmitido por lotes con ?stream=1.
+        """
+        # Varios registros por ID (?ids=1,2,3)
+        if lote_solicitado():
+            return self.obtener_lote()
+        session = SessionLocal()
+        try:
+            # Campos pedidos con ?fields= (por defecto todos)
+            serializar = serializador_solicitado(self.serializar)
+            # Modo streaming: el listado completo se transmite por lotes
+            if streaming_solicitado():
+                return respuesta_streaming(self.modelo, self.columna_pk, serializar)
+            if self.catalogo and not serializar.relaciones:
+                # Los registros de la caché ya están serializados: solo se recortan
+                items, siguiente = paginar_lista(obtener_cache(self.modelo).filas(), self.columna_pk.key)
+                items = [serializar.recortar(item) for item in items]
+            else:
+                # Consultar y serializar una página (paginación por keyset)
+                items, siguiente = pagina_serializada(session, self.modelo, self.columna_pk, serializar)
+            return jsonify({
+                'status': 'success',
+                'count': len(items),
+                'next': siguiente,
+                'data': items
+            }), 200
+        except ParametroInvalido as e:
+            # Parámetros de paginación inválidos
+            return self._error(str(e), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def _obtener_uno(self, consulta, parametros, buscar_en_cache):
+        session = SessionLocal()
+        try:
+            # Campos pedidos con ?fields= (por defecto todos)
+            serializar = serializador_solicitado(self.serializar)
+            if self.catalogo and not serializar.relaciones:
+                # El registro de la caché ya está serializado: solo se recorta
+                registro = buscar_en_cache(obtener_cache(self.modelo))
+                registro = serializar.recortar(registro) if registro is not None else None
+            else:
+                # Solo se cargan las columnas de los campos pedidos
+                consulta = consulta.options(*serializar.opciones_carga())
+                registro = session.execute(consulta, parametros).scalar_one_or_none()
+                registro = serializar(registro) if registro is not None else None
+            # Verificar si el registro existe
+            if registro is None:
+                return self._error(self.mensajes['no_encontrado'], 404)
+            return jsonify({'status': 'success', 'data': registro}), 200
+        except ParametroInvalido as e:
+            # Parámetro fields inválido
+            return self._error(str(e), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def obtener_lote(self):
+        """
+        Devuelve varios registros por ID con una sola consulta IN, en el orden
+        pedido y con la lista de los que no existen (ver app.utils.lotes).
+        """
+        session = SessionLocal()
+        try:
+            # Campos pedidos con ?fields= (por defecto todos)
+            serializar = serializador_solicitado(self.serializar)
+            ids = leer_ids()
+            if self.catalogo and not serializar.relaciones:
+                # Los registros de la caché ya están serializados: solo se recortan
+                cache = obtener_cache(self.modelo)
+                registros = {}
+                for id in ids:
+                    fila = cache.por_id(id)
+                    if fila is not None:
+                        registros[id] = serializar.recortar(fila)
+            else:
+                registros = lote_serializado(session, self.modelo, self.columna_pk, serializar, ids)
+            return respuesta_lote(ids, registros)
+        except ParametroInvalido as e:
+            # IDs, fields o expand inválidos
+            return self._error(str(e), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def obtener(self, id):
+        """
+        Devuelve un registro por ID.
+        """
+        return self._obtener_uno(self.consulta_por_id, {'id': id}, lambda cache: cache.por_id(id))
+
+    def obtener_por_nombre(self, nombre):
+        """
+        Devuelve un registro por su columna única de texto.
+        """
+        return self._obtener_uno(self.consulta_por_nombre, {'nombre': nombre}, lambda cache: cache.por_nombre(nombre))
+
+    def buscar_por_palabras(self, nombre):
+        """
+        Busca registros por palabras del nombre en el índice de búsqueda,
+        ordenados por relevancia y hasta ?limit= resultados.
+        """
+        session = SessionLocal()
+        try:
+            # Campos pedidos con ?fields= (por defecto todos)
+            serializar = serializador_solicitado(self.serializar)
+            registros = buscar(session, self.modelo, nombre, leer_limite_busqueda(),
+                               opciones=serializar.opciones_carga())
+            return jsonify({
+                'status': 'success',
+                'count': len(registros),
+                'data': serializar.lista(registros)
+            }), 200
+        except ParametroInvalido as e:
+            # Parámetros de búsqueda inválidos
+            return self._error(str(e), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def crear(self):
+        """
+        Crea un registro. Los duplicados los detectan las restricciones UNIQUE.
+        """
+        session = SessionLocal()
+        try:
+            valores, error = self._validar(session, request.json, self.campos_requeridos)
+            if error:
+                return error
+            # Crear la nueva instancia, agregarla a la sesión y confirmar la transacción
+            nuevo = self.modelo(**valores)
+            session.add(nuevo)
+            session.commit()
+            return jsonify({
+                'status': 'success',
+                'message': self.mensajes['creado'],
+                'data': self.serializar(nuevo)
+            }), 201
+        except IntegrityError as e:
+            # Registro duplicado u otra restricción violada
+            session.rollback()
+            return self._error(traducir_integridad(e, self.restricciones), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            session.rollback()
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def actualizar(self, id):
+        """
+        Actualiza los campos enviados de un registro. El nombre (o los campos
+        de `requeridos_actualizacion`) es obligatorio.
+        """
+        session = SessionLocal()
+        try:
+            valores, error = self._validar(session, request.json, self.requeridos_actualizacion, partial=True)
+            if error:
+                return error
+            # Consultar el registro por ID en la base de datos
+            registro = session.get(self.modelo, id)
+            if not registro:
+                return self._error(self.mensajes['no_encontrado'], 404)
+            # Actualizar los campos y confirmar la transacción
+            for campo, valor in valores.items():
+                setattr(registro, campo, valor)
+            session.commit()
+            return jsonify({
+                'status': 'success',
+                'message': self.mensajes['actualizado'],
+                'data': self.serializar(registro)
+            }), 200
+        except IntegrityError as e:
+            # Registro duplicado u otra restricción violada
+            session.rollback()
+            return self._error(traducir_integridad(e, self.restricciones), 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            session.rollback()
+            return self._error(str(e), 500)
+        finally:
+            session.close()
+
+    def eliminar(self, id):
+        """
+        Elimina un registro por ID.
+        """
+        session = SessionLocal()
+        try:
+            # Consultar el registro por ID en la base de datos
+            registro = session.get(self.modelo, id)
+            if not registro:
+                return self._error(self.mensajes['no_encontrado'], 404)
+            # Eliminar el registro y confirmar la transacción
+            session.delete(registro)
+            session.commit()
+            return jsonify({'status': 'success', 'message': self.mensajes['eliminado']}), 200
+        except IntegrityError:
+            # El registro está referenciado por otras tablas
+            session.rollback()
+            return self._error(self.mensajes['en_uso'], 400)
+        except SQLAlchemyError as e:
+            # Manejo de errores de SQLAlchemy
+            session.rollback()
+            return self._error(str(e), 500)
+        finally:
+            session.close()
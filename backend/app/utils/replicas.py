@@ -0,0 +1,118 @@
+import random
+import time
+from flask import request, g, has_request_context
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+# Cookie con la hora de la última escritura del cliente
+COOKIE_ESCRITURA = 'requiem_escritura'
+
+# Métodos HTTP que no modifican datos
+METODOS_LECTURA = ('GET', 'HEAD', 'OPTIONS')
+
+# Vistas que reciben un POST solo para leer: la consulta por IDs
+# (get_<plural>_by_ids) lleva la lista de IDs en el cuerpo porque puede ser larga
+SUFIJO_LECTURA_POST = '_by_ids'
+
+class SesionEnrutada(Session):
+    """
+    Sesión que envía las lecturas a una réplica y las escrituras al primario.
+
+    Una consulta va a la réplica solo si la solicitud actual es de lectura
+    (ver `replica_de_lectura`) y la sesión todavía no escribió. Los flush y las
+    sentencias INSERT/UPDATE/DELETE siempre van al primario, y desde ese
+    momento todas las lecturas de la sesión también, para que la solicitud lea
+    lo que acaba de escribir.
+
+    `session.info['replica']` permite fijar la réplica (o False para usar el
+    primario) en sesiones que viven fuera del contexto de la solicitud.
+    """
+
+    def __init__(self, *args, replicas=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primario = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if not self.replicas or self.info.get('escritura'):
+            return primario
+        if self._flushing or isinstance(clause, UpdateBase):
+            # Lectura después de escritura: el resto de la sesión usa el primario
+            self.info['escritura'] = True
+            return primario
+        replica = self.info.get('replica')
+        if replica is None:
+            replica = replica_de_lectura()
+        return replica or primario
+
+def replica_de_lectura():
+    """
+    Devuelve la réplica asignada a la solicitud actual, si corresponde leer de ella.
+
+    Returns:
+        Engine|None: Motor de la réplica, o None si la solicitud debe usar el primario.
+    """
+    if not has_request_context():
+        return None
+    return g.get('replica')
+
+def _vista():
+    # Nombre de la vista sin el blueprint (pacientes.get_pacientes -> get_pacientes)
+    return (request.endpoint or '').rsplit('.', 1)[-1]
+
+def solicitud_de_lectura():
+    """
+    Indica si la solicitud actual no modifica datos: un método de lectura o
+    un POST a una vista de consulta por IDs (get_<plural>_by_ids).
+
+    Returns:
+        bool: True si la solicitud solo lee.
+    """
+    if request.method in METODOS_LECTURA:
+        return True
+    vista = _vista()
+    return request.method == 'POST' and vista.startswith('get_') and vista.endswith(SUFIJO_LECTURA_POST)
+
+def _elegir_replica(replicas, ventana):
+    # Solo las vistas de lectura (get_*) se sirven desde una réplica
+    if not replicas or not solicitud_de_lectura() or not _vista().startswith('get_'):
+        return None
+    # Un cliente que escribió hace menos de `ventana` segundos lee del primario,
+    # para no ver datos anteriores a su propia escritura por el retraso de la réplica
+    try:
+        ultima_escritura = float(request.cookies.get(COOKIE_ESCRITURA, 0))
+    except ValueError:
+        ultima_escritura = 0
+    if time.time() - ultima_escritura < ventana:
+        return None
+    # Una réplica por solicitud, para que todas sus lecturas sean consistentes
+    return random.choice(replicas)
+
+def registrar_replicas(app, session_local, replicas):
+    """
+    Registra en la app el enrutamiento de lecturas a las réplicas.
+
+    Args:
+        app (Flask): Aplicación.
+        session_local (scoped_session): Sesión por hilo de la app.
+        replicas (list): Motores de las réplicas (puede estar vacía).
+    """
+    ventana = app.config.get('REPLICA_STALENESS_WINDOW', 5)
+
+    @app.before_request
+    def asignar_replica():
+        g.replica = _elegir_replica(replicas, ventana)
+
+    @app.after_request
+    def marcar_escritura(response):
+        # Registrar la escritura del cliente para la ventana de consistencia
+        if replicas and not solicitud_de_lectura() and response.status_code < 400:
+            response.set_cookie(COOKIE_ESCRITURA, str(time.time()), max_age=ventana,
+                                httponly=True, samesite='Lax')
+        return response
+
+    @app.teardown_appcontext
+    def liberar_sesion(error=None):
+        # Descartar la sesión del hilo al terminar la solicitud: la próxima
+        # solicitud empieza sin réplica asignada ni marca de escritura
+        session_local.remove()
@@ -0,0 +1,339 @@
+import sys
+import threading
+from flask import request
+from marshmallow import missing
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, joinedload, MANYTOONE
+from app.utils.paginacion import ParametroInvalido
+from app.utils.proyeccion import CAMPOS_DIRECTOS, proyeccion_plana
+
+class Serializador:
+    """
+    Serializador compilado a partir de un esquema de Marshmallow.
+
+    Produce la misma salida que `schema.dump` sobre objetos del ORM, pero sin
+    recorrer la maquinaria genérica de campos en cada atributo de cada fila:
+    los campos que copian una columna tal cual se leen con un acceso directo
+    al atributo dentro de una función generada una sola vez. El esquema sigue
+    siendo la fuente de verdad para la validación y para la forma de la salida.
+
+    Uso:
+        serializador(objeto)          -> dict
+        serializador.lista(objetos)   -> list de dicts
+        serializador.proyeccion       -> Proyeccion para armar listados de las filas, o None
+        serializador.parcial(claves)  -> Serializador de un subconjunto de los campos (?fields=)
+        serializador.expandido(arbol) -> Serializador con relaciones anidadas (?expand=)
+    """
+
+    # Relaciones expandidas (ver SerializadorExpandido)
+    relaciones = {}
+
+    def __init__(self, schema, modelo, completo=True):
+        """
+        Args:
+            schema (Schema): Instancia del esquema de Marshmallow.
+            modelo (Base): Modelo de SQLAlchemy de los objetos a serializar.
+            completo (bool): False si el esquema es un subconjunto (ver `parcial`).
+        """
+        self.schema = schema
+        self.modelo = modelo
+        self.completo = completo
+        columnas_modelo = inspect(modelo).columns
+        # Claves de salida y (campo, atributo del modelo) de cada una
+        self.campos = {campo.data_key or nombre: (nombre, campo.attribute or nombre)
+                       for nombre, campo in schema.dump_fields.items()}
+        self.claves = list(self.campos)
+        # Con hooks de dump (pre_dump/post_dump) no se puede reproducir la salida
+        if schema._hooks.get('pre_dump') or schema._hooks.get('post_dump'):
+            self.proyeccion = None
+            self.uno = lambda objeto: schema.dump(objeto, many=False)
+            self.lista = lambda objetos: schema.dump(objetos, many=True)
+        else:
+            self.proyeccion = proyeccion_plana(schema, modelo)
+            self.uno, self.lista = _compilar(schema, modelo)
+        # Columnas a cargar de los objetos: solo se pueden acotar si todos los
+        # campos son columnas (un Method o un Nested puede leer cualquier atributo)
+        atributos = [atributo for _, atributo in self.campos.values()]
+        self.columnas_carga = None
+        if all(atributo in columnas_modelo for atributo in atributos):
+            self.columnas_carga = [getattr(modelo, atributo) for atributo in atributos]
+        self._parciales = {}
+        self._expandidos = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, objeto):
+        return self.uno(objeto)
+
+    def opciones_carga(self):
+        """
+        Returns:
+            list: Opciones de consulta (load_only) para traer solo las columnas
+            que usa un serializador parcial; vacía si hay que cargar todo.
+        """
+        if self.completo or self.columnas_carga is None:
+            return []
+        return [load_only(*self.columnas_carga)]
+
+    def recortar(self, fila):
+        """
+        Recorta un registro ya serializado con el esquema completo (por ejemplo
+        de la caché de catálogos) a las claves de este serializador.
+
+        Args:
+            fila (dict): Registro con todas las claves.
+
+        Returns:
+            dict: El mismo registro si el serializador es completo o uno nuevo con sus claves.
+        """
+        if self.completo:
+            return fila
+        return {clave: fila[clave] for clave in self.claves}
+
+    def parcial(self, claves):
+        """
+        Devuelve el serializador de un subconjunto de los campos.
+
+        Se compila la primera vez que se pide cada combinación y queda guardado:
+        las combinaciones posibles están acotadas por los campos del esquema.
+
+        Args:
+            claves (list): Claves de salida a incluir (deben existir en el esquema).
+
+        Returns:
+            Serializador: Serializador parcial (o este mismo si se piden todas).
+        """
+        clave_cache = frozenset(claves)
+        if clave_cache == frozenset(self.claves):
+            return self
+        parcial = self._parciales.get(clave_cache)
+        if parcial is None:
+            with self._lock:
+                parcial = self._parciales.get(clave_cache)
+                if parcial is None:
+                    # El mismo esquema limitado con only: serializa igual que el completo
+                    nombres = [nombre for clave, (nombre, _) in self.campos.items() if clave in clave_cache]
+                    schema = type(self.schema)(only=nombres)
+                    parcial = self._parciales[clave_cache] = Serializador(schema, self.modelo, completo=False)
+        return parcial
+
+    def expandido(self, arbol):
+        """
+        Devuelve este serializador con relaciones anidadas (ver SerializadorExpandido).
+
+        Args:
+            arbol (dict): Relaciones a expandir: {'localidad': {'provincia': {}}, ...}.
+
+        Returns:
+            SerializadorExpandido: Se compila una vez por combinación de relaciones.
+        """
+        clave_cache = _congelar(arbol)
+        expandido = self._expandidos.get(clave_cache)
+        if expandido is None:
+            with self._lock:
+                expandido = self._expandidos.get(clave_cache)
+                if expandido is None:
+                    expandido = self._expandidos[clave_cache] = SerializadorExpandido(self, arbol)
+        return expandido
+
+class SerializadorExpandido:
+    """
+    Serializador con relaciones muchos-a-uno anidadas (`?expand=localidad.provincia`).
+
+    Envuelve un Serializador (completo o parcial) y agrega en cada registro el
+    objeto relacionado, serializado con el esquema de su modelo, bajo el nombre
+    de la relación. Las relaciones se cargan con joinedload en la misma
+    consulta del listado: la página cuesta las mismas consultas sin importar
+    cuántos registros tenga. Tiene la misma interfaz que Serializador.
+    """
+
+    # Siempre sobre objetos del ORM: no hay proyección de columnas
+    proyeccion = None
+    completo = False
+
+    def __init__(self, base, arbol):
+        """
+        Args:
+            base (Serializador): Serializador de los campos propios del modelo.
+            arbol (dict): Relaciones a expandir, ya validadas (ver relaciones_expandibles).
+        """
+        self.base = base
+        self.modelo = base.modelo
+        self.relaciones = arbol
+        self.claves = base.claves + list(arbol)
+        # Las columnas del serializador base (si es parcial) y las relaciones en un JOIN
+        self._opciones = base.opciones_carga() + _cargas(base.modelo, arbol)
+        self.uno = _expansor(base.uno, base.modelo, arbol)
+
+    def __call__(self, objeto):
+        return self.uno(objeto)
+
+    def lista(self, objetos):
+        uno = self.uno
+        return [uno(objeto) for objeto in objetos]
+
+    def opciones_carga(self):
+        return self._opciones
+
+def _compilar(schema, modelo):
+    # Genera el código de las funciones para un objeto y para una lista
+    columnas_modelo = inspect(modelo).columns
+    entradas, campos = [], []
+    for nombre, campo in schema.dump_fields.items():
+        atributo = campo.attribute or nombre
+        clave = campo.data_key or nombre
+        tipo = CAMPOS_DIRECTOS.get(type(campo))
+        if tipo is not None and atributo in columnas_modelo and isinstance(columnas_modelo[atributo].type, tipo) \
+                and atributo.isidentifier():
+            # La columna ya trae el valor que devolvería el campo
+            entradas.append('{!r}: o.{}'.format(clave, atributo))
+        else:
+            # Los demás campos se serializan con Marshmallow, uno por uno
+            campos.append((clave, nombre, campo))
+    literal = '{' + ', '.join(entradas) + '}'
+    if campos:
+        codigo = ('def uno(o):\n'
+                  '    d = {literal}\n'
+                  '    for clave, nombre, campo in campos:\n'
+                  '        valor = campo.serialize(nombre, o, accessor=acceso)\n'
+                  '        if valor is not missing:\n'
+                  '            d[clave] = valor\n'
+                  '    return d\n'
+                  'def lista(objetos):\n'
+                  '    return [uno(o) for o in objetos]\n').format(literal=literal)
+    else:
+        codigo = ('def uno(o):\n'
+                  '    return {literal}\n'
+                  'def lista(objetos):\n'
+                  '    return [{literal} for o in objetos]\n').format(literal=literal)
+    espacio = {'campos': campos, 'acceso': schema.get_attribute, 'missing': missing}
+    exec(compile(codigo, '<serializador {}>'.format(type(schema).__name__), 'exec'), espacio)
+    return espacio['uno'], espacio['lista']
+
+def _congelar(arbol):
+    # Clave inmutable y sin orden para el árbol de relaciones
+    return frozenset((nombre, _congelar(hijas)) for nombre, hijas in arbol.items())
+
+def _cargas(modelo, arbol, camino=None):
+    # Opciones joinedload para cada camino del árbol (localidad -> provincia)
+    opciones = []
+    for nombre, hijas in arbol.items():
+        carga = (camino.joinedload if camino is not None else joinedload)(getattr(modelo, nombre))
+        opciones.extend(_cargas(relaciones_expandibles(modelo)[nombre], hijas, carga) or [carga])
+    return opciones
+
+def _expansor(uno, modelo, arbol):
+    # Función que serializa un objeto y le agrega sus relaciones expandidas
+    if not arbol:
+        return uno
+    anidados = []
+    for nombre, hijas in arbol.items():
+        destino = relaciones_expandibles(modelo)[nombre]
+        anidados.append((nombre, _expansor(serializador_de(destino).uno, destino, hijas)))
+
+    def expandir(objeto):
+        registro = uno(objeto)
+        for nombre, serializar in anidados:
+            relacionado = getattr(objeto, nombre)
+            registro[nombre] = serializar(relacionado) if relacionado is not None else None
+        return registro
+    return expandir
+
+def relaciones_expandibles(modelo):
+    """
+    Relaciones de un modelo que se pueden expandir: las muchos-a-uno (cada
+    registro tiene a lo sumo un objeto relacionado). Las colecciones de los
+    backref (ej. Provincia.localidades) no se expanden.
+
+    Args:
+        modelo (Base): Modelo de SQLAlchemy.
+
+    Returns:
+        dict: Nombre de la relación -> modelo relacionado.
+    """
+    return {nombre: relacion.mapper.class_ for nombre, relacion in inspect(modelo).relationships.items()
+            if relacion.direction is MANYTOONE}
+
+# Serializador completo de cada modelo, para los objetos anidados
+_por_modelo = {}
+
+def serializador_de(modelo):
+    """
+    Devuelve el serializador completo de un modelo a partir de su esquema, que
+    por convención es <Modelo>Schema en el mismo módulo (ej. Localidad y LocalidadSchema).
+
+    Args:
+        modelo (Base): Modelo de SQLAlchemy.
+
+    Returns:
+        Serializador: Serializador compilado del esquema del modelo.
+    """
+    serializador = _por_modelo.get(modelo)
+    if serializador is None:
+        schema = getattr(sys.modules[modelo.__module__], modelo.__name__ + 'Schema')
+        serializador = _por_modelo[modelo] = Serializador(schema(), modelo)
+    return serializador
+
+def leer_expansion(modelo):
+    """
+    Lee el parámetro `expand` de la query string: caminos de relaciones
+    separados por comas, con puntos para anidar (`localidad.provincia,nacionalidad`).
+
+    Args:
+        modelo (Base): Modelo de la vista.
+
+    Returns:
+        dict: Árbol de relaciones ({'localidad': {'provincia': {}}, 'nacionalidad': {}}), vacío si no se envió.
+    """
+    arbol = {}
+    for camino in request.args.get('expand', '').split(','):
+        camino = camino.strip()
+        if not camino:
+            continue
+        nodo, actual = arbol, modelo
+        for nombre in camino.split('.'):
+            relaciones = relaciones_expandibles(actual)
+            if nombre not in relaciones:
+                raise ParametroInvalido('No se puede expandir "{}" (disponibles en {}: {})'.format(
+                    camino, actual.__tablename__, ', '.join(relaciones) or 'ninguna'))
+            nodo = nodo.setdefault(nombre, {})
+            actual = relaciones[nombre]
+    return arbol
+
+def compilar_serializador(schema, modelo):
+    """
+    Compila el serializador de un esquema para los objetos de un modelo.
+
+    Args:
+        schema (Schema): Instancia del esquema de Marshmallow (many se ignora).
+        modelo (Base): Modelo de SQLAlchemy.
+
+    Returns:
+        Serializador: Serializador con la misma salida que `schema.dump`.
+    """
+    return Serializador(schema, modelo)
+
+def serializador_solicitado(serializador):
+    """
+    Aplica los parámetros `fields` (`?fields=id_localidad,localidad`) y
+    `expand` (`?expand=provincia`) de la query string.
+
+    Args:
+        serializador (Serializador): Serializador completo de la vista.
+
+    Returns:
+        Serializador: El serializador con los campos pedidos y las relaciones
+        expandidas, o el completo si no se envió ninguno de los dos.
+    """
+    arbol = leer_expansion(serializador.modelo)
+    valor = request.args.get('fields', '')
+    claves = [clave.strip() for clave in valor.split(',') if clave.strip()]
+    if claves:
+        desconocidas = [clave for clave in claves if clave not in serializador.campos]
+        if desconocidas:
+            raise ParametroInvalido('Campos desconocidos en "fields": {} (disponibles: {})'.format(
+                ', '.join(desconocidas), ', '.join(serializador.claves)))
+        serializador = serializador.parcial(claves)
+    # Las relaciones expandidas se agregan a los campos pedidos
+    if arbol:
+        serializador = serializador.expandido(arbol)
+    return serializador
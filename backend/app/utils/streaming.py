@@ -0,0 +1,73 @@
+from itertools import islice
+from flask import Response, request, current_app
+from sqlalchemy.exc import SQLAlchemyError
+from app.configs.database import SessionLocal
+from app.utils.replicas import replica_de_lectura
+from app.utils.paginacion import leer_entero
+from app.utils.proyeccion import filas_habilitadas
+
+def streaming_solicitado():
+    """
+    Indica si el cliente pidió el listado en modo streaming (`?stream=1`).
+
+    Returns:
+        bool: True si se solicitó streaming.
+    """
+    return request.args.get('stream', '').lower() in ('1', 'true', 'si')
+
+def respuesta_streaming(modelo, columna_pk, serializador):
+    """
+    Transmite un listado completo sin materializarlo en memoria.
+
+    La consulta se recorre con `yield_per` y cada lote se serializa y se envía
+    apenas llega de la base de datos. `count` y `status` se emiten al final del
+    objeto JSON, cuando ya se conoce el total y si hubo errores.
+
+    Args:
+        modelo (Base): Modelo a listar.
+        columna_pk (Column): Clave primaria, usada para ordenar y para `after`.
+        serializador (Serializador): Ver app.utils.serializadores.
+
+    Returns:
+        Response: Respuesta JSON transmitida por partes.
+    """
+    # Validar los parámetros antes de empezar a transmitir
+    after = leer_entero('after')
+    tamano_lote = current_app.config.get('STREAMING_YIELD_PER', 1000)
+    dumps = current_app.json.dumps
+    # La réplica se decide ahora: el generador corre fuera de la solicitud
+    replica = replica_de_lectura() or False
+    # Con un esquema plano se consultan solo sus columnas y se serializan las tuplas
+    proyeccion = serializador.proyeccion if filas_habilitadas() else None
+    serializar = proyeccion.a_dicts if proyeccion else serializador.lista
+
+    def generar():
+        # Sesión propia: debe seguir abierta hasta terminar la transmisión,
+        # después de que la vista ya haya retornado
+        session = SessionLocal.session_factory(info={'replica': replica})
+        count = 0
+        # El inicio del objeto sale antes de ejecutar la consulta: si falla,
+        # el mensaje de error cierra igual un JSON válido
+        yield '{"data": ['
+        try:
+            query = (session.query(*proyeccion.columnas) if proyeccion
+                     else session.query(modelo).options(*serializador.opciones_carga()))
+            # Continuar desde el cursor recibido
+            if after is not None:
+                query = query.filter(columna_pk > after)
+            filas = iter(query.order_by(columna_pk).yield_per(tamano_lote))
+            # Serializar y enviar un lote por vez
+            lote = list(islice(filas, tamano_lote))
+            while lote:
+                # Se quitan los corchetes del arreglo serializado del lote
+                yield (', ' if count else '') + dumps(serializar(lote))[1:-1]
+                count += len(lote)
+                lote = list(islice(filas, tamano_lote))
+            yield '], "count": {}, "status": "success"}}'.format(count)
+        except SQLAlchemyError as e:
+            # El código HTTP ya fue enviado: el error se informa en el cuerpo
+            yield '], "count": {}, "status": "error", "message": {}}}'.format(count, dumps(str(e)))
+        finally:
+            session.close()
+
+    return Response(generar(), status=200, mimetype='application/json')
@@ -0,0 +1,100 @@
+import re
+from sqlalchemy import select, literal, union_all, inspect
+from app.utils.cache import obtener_cache, es_catalogo
+
+def entero(valor):
+    """
+    Convierte una clave recibida en JSON a entero sin redondear ni truncar:
+    acepta enteros, floats sin parte decimal (3.0) y textos con dígitos ("3").
+
+    Args:
+        valor: Valor recibido.
+
+    Returns:
+        int: El valor como entero, o None si no representa un entero (bool, 3.7, "3.7", None).
+    """
+    if isinstance(valor, bool):
+        return None
+    if isinstance(valor, int):
+        return valor
+    if isinstance(valor, float):
+        return int(valor) if valor.is_integer() else None
+    if isinstance(valor, str) and re.fullmatch(r'\s*[+-]?\d+\s*', valor):
+        return int(valor)
+    return None
+
+def validar_referencias(session, data, referencias):
+    """
+    Verifica que existan los registros referenciados por una escritura.
+
+    Las claves de los catálogos se buscan primero en sus cachés en memoria
+    (sin idas y vueltas a la base de datos). Que una clave no esté en la
+    caché no prueba que no exista: la caché puede ser anterior a un alta
+    hecha en otro proceso. Las que faltan, y las de tablas que no son
+    catálogos (ej. localidades), se confirman todas juntas con una única
+    consulta UNION ALL.
+
+    Las claves se normalizan en `data` (ver `entero`): lo que se inserta es
+    el mismo entero que se validó. Un valor no entero (3.7, true) se rechaza
+    en lugar de truncarlo, ya que la base lo redondearía a otra clave.
+
+    Args:
+        session (Session): Sesión de base de datos.
+        data (dict): Datos recibidos; solo se validan los campos presentes (se modifica).
+        referencias (list): Tuplas (campo, modelo referenciado, mensaje de error).
+
+    Returns:
+        str: Mensaje de la primera referencia inválida o None si son todas válidas.
+    """
+    presentes = []
+    for campo, modelo, mensaje in referencias:
+        if campo not in data:
+            continue
+        # Las claves deben ser enteras
+        id = entero(data[campo])
+        if id is None:
+            return 'El campo "{}" debe ser un número entero'.format(campo)
+        data[campo] = id
+        presentes.append((id, modelo, mensaje))
+    # Las encontradas en la caché de un catálogo ya están validadas
+    dudosas = [(id, modelo, mensaje) for id, modelo, mensaje in presentes
+               if not (es_catalogo(modelo) and obtener_cache(modelo).existe(id))]
+    if not dudosas:
+        return None
+    # Una sola consulta: cada SELECT devuelve su índice si la clave existe
+    consultas = [
+        select(literal(indice).label('indice'))
+        .select_from(modelo.__table__)
+        .where(inspect(modelo).primary_key[0] == id)
+        for indice, (id, modelo, _) in enumerate(dudosas)
+    ]
+    consulta = consultas[0] if len(consultas) == 1 else union_all(*consultas)
+    encontrados = set(session.execute(consulta).scalars())
+    for indice, (_, _, mensaje) in enumerate(dudosas):
+        if indice not in encontrados:
+            return mensaje
+    return None
+
+def traducir_integridad(error, mensajes, defecto='La operación viola una restricción de la base de datos'):
+    """
+    Traduce un IntegrityError del motor a un mensaje para el cliente.
+
+    Permite confiar en las restricciones UNIQUE y FOREIGN KEY de la base de
+    datos en lugar de hacer consultas de verificación antes de escribir.
+
+    Args:
+        error (IntegrityError): Error lanzado por el commit.
+        mensajes (list): Tuplas (fragmentos, mensaje). Los fragmentos son
+            nombres de restricciones o columnas tal como aparecen en el error
+            del motor (ej. 'uq_pacientes_doc' en MySQL, 'pacientes.doc_numero'
+            en SQLite); gana la primera tupla que coincida.
+        defecto (str): Mensaje si no coincide ninguna tupla.
+
+    Returns:
+        str: Mensaje de error.
+    """
+    texto = str(error.orig)
+    for fragmentos, mensaje in mensajes:
+        if any(fragmento in texto for fragmento in fragmentos):
+            return mensaje
+    return defecto
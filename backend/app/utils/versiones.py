@@ -0,0 +1,97 @@
+import threading
+from functools import wraps
+from flask import request, make_response
+
+# Versión en memoria de cada tabla; la incrementan las vistas de escritura
+_versiones = {}
+_lock = threading.Lock()
+
+def version_tabla(tabla):
+    """
+    Devuelve la versión actual de una tabla en este proceso.
+
+    Args:
+        tabla (str): Nombre de la tabla.
+
+    Returns:
+        int: Versión de la tabla (0 si nunca se modificó).
+    """
+    return _versiones.get(tabla, 0)
+
+def incrementar_version(tabla):
+    """
+    Marca una tabla como modificada incrementando su versión.
+
+    Args:
+        tabla (str): Nombre de la tabla.
+    """
+    with _lock:
+        _versiones[tabla] = _versiones.get(tabla, 0) + 1
+
+def con_etag(modelo, buscar=None):
+    """
+    Decorador para las vistas GET de catálogos.
+
+    El ETag es el de la copia vigente de la caché del catálogo (un resumen de
+    sus registros, ver app.utils.cache.CacheCatalogo): identifica los datos
+    que se sirven, así que es válido entre procesos aunque cada uno lleve su
+    propio contador de versión. Si el `If-None-Match` del cliente coincide
+    se responde 304 sin ejecutar la vista ni serializar. En otro caso se
+    ejecuta la vista y se agrega el ETag.
+
+    El ETag es el de todo el catálogo: en las vistas de un registro (por ID
+    o por nombre) el 304 solo vale si el registro existe, así que `buscar`
+    lo verifica en la caché antes; si no existe se ejecuta la vista (404).
+
+    Args:
+        modelo (Base): Modelo del catálogo que sirve la vista.
+        buscar (callable): Para las vistas de un registro: recibe la caché y
+            los argumentos de la vista y devuelve el registro o None.
+    """
+    # Importación diferida: app.utils.cache usa las versiones de este módulo
+    from app.utils.cache import obtener_cache
+    cache = obtener_cache(modelo)
+
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            # El ETag se toma antes de leer: si hay una escritura concurrente,
+            # el cliente recibe datos nuevos con el ETag viejo y vuelve a pedirlos
+            etag = cache.etag()
+            # El cliente ya tiene esta versión (comparación débil: la respuesta
+            # comprimida lleva el mismo ETag como W/"...", ver app.utils.compresion)
+            if request.if_none_match.contains_weak(etag) and \
+                    (buscar is None or buscar(cache, *args, **kwargs) is not None):
+                respuesta = make_response('', 304)
+                respuesta.set_etag(etag, weak=etag not in request.if_none_match)
+                return respuesta
+            respuesta = make_response(vista(*args, **kwargs))
+            # Solo las respuestas exitosas llevan ETag
+            if respuesta.status_code == 200:
+                respuesta.set_etag(etag)
+            return respuesta
+        return envoltura
+    return decorador
+
+def incrementa_version(*tablas):
+    """
+    Decorador para las vistas de escritura (POST, PUT, DELETE).
+
+    Si la vista responde con éxito incrementa la versión de las tablas
+    indicadas: la caché de esos catálogos se recarga en este proceso y su
+    ETag pasa a ser el de los datos nuevos.
+
+    Args:
+        tablas (str): Tablas afectadas por la escritura.
+    """
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            respuesta = make_response(vista(*args, **kwargs))
+            # Solo una escritura confirmada cambia la versión
+            if respuesta.status_code < 400:
+                for tabla in tablas:
+                    incrementar_version(tabla)
+            return respuesta
+        return envoltura
+    return decorador
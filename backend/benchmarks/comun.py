@@ -0,0 +1,67 @@
+# Funciones compartidas por los benchmarks: servidores en subprocesos,
+# puertos libres y cálculo de percentiles.
+import os
+import socket
+import sys
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Comandos para levantar cada modo de servicio en host y puerto dados
+SERVIDORES = {
+    'sync': [sys.executable, '-c',
+             'import sys; from run import app; '
+             'app.run(sys.argv[1], int(sys.argv[2]), debug=False, use_reloader=False, threaded=True)'],
+    'async': [sys.executable, 'serve_async.py'],
+    # Producción: gunicorn con gunicorn.conf.py (workers e hilos por REQUIEM_WORKERS y REQUIEM_THREADS)
+    'gunicorn': [sys.executable, '-c',
+                 'import sys; from gunicorn.app.wsgiapp import run; '
+                 'sys.argv = ["gunicorn", "-c", "gunicorn.conf.py", "-b", "{}:{}".format(*sys.argv[1:3]), "wsgi:app"]; '
+                 'run()'],
+}
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def esperar_servidor(host, puerto, proceso, timeout=30):
+    # Esperar a que el servidor acepte conexiones
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if proceso.poll() is not None:
+            raise RuntimeError('El servidor terminó al iniciar (código {})'.format(proceso.returncode))
+        try:
+            socket.create_connection((host, puerto), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('El servidor no respondió en {} segundos'.format(timeout))
+
+def percentil(valores, p):
+    # Percentil en milisegundos de una lista ordenada de duraciones en segundos
+    if not valores:
+        return None
+    indice = min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))
+    return round(valores[indice] * 1000, 2)
+
+def procesos_hijos(pid):
+    # PIDs de los procesos hijos (ej. los workers de gunicorn); solo en Linux
+    try:
+        with open('/proc/{0}/task/{0}/children'.format(pid)) as archivo:
+            return [int(hijo) for hijo in archivo.read().split()]
+    except OSError:
+        return []
+
+def memoria_pico_kb(pid):
+    # Pico de memoria residente (VmHWM) de un proceso y sus hijos; solo en Linux
+    total = None
+    for proceso in [pid] + procesos_hijos(pid):
+        try:
+            with open('/proc/{}/status'.format(proceso)) as archivo:
+                for linea in archivo:
+                    if linea.startswith('VmHWM:'):
+                        total = (total or 0) + int(linea.split()[1])
+        except OSError:
+            pass
+    return total
@@ -0,0 +1,95 @@
+# Benchmark de concurrencia: compara el modo síncrono (run.py, un hilo por
+# solicitud) con el modo asíncrono (serve_async.py, gevent + PyMySQL) con
+# muchos clientes simultáneos contra la base de datos local.
+#
+# Cada modo se levanta en un proceso aparte y se le envían solicitudes desde
+# N clientes concurrentes (asyncio, sin dependencias externas). Se informa el
+# throughput, los percentiles de latencia y los errores de cada modo.
+#
+# Uso (desde backend/):
+#   python benchmarks/concurrencia.py --clientes 500 --solicitudes 4000
+#   python benchmarks/concurrencia.py --modo async --ruta "/pacientes?limit=20"
+#
+# La base de datos es la de Config (o REQUIEM_DATABASE_URI); el pool debe
+# admitir la concurrencia buscada (REQUIEM_DB_POOL_SIZE / REQUIEM_DB_MAX_OVERFLOW).
+import argparse
+import asyncio
+import json
+import subprocess
+import time
+from comun import BACKEND, SERVIDORES, puerto_libre, esperar_servidor, percentil
+
+async def solicitud(host, puerto, ruta, timeout):
+    # Una solicitud HTTP/1.1 con su propia conexión; devuelve el código de estado
+    lector, escritor = await asyncio.wait_for(asyncio.open_connection(host, puerto), timeout)
+    try:
+        escritor.write('GET {} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\n\r\n'.format(ruta, host).encode())
+        await escritor.drain()
+        respuesta = await asyncio.wait_for(lector.read(), timeout)
+    finally:
+        escritor.close()
+    return int(respuesta.split(b' ', 2)[1])
+
+async def cargar(host, puerto, ruta, clientes, solicitudes, timeout):
+    latencias, errores = [], 0
+    pendientes = iter(range(solicitudes))
+
+    async def cliente():
+        nonlocal errores
+        # Cada cliente toma la siguiente solicitud pendiente hasta agotarlas
+        for _ in pendientes:
+            inicio = time.perf_counter()
+            try:
+                estado = await solicitud(host, puerto, ruta, timeout)
+            except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+                estado = None
+            if estado == 200:
+                latencias.append(time.perf_counter() - inicio)
+            else:
+                errores += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(clientes)))
+    return latencias, errores, time.perf_counter() - inicio
+
+def medir(modo, args):
+    host, puerto = '127.0.0.1', puerto_libre()
+    proceso = subprocess.Popen(SERVIDORES[modo] + [host, str(puerto)], cwd=BACKEND,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        esperar_servidor(host, puerto, proceso)
+        # Calentamiento: conexiones del pool y cachés
+        asyncio.run(cargar(host, puerto, args.ruta, min(args.clientes, 20), 100, args.timeout))
+        latencias, errores, duracion = asyncio.run(
+            cargar(host, puerto, args.ruta, args.clientes, args.solicitudes, args.timeout))
+    finally:
+        proceso.terminate()
+        proceso.wait()
+    latencias.sort()
+    return {
+        'modo': modo,
+        'clientes': args.clientes,
+        'solicitudes': args.solicitudes,
+        'errores': errores,
+        'throughput_rps': round(len(latencias) / duracion, 1),
+        'p50_ms': percentil(latencias, 50),
+        'p95_ms': percentil(latencias, 95),
+        'p99_ms': percentil(latencias, 99),
+        'max_ms': percentil(latencias, 100),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara los modos síncrono y asíncrono con clientes concurrentes.')
+    parser.add_argument('--modo', choices=['sync', 'async', 'ambos'], default='ambos')
+    parser.add_argument('--ruta', default='/pacientes?limit=50', help='Ruta GET a consultar')
+    parser.add_argument('--clientes', type=int, default=500, help='Clientes concurrentes')
+    parser.add_argument('--solicitudes', type=int, default=5000, help='Solicitudes totales por modo')
+    parser.add_argument('--timeout', type=float, default=30, help='Segundos máximos por solicitud')
+    args = parser.parse_args()
+
+    modos = ['sync', 'async'] if args.modo == 'ambos' else [args.modo]
+    resultados = [medir(modo, args) for modo in modos]
+    print(json.dumps(resultados, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# Carga de datos determinística para los benchmarks: misma semilla y mismos
+# volúmenes producen siempre la misma base (ver app.utils.generador).
+from sqlalchemy import func, select
+
+# Volúmenes por defecto (se pueden cambiar con los argumentos de la suite)
+VOLUMENES = {'pacientes': 20000, 'staff': 2000, 'localidades': 500, 'diagnosticos': 300}
+
+def base_vacia(session):
+    from app.models.paciente import Paciente
+    return not session.execute(select(func.count()).select_from(Paciente)).scalar()
+
+def sembrar(session, volumenes=None, semilla=1):
+    """
+    Carga catálogos, localidades, diagnósticos, staff y pacientes con el
+    generador de datos sintéticos (INSERT multi-fila, índice de búsqueda incluido).
+
+    Args:
+        session (Session): Sesión sobre una base vacía.
+        volumenes (dict): Cantidad de pacientes, staff, localidades y diagnosticos.
+        semilla (int): Semilla del generador aleatorio.
+
+    Returns:
+        dict: Filas insertadas por tabla.
+    """
+    # Importación diferida: la app lee la URI de la base al importarse
+    from app.utils.generador import generar, DestinoBase
+    volumenes = dict(VOLUMENES, **(volumenes or {}))
+    return generar(DestinoBase(session.get_bind()), volumenes, semilla)['filas']
+
+def terminos_busqueda():
+    # Apellidos y nombres frecuentes para las búsquedas por nombre
+    from app.utils.generador import APELLIDOS, NOMBRES
+    return list(APELLIDOS), list(NOMBRES)
+
+def documentos(session, cantidad=1000):
+    # Documentos (tipo, número) de los primeros pacientes para las búsquedas por documento
+    from app.models.paciente import Paciente
+    consulta = select(Paciente.id_doc_tipo, Paciente.doc_numero).order_by(Paciente.id_paciente).limit(cantidad)
+    return [tuple(fila) for fila in session.execute(consulta)]
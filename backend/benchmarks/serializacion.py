@@ -0,0 +1,94 @@
+# Benchmark de serialización: mide /pacientes y /localidades devolviendo 10k y
+# 100k registros en una sola página con cada combinación de:
+#   - codificador JSON: json estándar (proveedor por defecto de Flask) u orjson (ProveedorJSON)
+#   - armado de los registros: serializador compilado sobre objetos del ORM
+#     (app.utils.serializadores) o directo de las tuplas de la base (SERIALIZE_FROM_ROWS)
+#
+# Uso (desde backend/):
+#   python benchmarks/serializacion.py
+#   python benchmarks/serializacion.py --tamanos 10000 100000 --repeticiones 5
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from comun import BACKEND
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+def preparar(args):
+    # La app lee la base de REQUIEM_DATABASE_URI al importarse
+    os.environ['REQUIEM_DATABASE_URI'] = args.db
+    sys.path.insert(0, BACKEND)
+    from app import init_app
+    from app.configs.database import SessionLocal
+    from semilla import sembrar, base_vacia
+    app = init_app()
+    app.debug = False
+    app.logger.setLevel(logging.WARNING)
+    session = SessionLocal()
+    try:
+        if base_vacia(session):
+            maximo = max(args.tamanos)
+            print('Cargando {} pacientes y localidades...'.format(maximo))
+            sembrar(session, {'pacientes': maximo, 'localidades': maximo}, semilla=1)
+    finally:
+        session.close()
+    # Una sola página con todos los registros pedidos
+    app.config['PAGINATION_MAX_LIMIT'] = max(args.tamanos)
+    return app
+
+def variantes(app):
+    from flask.json.provider import DefaultJSONProvider
+    from app.utils.json_rapido import ProveedorJSON, codificador_activo
+    lista = [('json + objetos', DefaultJSONProvider(app), False),
+             ('json + filas', DefaultJSONProvider(app), True)]
+    if codificador_activo() == 'orjson':
+        lista += [('orjson + objetos', ProveedorJSON(app), False),
+                  ('orjson + filas', ProveedorJSON(app), True)]
+    else:
+        print('orjson no está instalado: solo se mide el json estándar')
+    return lista
+
+def medir(app, ruta, repeticiones):
+    cliente = app.test_client()
+    cliente.get(ruta)
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        respuesta = cliente.get(ruta)
+        respuesta.get_data()
+        tiempos.append(time.perf_counter() - inicio)
+    assert respuesta.status_code == 200, respuesta.get_data()[:200]
+    return statistics.median(tiempos), len(respuesta.get_data())
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara codificadores JSON y el armado desde filas.')
+    parser.add_argument('--db', default='sqlite:///' + os.path.join(DIRECTORIO, 'serializacion.db'))
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args = parser.parse_args()
+
+    app = preparar(args)
+    resultados = []
+    print('{:<14} {:>8} {:<22} {:>10} {:>12} {:>10}'.format('ruta', 'filas', 'variante', 'ms', 'filas/s', 'MB'))
+    for ruta in ('/pacientes', '/localidades'):
+        for tamano in args.tamanos:
+            base = None
+            for nombre, proveedor, filas in variantes(app):
+                app.json = proveedor
+                app.config['SERIALIZE_FROM_ROWS'] = filas
+                segundos, largo = medir(app, '{}?limit={}'.format(ruta, tamano), args.repeticiones)
+                base = base or segundos
+                resultados.append({'ruta': ruta, 'filas': tamano, 'variante': nombre,
+                                   'ms': round(segundos * 1000, 1), 'filas_por_s': round(tamano / segundos),
+                                   'bytes': largo, 'aceleracion': round(base / segundos, 2)})
+                print('{:<14} {:>8} {:<22} {:>10.1f} {:>12} {:>10.1f}  x{:.2f}'.format(
+                    ruta, tamano, nombre, segundos * 1000, round(tamano / segundos), largo / 1e6, base / segundos))
+    with open(os.path.join(DIRECTORIO, 'serializacion.json'), 'w') as archivo:
+        json.dump(resultados, archivo, indent=2)
+
+if __name__ == '__main__':
+    main()
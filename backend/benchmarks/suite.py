@@ -0,0 +1,298 @@
+# Suite de benchmarks de los endpoints REST.
+#
+# 1. Carga una base local (SQLite o MySQL) con datos determinísticos
+#    (ver semilla.py) si está vacía o si se pide --resembrar.
+# 2. Ejecuta cada endpoint a través del cliente de pruebas de Flask (sin red)
+#    y/o de un servidor HTTP real en un subproceso.
+# 3. Registra por endpoint los percentiles de latencia, el throughput y el
+#    pico de memoria, y los compara con una línea base en JSON: si alguna
+#    métrica empeora más que el umbral el proceso termina con código 1.
+#
+# Uso (desde backend/):
+#   python benchmarks/suite.py --guardar                 (genera la línea base)
+#   python benchmarks/suite.py                           (compara con la línea base)
+#   python benchmarks/suite.py --db mysql://u:p@localhost/requiem_bench --pacientes 200000 --modo http
+#   REQUIEM_WORKERS=3 REQUIEM_THREADS=4 python benchmarks/suite.py --modo http --servidor gunicorn
+import argparse
+import http.client
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from comun import BACKEND, SERVIDORES, puerto_libre, esperar_servidor, percentil, memoria_pico_kb
+from semilla import VOLUMENES, terminos_busqueda
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Contador global: cada alta usa nombres y documentos distintos
+_altas = itertools.count(1)
+
+def _alta_paciente(rnd, vol):
+    k = next(_altas)
+    return '/pacientes', {
+        'apellidos': 'Benchmark {} {}'.format(rnd.choice(vol['apellidos']), k),
+        'nombre': 'Benchmark {} {}'.format(rnd.choice(vol['nombres']), k),
+        'id_doc_tipo': 1, 'doc_numero': 1900000000 + k,
+        'id_localidad': rnd.randint(1, vol['localidades']),
+        'id_nacionalidad': rnd.randint(1, 20),
+    }
+
+# Endpoints medidos: (endpoint, método, función que arma (ruta, cuerpo) con el
+# generador aleatorio y el contexto: volúmenes de la base, términos de búsqueda y documentos)
+ENDPOINTS = [
+    ('pacientes.get_pacientes', 'GET', lambda rnd, vol: ('/pacientes?limit=100', None)),
+    ('pacientes.get_paciente', 'GET', lambda rnd, vol: ('/pacientes/{}'.format(rnd.randint(1, vol['pacientes'])), None)),
+    ('pacientes.get_paciente_by_documento', 'GET', lambda rnd, vol: ('/pacientes/documento/{}/{}'.format(*rnd.choice(vol['documentos'])), None)),
+    ('pacientes.get_paciente_by_paciente', 'GET', lambda rnd, vol: ('/pacientes/{}'.format(quote(rnd.choice(vol['apellidos']))), None)),
+    ('pacientes.create_paciente', 'POST', _alta_paciente),
+    ('staff.get_staffs', 'GET', lambda rnd, vol: ('/staff?limit=100', None)),
+    ('staff.get_staff', 'GET', lambda rnd, vol: ('/staff/{}'.format(rnd.randint(1, vol['staff'])), None)),
+    ('staff.get_staff_by_staff', 'GET', lambda rnd, vol: ('/staff/{}'.format(quote(rnd.choice(vol['nombres']))), None)),
+    ('localidades.get_localidades', 'GET', lambda rnd, vol: ('/localidades?limit=100', None)),
+    ('localidades.get_localidad', 'GET', lambda rnd, vol: ('/localidades/{}'.format(rnd.randint(1, vol['localidades'])), None)),
+    ('diagnosticos.get_diagnosticos', 'GET', lambda rnd, vol: ('/diagnosticos?limit=100', None)),
+    ('diagnosticos.get_diagnostico', 'GET', lambda rnd, vol: ('/diagnosticos/{}'.format(rnd.randint(1, vol['diagnosticos'])), None)),
+    ('provincias.get_provincias', 'GET', lambda rnd, vol: ('/provincias', None)),
+    ('nacionalidades.get_nacionalidades', 'GET', lambda rnd, vol: ('/nacionalidades', None)),
+    ('doc_tipos.get_doc_tipos', 'GET', lambda rnd, vol: ('/doc_tipos', None)),
+]
+
+# Métricas comparadas con la línea base y su sentido (1: mayor es peor, -1: menor es peor)
+METRICAS = (('p95_ms', 1), ('throughput_rps', -1), ('peak_mem_kb', 1))
+
+def resumen(latencias, errores, duracion, memoria):
+    latencias.sort()
+    return {
+        'solicitudes': len(latencias) + errores,
+        'errores': errores,
+        'throughput_rps': round(len(latencias) / duracion, 1) if duracion else None,
+        'p50_ms': percentil(latencias, 50),
+        'p95_ms': percentil(latencias, 95),
+        'p99_ms': percentil(latencias, 99),
+        'peak_mem_kb': memoria,
+    }
+
+def medir_cliente(app, args, vol):
+    # Cliente de pruebas de Flask: mide la app sin la red ni el servidor
+    cliente = app.test_client()
+
+    def ejecutar(metodo, armar, rnd):
+        ruta, cuerpo = armar(rnd, vol)
+        return cliente.open(ruta, method=metodo, json=cuerpo).status_code < 300
+
+    resultados = {}
+    for nombre, metodo, armar in ENDPOINTS:
+        rnd = random.Random(args.semilla)
+        for _ in range(args.calentamiento):
+            ejecutar(metodo, armar, rnd)
+        latencias, errores = [], 0
+        inicio = time.perf_counter()
+        for _ in range(args.solicitudes):
+            t = time.perf_counter()
+            if ejecutar(metodo, armar, rnd):
+                latencias.append(time.perf_counter() - t)
+            else:
+                errores += 1
+        duracion = time.perf_counter() - inicio
+        # Pico de memoria en una pasada corta aparte: tracemalloc distorsiona la latencia
+        tracemalloc.start()
+        for _ in range(min(args.solicitudes, 20)):
+            ejecutar(metodo, armar, rnd)
+        memoria = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+        resultados[nombre] = resumen(latencias, errores, duracion, memoria)
+    return resultados
+
+def medir_http(args, vol):
+    # Servidor real (run.py, gunicorn o serve_async.py) en un subproceso, con clientes concurrentes
+    host, puerto = '127.0.0.1', puerto_libre()
+    entorno = dict(os.environ, REQUIEM_DATABASE_URI=args.db)
+    proceso = subprocess.Popen(SERVIDORES[args.servidor] + [host, str(puerto)], cwd=BACKEND, env=entorno,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def ejecutar(metodo, ruta, cuerpo):
+        conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+        try:
+            inicio = time.perf_counter()
+            datos = json.dumps(cuerpo) if cuerpo is not None else None
+            conexion.request(metodo, ruta, body=datos, headers={'Content-Type': 'application/json'})
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            return respuesta.status < 300, time.perf_counter() - inicio
+        except (OSError, http.client.HTTPException):
+            return False, None
+        finally:
+            conexion.close()
+
+    resultados = {}
+    try:
+        esperar_servidor(host, puerto, proceso)
+        with ThreadPoolExecutor(args.concurrencia) as hilos:
+            for nombre, metodo, armar in ENDPOINTS:
+                rnd = random.Random(args.semilla)
+                # Las rutas se arman antes para no medir el generador aleatorio
+                calentamiento = [armar(rnd, vol) for _ in range(args.calentamiento)]
+                solicitudes = [armar(rnd, vol) for _ in range(args.solicitudes)]
+                list(hilos.map(lambda s: ejecutar(metodo, *s), calentamiento))
+                inicio = time.perf_counter()
+                respuestas = list(hilos.map(lambda s: ejecutar(metodo, *s), solicitudes))
+                duracion = time.perf_counter() - inicio
+                latencias = [t for ok, t in respuestas if ok]
+                errores = len(respuestas) - len(latencias)
+                # Pico de memoria residente del servidor hasta este endpoint
+                resultados[nombre] = resumen(latencias, errores, duracion, memoria_pico_kb(proceso.pid))
+    finally:
+        proceso.terminate()
+        proceso.wait()
+    return resultados
+
+def comparar(base, actual, umbral):
+    """
+    Devuelve las regresiones de `actual` respecto de `base`: métricas que
+    empeoraron más que `umbral` (fracción) y endpoints con errores.
+    """
+    regresiones = []
+    for modo, endpoints in actual.items():
+        for nombre, datos in endpoints.items():
+            if datos['errores']:
+                regresiones.append('{} {}: {} solicitudes con error'.format(modo, nombre, datos['errores']))
+            referencia = base.get(modo, {}).get(nombre)
+            if not referencia:
+                continue
+            for metrica, sentido in METRICAS:
+                valor, anterior = datos.get(metrica), referencia.get(metrica)
+                if not valor or not anterior:
+                    continue
+                cambio = (valor - anterior) / anterior * sentido
+                if cambio > umbral:
+                    regresiones.append('{} {} {}: {} -> {} ({:+.0%})'.format(
+                        modo, nombre, metrica, anterior, valor, (valor - anterior) / anterior))
+    return regresiones
+
+def imprimir(resultados):
+    for modo, endpoints in resultados.items():
+        print('\n[{}]'.format(modo))
+        print('{:<42} {:>9} {:>9} {:>9} {:>10} {:>11} {:>6}'.format(
+            'endpoint', 'p50 ms', 'p95 ms', 'p99 ms', 'req/s', 'pico KB', 'err'))
+        for nombre, d in endpoints.items():
+            print('{:<42} {:>9} {:>9} {:>9} {:>10} {:>11} {:>6}'.format(
+                nombre, d['p50_ms'], d['p95_ms'], d['p99_ms'], d['throughput_rps'], d['peak_mem_kb'], d['errores']))
+
+def preparar_base(args):
+    # La app lee la base de REQUIEM_DATABASE_URI al importarse
+    os.environ['REQUIEM_DATABASE_URI'] = args.db
+    sys.path.insert(0, BACKEND)
+    from app import init_app
+    from app.configs.database import Base, engine, SessionLocal
+    from semilla import sembrar, base_vacia, documentos
+    from app.utils.migraciones import tabla_version
+    if args.resembrar:
+        # Base vacía: init_app vuelve a aplicar todas las migraciones
+        Base.metadata.drop_all(bind=engine)
+        tabla_version.drop(bind=engine, checkfirst=True)
+    app = init_app()
+    app.debug = False
+    app.logger.setLevel(logging.WARNING)
+    session = SessionLocal()
+    try:
+        if base_vacia(session):
+            print('Cargando datos de prueba...')
+            sembrar(session, {clave: getattr(args, clave) for clave in VOLUMENES}, args.semilla)
+        # Volúmenes reales de la base (puede haber sido cargada con otros valores)
+        from app.models.paciente import Paciente
+        from app.models.staff import Staff
+        from app.models.localidad import Localidad
+        from app.models.diagnostico import Diagnostico
+        vol = {'pacientes': session.query(Paciente).count(), 'staff': session.query(Staff).count(),
+               'localidades': session.query(Localidad).count(), 'diagnosticos': session.query(Diagnostico).count()}
+        muestra = documentos(session)
+    finally:
+        session.close()
+    return app, vol, muestra
+
+def limpiar_altas(vol):
+    # Eliminar los pacientes creados por el benchmark para que la base no crezca entre corridas
+    from sqlalchemy import delete
+    from app.configs.database import SessionLocal
+    from app.models.paciente import Paciente
+    from app.models.tokenbusqueda import TokenBusqueda
+    session = SessionLocal()
+    try:
+        session.execute(delete(TokenBusqueda).where(TokenBusqueda.entidad == Paciente.__tablename__,
+                                                    TokenBusqueda.id_entidad > vol['pacientes']))
+        session.execute(delete(Paciente).where(Paciente.id_paciente > vol['pacientes']))
+        session.commit()
+    finally:
+        session.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks de los endpoints REST con línea base.')
+    parser.add_argument('--db', default='sqlite:///' + os.path.join(DIRECTORIO, 'benchmark.db'),
+                        help='URI de la base de datos local (SQLite o MySQL)')
+    parser.add_argument('--modo', choices=['client', 'http', 'ambos'], default='ambos')
+    for clave, defecto in VOLUMENES.items():
+        parser.add_argument('--' + clave, type=int, default=defecto, help='Cantidad de {} a cargar'.format(clave))
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--resembrar', action='store_true', help='Borrar y volver a cargar la base')
+    parser.add_argument('--solicitudes', type=int, default=200, help='Solicitudes medidas por endpoint')
+    parser.add_argument('--calentamiento', type=int, default=20, help='Solicitudes previas sin medir')
+    parser.add_argument('--concurrencia', type=int, default=8, help='Clientes simultáneos en el modo http')
+    parser.add_argument('--servidor', choices=sorted(SERVIDORES), default='sync',
+                        help='Servidor del modo http (gunicorn toma REQUIEM_WORKERS y REQUIEM_THREADS)')
+    parser.add_argument('--baseline', default=os.path.join(DIRECTORIO, 'baseline.json'))
+    parser.add_argument('--guardar', action='store_true', help='Guardar esta corrida como línea base')
+    parser.add_argument('--umbral', type=float, default=0.25, help='Empeoramiento tolerado (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    app, vol, muestra = preparar_base(args)
+    # Volúmenes, términos de búsqueda y documentos con los que se arman las solicitudes
+    apellidos, nombres = terminos_busqueda()
+    contexto = dict(vol, apellidos=apellidos, nombres=nombres, documentos=muestra)
+    resultados = {}
+    try:
+        if args.modo in ('client', 'ambos'):
+            resultados['client'] = medir_cliente(app, args, contexto)
+        if args.modo in ('http', 'ambos'):
+            resultados['http'] = medir_http(args, contexto)
+    finally:
+        limpiar_altas(vol)
+    imprimir(resultados)
+
+    informe = {
+        'meta': {'fecha': time.strftime('%Y-%m-%d %H:%M:%S'), 'python': platform.python_version(),
+                 'maquina': platform.node(), 'volumenes': vol, 'solicitudes': args.solicitudes,
+                 'concurrencia': args.concurrencia, 'servidor': args.servidor,
+                 'workers': os.environ.get('REQUIEM_WORKERS'), 'threads': os.environ.get('REQUIEM_THREADS')},
+        'resultados': resultados,
+    }
+    if args.guardar:
+        with open(args.baseline, 'w') as archivo:
+            json.dump(informe, archivo, indent=2)
+        print('\nLínea base guardada en {}'.format(args.baseline))
+        return 0
+    if not os.path.exists(args.baseline):
+        print('\nNo hay línea base ({}); ejecutar con --guardar para crearla'.format(args.baseline))
+        return 0
+    with open(args.baseline) as archivo:
+        base = json.load(archivo)
+    if base['meta'].get('volumenes') != vol:
+        print('\nAtención: la línea base se tomó con otros volúmenes {}'.format(base['meta'].get('volumenes')))
+    regresiones = comparar(base['resultados'], resultados, args.umbral)
+    if regresiones:
+        print('\nRegresiones (umbral {:.0%}):'.format(args.umbral))
+        for regresion in regresiones:
+            print('  ' + regresion)
+        return 1
+    print('\nSin regresiones respecto de la línea base (umbral {:.0%})'.format(args.umbral))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+# Configuración de gunicorn para producción (guía de dimensionamiento en txt/despliegue.txt).
+#
+# Uso (desde backend/):
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#   REQUIEM_WORKERS=4 REQUIEM_THREADS=8 gunicorn -c gunicorn.conf.py wsgi:app
+import multiprocessing
+import os
+
+bind = os.environ.get('REQUIEM_BIND', '0.0.0.0:8000')
+
+# Procesos: uno por núcleo. La serialización usa CPU y el GIL limita cada proceso
+# a un núcleo; más procesos que núcleos solo suman memoria (ver txt/despliegue.txt)
+workers = int(os.environ.get('REQUIEM_WORKERS', multiprocessing.cpu_count()))
+# Hilos por proceso: mientras un hilo espera a MySQL otro serializa.
+# No conviene superar DB_POOL_SIZE: los hilos de más solo esperan una conexión
+worker_class = 'gthread'
+threads = int(os.environ.get('REQUIEM_THREADS', 8))
+
+# La app (modelos, esquemas, serializadores compilados) se carga una sola vez en
+# el maestro y los workers la heredan con el fork (arranque más rápido y memoria compartida)
+preload_app = True
+
+# Reciclar los workers cada tantas solicitudes acota la fragmentación de memoria
+max_requests = int(os.environ.get('REQUIEM_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+accesslog = os.environ.get('REQUIEM_ACCESS_LOG')  # '-' para registrar en stdout
+errorlog = '-'
+
+def when_ready(server):
+    # El maestro usó una conexión al precargar la app (verificar o aplicar las
+    # migraciones del esquema, ver app.utils.migraciones): se cierra
+    # antes de crear los workers para que no hereden sockets abiertos
+    from app.configs.database import reiniciar_pools
+    reiniciar_pools(cerrar=True)
+
+def post_fork(server, worker):
+    # Cada worker arma su propio pool (ver reiniciar_pools)
+    from app.configs.database import reiniciar_pools
+    reiniciar_pools()
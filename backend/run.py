@@ -2,5 +2,7 @@ from app import init_app
 
 app = init_app()
 
+# Servidor de desarrollo (con debug y recarga automática).
+# En producción usar gunicorn con wsgi.py (ver txt/despliegue.txt)
 if __name__ == '__main__':
-    app.run()
+    app.run(debug=True)
@@ -0,0 +1,31 @@
+# Modo de servicio asíncrono: un solo proceso atiende muchas solicitudes
+# concurrentes sin un hilo por solicitud.
+#
+# gevent reemplaza los sockets, hilos y locks de la biblioteca estándar por
+# versiones cooperativas: mientras una solicitud espera a MySQL, el proceso
+# atiende otras. El driver debe ser de Python puro (PyMySQL) para que sus
+# esperas de red también sean cooperativas. Las rutas y las URLs son las mismas
+# que con run.py.
+#
+# Uso: python serve_async.py [host] [puerto]
+from gevent import monkey
+monkey.patch_all()
+
+# PyMySQL atiende las URLs mysql:// en lugar de mysqlclient (extensión en C que bloquea)
+import pymysql
+pymysql.install_as_MySQLdb()
+
+import sys
+from gevent.pool import Pool
+from gevent.pywsgi import WSGIServer
+from app import init_app
+
+app = init_app()
+
+if __name__ == '__main__':
+    host = sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1'
+    puerto = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    # Cada solicitud corre en un greenlet; el pool limita cuántas a la vez
+    conexiones = Pool(app.config['ASYNC_MAX_CONNECTIONS'])
+    print('REQUIEM (asíncrono) escuchando en http://{}:{}'.format(host, puerto))
+    WSGIServer((host, puerto), app, spawn=conexiones, log=None).serve_forever()
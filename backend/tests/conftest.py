@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Las pruebas importan el paquete app desde backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Los módulos de app crean el motor al importarse: sin una base configurada
+# se usa SQLite en memoria (las pruebas de serialización no consultan la base)
+os.environ.setdefault('REQUIEM_DATABASE_URI', 'sqlite://')
@@ -0,0 +1,40 @@
+"""
+Rutas generadas por el motor de recursos (app.utils.recurso): pacientes y
+staff se arman con Recurso y conservan sus URLs y nombres de vista, con las
+rutas propias agregadas con el decorador `ruta`.
+"""
+from flask import Flask
+from app.routes.pacientes import pacientes_bp
+from app.routes.staffs import staffs_bp
+
+def _rutas(blueprint):
+    app = Flask(__name__)
+    app.register_blueprint(blueprint)
+    return {(regla.rule, regla.endpoint, metodo)
+            for regla in app.url_map.iter_rules() if regla.endpoint != 'static'
+            for metodo in regla.methods - {'HEAD', 'OPTIONS'}}
+
+def test_rutas_de_pacientes():
+    assert _rutas(pacientes_bp) == {
+        ('/pacientes', 'pacientes.get_pacientes', 'GET'),
+        ('/pacientes', 'pacientes.create_paciente', 'POST'),
+        ('/pacientes/lote', 'pacientes.get_pacientes_by_ids', 'POST'),
+        ('/pacientes/<int:id>', 'pacientes.get_paciente', 'GET'),
+        ('/pacientes/<int:id>', 'pacientes.update_paciente', 'PUT'),
+        ('/pacientes/<int:id>', 'pacientes.delete_paciente', 'DELETE'),
+        ('/pacientes/<string:nombre>', 'pacientes.get_paciente_by_paciente', 'GET'),
+        ('/pacientes/documento/<int:id_doc_tipo>/<int:doc_numero>', 'pacientes.get_paciente_by_documento', 'GET'),
+        ('/pacientes/documento/<int:id_doc_tipo>/<int:doc_numero>', 'pacientes.delete_paciente_by_documento', 'DELETE'),
+        ('/pacientes/importar', 'pacientes.import_pacientes', 'POST'),
+    }
+
+def test_rutas_de_staff():
+    assert _rutas(staffs_bp) == {
+        ('/staff', 'staff.get_staffs', 'GET'),
+        ('/staff', 'staff.create_staff', 'POST'),
+        ('/staff/lote', 'staff.get_staffs_by_ids', 'POST'),
+        ('/staff/<int:id>', 'staff.get_staff', 'GET'),
+        ('/staff/<int:id>', 'staff.update_staff', 'PUT'),
+        ('/staff/<int:id>', 'staff.delete_staff', 'DELETE'),
+        ('/staff/<string:nombre>', 'staff.get_staff_by_staff', 'GET'),
+    }
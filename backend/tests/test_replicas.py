@@ -0,0 +1,43 @@
+"""
+Enrutamiento de lecturas a las réplicas (app.utils.replicas): qué solicitudes
+se sirven desde una réplica y cuáles marcan la ventana de lectura de las
+propias escrituras.
+"""
+import pytest
+from flask import Flask, g, jsonify
+from app.utils.replicas import registrar_replicas, COOKIE_ESCRITURA
+
+class SesionLocal:
+    # Solo se usa remove() al terminar cada solicitud
+    def remove(self):
+        pass
+
+@pytest.fixture
+def cliente():
+    app = Flask(__name__)
+    registrar_replicas(app, SesionLocal(), ['replica'])
+
+    def vista():
+        return jsonify({'replica': g.replica})
+
+    app.add_url_rule('/items', 'get_items', vista, methods=['GET'])
+    app.add_url_rule('/items/lote', 'get_items_by_ids', vista, methods=['POST'])
+    app.add_url_rule('/items', 'create_item', vista, methods=['POST'])
+    return app.test_client()
+
+def test_listado_desde_la_replica(cliente):
+    respuesta = cliente.get('/items')
+    assert respuesta.get_json()['replica'] == 'replica'
+    assert COOKIE_ESCRITURA not in respuesta.headers.get('Set-Cookie', '')
+
+def test_consulta_por_ids_es_lectura(cliente):
+    respuesta = cliente.post('/items/lote', json={'ids': [1, 2]})
+    assert respuesta.get_json()['replica'] == 'replica'
+    assert COOKIE_ESCRITURA not in respuesta.headers.get('Set-Cookie', '')
+
+def test_escritura_usa_el_primario_y_marca_la_ventana(cliente):
+    respuesta = cliente.post('/items', json={})
+    assert respuesta.get_json()['replica'] is None
+    assert COOKIE_ESCRITURA in respuesta.headers.get('Set-Cookie', '')
+    # Las lecturas siguientes del mismo cliente van al primario
+    assert cliente.get('/items').get_json()['replica'] is None
@@ -0,0 +1,149 @@
+"""
+Equivalencia de los serializadores compilados (app.utils.serializadores) con
+`schema.dump` de Marshmallow, para cada esquema de los modelos: completo,
+con cada subconjunto de campos (?fields=) y con cada expansión (?expand=).
+"""
+import importlib
+import itertools
+import os
+import pkgutil
+import pytest
+from marshmallow import Schema, fields, post_dump
+from sqlalchemy import Integer, String, inspect
+from app.configs.database import Base
+from app.utils.serializadores import compilar_serializador, relaciones_expandibles
+
+DIRECTORIO_MODELOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app', 'models')
+
+def _modelos():
+    # Modelos con esquema: por convención <Modelo>Schema en el mismo módulo
+    for modulo in pkgutil.iter_modules([DIRECTORIO_MODELOS]):
+        importlib.import_module('app.models.' + modulo.name)
+    return sorted((mapper.class_ for mapper in Base.registry.mappers
+                   if hasattr(importlib.import_module(mapper.class_.__module__), mapper.class_.__name__ + 'Schema')),
+                  key=lambda modelo: modelo.__name__)
+
+MODELOS = _modelos()
+
+def _schema(modelo):
+    return getattr(importlib.import_module(modelo.__module__), modelo.__name__ + 'Schema')
+
+def _objeto(modelo, semilla=1):
+    # Objeto transitorio con todas las columnas y las relaciones muchos-a-uno cargadas
+    objeto = inspect(modelo).class_manager.new_instance()
+    for indice, columna in enumerate(inspect(modelo).columns):
+        if isinstance(columna.type, Integer):
+            valor = semilla * 100 + indice
+        elif isinstance(columna.type, String):
+            valor = 'Núñez {} {}'.format(columna.key, semilla)[:columna.type.length]
+        else:
+            valor = None
+        setattr(objeto, columna.key, valor)
+    for nombre, destino in relaciones_expandibles(modelo).items():
+        setattr(objeto, nombre, _objeto(destino, semilla + 1))
+    return objeto
+
+def _caminos(modelo, prefijo=()):
+    # Todos los caminos de relaciones expandibles: (localidad,), (localidad, provincia), ...
+    caminos = []
+    for nombre, destino in relaciones_expandibles(modelo).items():
+        camino = prefijo + (nombre,)
+        caminos.append(camino)
+        caminos.extend(_caminos(destino, camino))
+    return caminos
+
+def _arbol(caminos):
+    arbol = {}
+    for camino in caminos:
+        nodo = arbol
+        for nombre in camino:
+            nodo = nodo.setdefault(nombre, {})
+    return arbol
+
+def _esperado(modelo, schema, objeto, arbol):
+    # Salida de referencia: dump de Marshmallow y cada relación con el esquema de su modelo
+    registro = schema.dump(objeto)
+    for nombre, hijas in arbol.items():
+        destino = relaciones_expandibles(modelo)[nombre]
+        relacionado = getattr(objeto, nombre)
+        registro[nombre] = None if relacionado is None else _esperado(destino, _schema(destino)(), relacionado, hijas)
+    return registro
+
+def _subconjuntos(claves):
+    for cantidad in range(1, len(claves) + 1):
+        yield from itertools.combinations(claves, cantidad)
+
+@pytest.mark.parametrize('modelo', MODELOS, ids=lambda modelo: modelo.__name__)
+def test_completo(modelo):
+    schema = _schema(modelo)()
+    serializador = compilar_serializador(schema, modelo)
+    objetos = [_objeto(modelo, semilla) for semilla in (1, 2, 3)]
+    assert serializador(objetos[0]) == schema.dump(objetos[0])
+    assert serializador.lista(objetos) == schema.dump(objetos, many=True)
+
+@pytest.mark.parametrize('modelo', MODELOS, ids=lambda modelo: modelo.__name__)
+def test_campos(modelo):
+    serializador = compilar_serializador(_schema(modelo)(), modelo)
+    objeto = _objeto(modelo)
+    for claves in _subconjuntos(serializador.claves):
+        parcial = serializador.parcial(list(claves))
+        esperado = _schema(modelo)(only=claves).dump(objeto)
+        assert parcial(objeto) == esperado, claves
+        assert parcial.lista([objeto]) == [esperado], claves
+        # Recortar un registro completo (caché de catálogos) da lo mismo
+        assert parcial.recortar(serializador(objeto)) == esperado, claves
+
+@pytest.mark.parametrize('modelo', [modelo for modelo in MODELOS if relaciones_expandibles(modelo)],
+                         ids=lambda modelo: modelo.__name__)
+def test_expansiones(modelo):
+    serializador = compilar_serializador(_schema(modelo)(), modelo)
+    caminos = _caminos(modelo)
+    variantes = [[camino] for camino in caminos] + [caminos]
+    objeto = _objeto(modelo)
+    for variante in variantes:
+        arbol = _arbol(variante)
+        # Sobre el esquema completo y sobre un subconjunto de campos
+        for claves in (serializador.claves, serializador.claves[:1]):
+            expandido = serializador.parcial(list(claves)).expandido(arbol)
+            esperado = _esperado(modelo, _schema(modelo)(only=claves), objeto, arbol)
+            assert expandido(objeto) == esperado, (claves, variante)
+            assert expandido.lista([objeto]) == [esperado], (claves, variante)
+
+@pytest.mark.parametrize('modelo', [modelo for modelo in MODELOS if relaciones_expandibles(modelo)],
+                         ids=lambda modelo: modelo.__name__)
+def test_expansion_sin_relacionado(modelo):
+    serializador = compilar_serializador(_schema(modelo)(), modelo)
+    objeto = _objeto(modelo)
+    arbol = _arbol(_caminos(modelo))
+    for nombre in arbol:
+        setattr(objeto, nombre, None)
+    assert serializador.expandido(arbol)(objeto) == _esperado(modelo, _schema(modelo)(), objeto, arbol)
+
+def test_campos_no_directos():
+    # Campos que no copian una columna tal cual: se serializan con Marshmallow
+    class PruebaSchema(Schema):
+        # Columna entera con un campo de texto: el valor cambia de tipo
+        id_provincia = fields.Str()
+        nombre = fields.Str(attribute='provincia', data_key='name')
+        largo = fields.Method('calcular_largo')
+
+        def calcular_largo(self, objeto):
+            return len(objeto.provincia)
+
+    class ConPostDumpSchema(PruebaSchema):
+        @post_dump
+        def mayusculas(self, data, **kwargs):
+            if 'name' in data:
+                data['name'] = data['name'].upper()
+            return data
+
+    modelo = next(modelo for modelo in MODELOS if modelo.__name__ == 'Provincia')
+    objeto = _objeto(modelo)
+    for clase in (PruebaSchema, ConPostDumpSchema):
+        schema = clase()
+        serializador = compilar_serializador(schema, modelo)
+        assert serializador(objeto) == schema.dump(objeto)
+        assert serializador.lista([objeto, objeto]) == schema.dump([objeto, objeto], many=True)
+        for claves in _subconjuntos(serializador.claves):
+            nombres = [serializador.campos[clave][0] for clave in claves]
+            assert serializador.parcial(list(claves))(objeto) == clase(only=nombres).dump(objeto), claves
@@ -0,0 +1,59 @@
+"""
+Listados transmitidos con ?stream=1 (app.utils.streaming): el cuerpo es
+siempre un JSON válido, aunque la consulta falle.
+"""
+import json
+import pytest
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from app.models.provincia import Provincia, ProvinciaSchema
+from app.utils import streaming
+from app.utils.serializadores import compilar_serializador
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config['STREAMING_YIELD_PER'] = 2
+    return app
+
+def _cuerpo(app):
+    serializador = compilar_serializador(ProvinciaSchema(), Provincia)
+    with app.test_request_context('/provincias?stream=1'):
+        respuesta = streaming.respuesta_streaming(Provincia, Provincia.id_provincia, serializador)
+        return respuesta.status_code, ''.join(respuesta.response)
+
+class SesionQueFalla:
+    # Sesión cuya consulta falla al ejecutarse, antes de devolver la primera fila
+    def __init__(self, **kwargs):
+        pass
+
+    def query(self, *args, **kwargs):
+        return self
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def yield_per(self, cantidad):
+        return self
+
+    def __iter__(self):
+        raise OperationalError('SELECT ...', {}, Exception('no hay conexión'))
+
+    def close(self):
+        pass
+
+def test_error_antes_de_la_primera_fila(app, monkeypatch):
+    monkeypatch.setattr(streaming.SessionLocal, 'session_factory', SesionQueFalla)
+    codigo, cuerpo = _cuerpo(app)
+    datos = json.loads(cuerpo)
+    assert codigo == 200
+    assert datos['status'] == 'error'
+    assert datos['data'] == []
+    assert datos['count'] == 0
+    assert 'no hay conexión' in datos['message']
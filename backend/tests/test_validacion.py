@@ -0,0 +1,12 @@
+"""
+Normalización de las claves foráneas recibidas (app.utils.validacion.entero).
+"""
+import pytest
+from app.utils.validacion import entero
+
+@pytest.mark.parametrize('valor, esperado', [
+    (3, 3), (3.0, 3), ('3', 3), (' 12 ', 12), ('-1', -1),
+    (3.7, None), ('3.7', None), (True, None), (False, None), (None, None), ('', None), ('tres', None), ([3], None),
+])
+def test_entero(valor, esperado):
+    assert entero(valor) == esperado
@@ -0,0 +1,9 @@
+# Punto de entrada WSGI para producción.
+#
+# Uso (desde backend/):
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#
+# El modo debug queda apagado salvo REQUIEM_DEBUG=1 (ver Config.DEBUG).
+from app import init_app
+
+app = init_app()